@@ -3,6 +3,10 @@ pragma solidity ^0.4.9;
 contract MultiSigWallet {
 
     uint constant public MAX_OWNER_COUNT = 50;
+    /// @dev Every owner ever added gets its own bit in confirmation masks, bits are never reused
+    /// so that confirmations of executed transactions stay with the owners who gave them.
+    /// Adding a 257th distinct owner over the lifetime of the wallet fails.
+    uint constant public MAX_OWNER_SLOTS = 256;
 
     event Confirmation(address indexed sender, uint indexed transactionId);
     event Revocation(address indexed sender, uint indexed transactionId);
@@ -15,11 +19,24 @@ contract MultiSigWallet {
     event RequirementChange(uint required);
 
     mapping (uint => Transaction) public transactions;
-    mapping (uint => mapping (address => bool)) public confirmations;
+    /// @dev Bit `ownerSlots[owner]` is set if the owner confirmed the transaction.
+    mapping (uint => uint) public confirmationMasks;
     mapping (address => bool) public isOwner;
+    /// @dev 1-based bit positions of owners in confirmation masks (0 if the address never was an owner).
+    mapping (address => uint) public ownerSlots;
+    mapping (uint => address) slotOwners;
+    /// @dev Bits of the current owners.
+    uint public ownersMask;
+    uint public ownerSlotCount;
     address[] public owners;
     uint public required;
     uint public transactionCount;
+    /// @dev Not executed transactions, as a list in ascending order linked by `transactionId + 1` (0 ends the list).
+    uint pendingTransactionCount;
+    uint firstPendingLink;
+    uint lastPendingLink;
+    mapping (uint => uint) nextPendingLinks;
+    mapping (uint => uint) previousPendingLinks;
 
     struct Transaction {
         address destination;
@@ -53,13 +70,13 @@ contract MultiSigWallet {
     }
 
     modifier confirmed(uint transactionId, address owner) {
-        if (!confirmations[transactionId][owner])
+        if (!confirmations(transactionId, owner))
             throw;
         _;
     }
 
     modifier notConfirmed(uint transactionId, address owner) {
-        if (confirmations[transactionId][owner])
+        if (confirmations(transactionId, owner))
             throw;
         _;
     }
@@ -107,12 +124,14 @@ contract MultiSigWallet {
             if (isOwner[_owners[i]] || _owners[i] == 0)
                 throw;
             isOwner[_owners[i]] = true;
+            addOwnerSlot(_owners[i]);
         }
         owners = _owners;
         required = _required;
     }
 
     /// @dev Allows to add a new owner. Transaction has to be sent by wallet.
+    /// Fails once MAX_OWNER_SLOTS distinct owners have been added, a removed owner added again keeps its slot.
     /// @param owner Address of new owner.
     function addOwner(address owner)
         public
@@ -122,6 +141,7 @@ contract MultiSigWallet {
         validRequirement(owners.length + 1, required)
     {
         isOwner[owner] = true;
+        addOwnerSlot(owner);
         owners.push(owner);
         OwnerAddition(owner);
     }
@@ -134,6 +154,7 @@ contract MultiSigWallet {
         ownerExists(owner)
     {
         isOwner[owner] = false;
+        ownersMask &= ~ownerBit(owner);
         for (uint i=0; i<owners.length - 1; i++)
             if (owners[i] == owner) {
                 owners[i] = owners[owners.length - 1];
@@ -146,6 +167,7 @@ contract MultiSigWallet {
     }
 
     /// @dev Allows to replace an owner with a new owner. Transaction has to be sent by wallet.
+    /// Fails once MAX_OWNER_SLOTS distinct owners have been added, a removed owner added again keeps its slot.
     /// @param owner Address of owner to be replaced.
     /// @param owner Address of new owner.
     function replaceOwner(address owner, address newOwner)
@@ -160,7 +182,9 @@ contract MultiSigWallet {
                 break;
             }
         isOwner[owner] = false;
+        ownersMask &= ~ownerBit(owner);
         isOwner[newOwner] = true;
+        addOwnerSlot(newOwner);
         OwnerRemoval(owner);
         OwnerAddition(newOwner);
     }
@@ -197,7 +221,7 @@ contract MultiSigWallet {
         transactionExists(transactionId)
         notConfirmed(transactionId, msg.sender)
     {
-        confirmations[transactionId][msg.sender] = true;
+        confirmationMasks[transactionId] |= ownerBit(msg.sender);
         Confirmation(msg.sender, transactionId);
         executeTransaction(transactionId);
     }
@@ -210,7 +234,7 @@ contract MultiSigWallet {
         confirmed(transactionId, msg.sender)
         notExecuted(transactionId)
     {
-        confirmations[transactionId][msg.sender] = false;
+        confirmationMasks[transactionId] &= ~ownerBit(msg.sender);
         Revocation(msg.sender, transactionId);
     }
 
@@ -223,9 +247,10 @@ contract MultiSigWallet {
         if (isConfirmed(transactionId)) {
             Transaction tx = transactions[transactionId];
             tx.executed = true;
-            if (tx.destination.call.value(tx.value)(tx.data))
+            if (tx.destination.call.value(tx.value)(tx.data)) {
+                removePendingTransaction(transactionId);
                 Execution(transactionId);
-            else {
+            } else {
                 ExecutionFailure(transactionId);
                 tx.executed = false;
             }
@@ -240,13 +265,19 @@ contract MultiSigWallet {
         constant
         returns (bool)
     {
-        uint count = 0;
-        for (uint i=0; i<owners.length; i++) {
-            if (confirmations[transactionId][owners[i]])
-                count += 1;
-            if (count == required)
-                return true;
-        }
+        return getConfirmationCount(transactionId) >= required;
+    }
+
+    /// @dev Returns the confirmation of a transaction by an owner.
+    /// @param transactionId Transaction ID.
+    /// @param owner Address of the owner.
+    /// @return Confirmation status.
+    function confirmations(uint transactionId, address owner)
+        public
+        constant
+        returns (bool)
+    {
+        return confirmationMasks[transactionId] & ownerBit(owner) != 0;
     }
 
     /*
@@ -270,9 +301,67 @@ contract MultiSigWallet {
             executed: false
         });
         transactionCount += 1;
+        // IDs only grow, so appending keeps the pending list in ascending order
+        uint link = transactionId + 1;
+        if (lastPendingLink == 0)
+            firstPendingLink = link;
+        else
+            nextPendingLinks[lastPendingLink] = link;
+        previousPendingLinks[link] = lastPendingLink;
+        lastPendingLink = link;
+        pendingTransactionCount += 1;
         Submission(transactionId);
     }
 
+    /// @dev Unlinks an executed transaction from the pending list.
+    /// @param transactionId Transaction ID.
+    function removePendingTransaction(uint transactionId)
+        internal
+    {
+        uint link = transactionId + 1;
+        uint previous = previousPendingLinks[link];
+        uint next = nextPendingLinks[link];
+        if (previous == 0)
+            firstPendingLink = next;
+        else
+            nextPendingLinks[previous] = next;
+        if (next == 0)
+            lastPendingLink = previous;
+        else
+            previousPendingLinks[next] = previous;
+        delete previousPendingLinks[link];
+        delete nextPendingLinks[link];
+        pendingTransactionCount -= 1;
+    }
+
+    /// @dev Gives a new owner the next bit in confirmation masks.
+    /// @param owner Address of the new owner.
+    function addOwnerSlot(address owner)
+        internal
+    {
+        if (ownerSlots[owner] == 0) {
+            if (ownerSlotCount == MAX_OWNER_SLOTS)
+                throw;
+            ownerSlotCount += 1;
+            ownerSlots[owner] = ownerSlotCount;
+            slotOwners[ownerSlotCount] = owner;
+        }
+        ownersMask |= ownerBit(owner);
+    }
+
+    /// @dev Returns the bit of an owner in confirmation masks (0 if the address never was an owner).
+    /// @param owner Address of the owner.
+    function ownerBit(address owner)
+        internal
+        constant
+        returns (uint)
+    {
+        uint slot = ownerSlots[owner];
+        if (slot == 0)
+            return 0;
+        return uint(1) << (slot - 1);
+    }
+
     /*
      * Web3 call functions
      */
@@ -284,9 +373,12 @@ contract MultiSigWallet {
         constant
         returns (uint count)
     {
-        for (uint i=0; i<owners.length; i++)
-            if (confirmations[transactionId][owners[i]])
-                count += 1;
+        uint mask = confirmationMasks[transactionId] & ownersMask;
+        // popcount, one iteration per set bit
+        while (mask != 0) {
+            mask &= mask - 1;
+            count += 1;
+        }
     }
 
     /// @dev Returns total number of transactions after filers are applied.
@@ -298,10 +390,10 @@ contract MultiSigWallet {
         constant
         returns (uint count)
     {
-        for (uint i=0; i<transactionCount; i++)
-            if (   pending && !transactions[i].executed
-                || executed && transactions[i].executed)
-                count += 1;
+        if (pending)
+            count += pendingTransactionCount;
+        if (executed)
+            count += transactionCount - pendingTransactionCount;
     }
 
     /// @dev Returns list of owners.
@@ -322,17 +414,26 @@ contract MultiSigWallet {
         constant
         returns (address[] _confirmations)
     {
-        address[] memory confirmationsTemp = new address[](owners.length);
+        uint mask = confirmationMasks[transactionId] & ownersMask;
+        _confirmations = new address[](getConfirmationCount(transactionId));
         uint count = 0;
-        uint i;
-        for (i=0; i<owners.length; i++)
-            if (confirmations[transactionId][owners[i]]) {
-                confirmationsTemp[count] = owners[i];
+        for (uint slot=1; mask != 0; slot++) {
+            if (mask & 1 != 0) {
+                _confirmations[count] = slotOwners[slot];
                 count += 1;
             }
-        _confirmations = new address[](count);
-        for (i=0; i<count; i++)
-            _confirmations[i] = confirmationsTemp[i];
+            mask >>= 1;
+        }
+    }
+
+    /// @dev Returns IDs of all pending transactions.
+    /// @return Returns array of transaction IDs in ascending order.
+    function getPendingTransactionIds()
+        public
+        constant
+        returns (uint[])
+    {
+        return pendingTransactionIds(0, pendingTransactionCount);
     }
 
     /// @dev Returns list of transaction IDs in defined range.
@@ -346,9 +447,21 @@ contract MultiSigWallet {
         constant
         returns (uint[] _transactionIds)
     {
+        uint i;
+        if (pending && executed) {
+            if (to > transactionCount)
+                throw;
+            _transactionIds = new uint[](to - from);
+            for (i=from; i<to; i++)
+                _transactionIds[i - from] = i;
+            return;
+        }
+        if (pending) {
+            _transactionIds = pendingTransactionIds(from, to);
+            return;
+        }
         uint[] memory transactionIdsTemp = new uint[](transactionCount);
         uint count = 0;
-        uint i;
         for (i=0; i<transactionCount; i++)
             if (   pending && !transactions[i].executed
                 || executed && transactions[i].executed)
@@ -360,4 +473,24 @@ contract MultiSigWallet {
         for (i=from; i<to; i++)
             _transactionIds[i - from] = transactionIdsTemp[i];
     }
+
+    /// @dev Returns pending transaction IDs in ascending order in defined range.
+    /// @param from Index start position of the pending transactions.
+    /// @param to Index end position of the pending transactions.
+    /// @return Returns array of transaction IDs.
+    function pendingTransactionIds(uint from, uint to)
+        internal
+        constant
+        returns (uint[] _transactionIds)
+    {
+        if (to > pendingTransactionCount)
+            throw;
+        _transactionIds = new uint[](to - from);
+        uint link = firstPendingLink;
+        for (uint i=0; i<to; i++) {
+            if (i >= from)
+                _transactionIds[i - from] = link - 1;
+            link = nextPendingLinks[link];
+        }
+    }
 }
\ No newline at end of file
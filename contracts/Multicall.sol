@@ -0,0 +1,99 @@
+//SPDX-License-Identifier: MIT
+pragma solidity =0.6.6;
+pragma experimental ABIEncoderV2;
+
+/// Reads the same per-account value of a contract for many accounts in one call
+/// @dev Used by off-chain tooling (e.g. holder snapshots), never called by other contracts
+contract Multicall {
+    /// Calls `selector(account)` on the target for every account
+    /// @param target The contract to read from
+    /// @param selector Selector of a view that takes an address and returns uint256 (e.g. `balanceOf(address)`)
+    /// @param accounts Accounts to read
+    /// @return values The value for each account
+    function balancesOf(
+        address target,
+        bytes4 selector,
+        address[] calldata accounts
+    ) external view returns (uint256[] memory values) {
+        values = new uint256[](accounts.length);
+        for (uint256 i = 0; i < accounts.length; i++) {
+            values[i] = _call(
+                target,
+                abi.encodeWithSelector(selector, accounts[i])
+            );
+        }
+    }
+
+    /// Calls `selector(account, arg)` on the target for every account
+    /// @param target The contract to read from
+    /// @param selector Selector of a view that takes an address and uint256 and returns uint256 (e.g. `balanceOfAt(address,uint256)`)
+    /// @param accounts Accounts to read
+    /// @param arg The second argument passed with every account (e.g. a block number)
+    /// @return values The value for each account
+    function balancesOfAt(
+        address target,
+        bytes4 selector,
+        address[] calldata accounts,
+        uint256 arg
+    ) external view returns (uint256[] memory values) {
+        values = new uint256[](accounts.length);
+        for (uint256 i = 0; i < accounts.length; i++) {
+            values[i] = _call(
+                target,
+                abi.encodeWithSelector(selector, accounts[i], arg)
+            );
+        }
+    }
+
+    /// Calls the target with every calldata
+    /// @param target The contract to read from
+    /// @param data Encoded calls of views that return uint256 (or a struct starting with uint256)
+    /// @return values The value for each call
+    function valuesOf(address target, bytes[] calldata data)
+        external
+        view
+        returns (uint256[] memory values)
+    {
+        values = new uint256[](data.length);
+        for (uint256 i = 0; i < data.length; i++) {
+            values[i] = _call(target, data[i]);
+        }
+    }
+
+    /// Makes calls to many contracts, a failed call doesn't fail the others
+    /// @param targets The contract to call for every calldata
+    /// @param data Encoded calls of views
+    /// @return blockNumber The block the values are read at
+    /// @return successes False for the calls that failed
+    /// @return results Returned data of every call
+    function aggregate(address[] calldata targets, bytes[] calldata data)
+        external
+        view
+        returns (
+            uint256 blockNumber,
+            bool[] memory successes,
+            bytes[] memory results
+        )
+    {
+        require(
+            targets.length == data.length,
+            "Multicall: targets and data lengths are different"
+        );
+        blockNumber = block.number;
+        successes = new bool[](data.length);
+        results = new bytes[](data.length);
+        for (uint256 i = 0; i < data.length; i++) {
+            (successes[i], results[i]) = targets[i].staticcall(data[i]);
+        }
+    }
+
+    function _call(address target, bytes memory data)
+        internal
+        view
+        returns (uint256)
+    {
+        (bool success, bytes memory result) = target.staticcall(data);
+        require(success && result.length >= 32, "Multicall: call failed");
+        return abi.decode(result, (uint256));
+    }
+}
@@ -0,0 +1,252 @@
+//SPDX-License-Identifier: MIT
+pragma solidity =0.6.6;
+
+import "@openzeppelin/contracts/math/Math.sol";
+import "@openzeppelin/contracts/utils/ReentrancyGuard.sol";
+import "@uniswap/v2-core/contracts/interfaces/IUniswapV2Pair.sol";
+import "@uniswap/lib/contracts/libraries/FixedPoint.sol";
+import "@uniswap/v2-periphery/contracts/libraries/UniswapV2OracleLibrary.sol";
+
+import "./time/Timeboundable.sol";
+import "./access/Operatable.sol";
+import "./libraries/AddressList.sol";
+import "./libraries/UniswapLibrary.sol";
+import "./interfaces/IOracleHub.sol";
+
+/// Fixed window oracle for many Uniswap pairs, the same as `Oracle` but with one contract
+/// and one update transaction per period for all pairs
+/// @title OracleHub
+/// @dev note that the price average is only guaranteed to be over at least 1 period, but may be over a longer period
+contract OracleHub is Operatable, Timeboundable, IOracleHub, ReentrancyGuard {
+    using FixedPoint for *;
+
+    struct PairData {
+        address token0;
+        uint32 blockTimestampLast;
+        // last time the average was updated (or the pair was added)
+        uint64 lastUpdated;
+        address token1;
+        uint256 price0CumulativeLast;
+        uint256 price1CumulativeLast;
+        // uq112x112 encoded average prices
+        uint224 price0Average;
+        uint224 price1Average;
+    }
+
+    /// Uniswap factory address
+    address public immutable uniswapFactory;
+    /// Minimal time between updates of a pair in secs
+    uint256 public immutable debouncePeriod;
+    /// Last time any pair was updated (block timestamp)
+    uint256 public lastCalled;
+
+    /// Price data (key is pair address)
+    mapping(address => PairData) public pairData;
+    /// Registered pairs
+    address[] public pairs;
+    /// 1-based positions in `pairs` (0 if not registered)
+    mapping(address => uint256) pairPositions;
+
+    /// Creates an OracleHub
+    /// @param _uniswapFactory UniswapV2 factory address.
+    /// @param _period Price average period in seconds.
+    /// @param _start Start (block timestamp).
+    constructor(
+        address _uniswapFactory,
+        uint256 _period,
+        uint256 _start
+    ) public Timeboundable(_start, 0) {
+        uniswapFactory = _uniswapFactory;
+        debouncePeriod = _period;
+    }
+
+    // ------- View ----------
+
+    /// All registered pairs
+    /// @dev Removing a pair moves the last pair into its place
+    function allPairs() public view returns (address[] memory) {
+        return pairs;
+    }
+
+    /// Checks if the pair is registered in the hub
+    /// @param pair The address of the pair
+    function isRegistered(address pair) public view override returns (bool) {
+        return AddressList.contains(pairPositions, pair);
+    }
+
+    /// Checks if the pair can be updated
+    /// @param pair The address of the pair
+    function isDue(address pair) public view returns (bool) {
+        return
+            isRegistered(pair) &&
+            block.timestamp - pairData[pair].lastUpdated >= debouncePeriod;
+    }
+
+    /// Last time the pair was updated (or added)
+    /// @param pair The address of the pair
+    function lastUpdated(address pair) public view override returns (uint256) {
+        return pairData[pair].lastUpdated;
+    }
+
+    /// The earliest time the pair can be updated
+    /// @param pair The address of the pair
+    function nextUpdateTime(address pair)
+        public
+        view
+        override
+        returns (uint256)
+    {
+        return Math.max(lastUpdated(pair) + debouncePeriod, start);
+    }
+
+    /// Get the price of token in a pair.
+    /// @param pair The address of the pair
+    /// @param token The address of one of two tokens of the pair (the one to get the price for)
+    /// @param amountIn The amount of token to estimate
+    /// @return amountOut The amount of other token equivalent
+    /// @dev This will always return 0 before the pair has been updated for the first time.
+    function consult(
+        address pair,
+        address token,
+        uint256 amountIn
+    ) external view override inTimeBounds() returns (uint256 amountOut) {
+        PairData storage data = pairData[pair];
+        if (token == data.token0) {
+            amountOut = FixedPoint
+                .uq112x112(data.price0Average)
+                .mul(amountIn)
+                .decode144();
+        } else {
+            require(
+                token == data.token1 && token != address(0),
+                "OracleHub: Invalid token address"
+            );
+            amountOut = FixedPoint
+                .uq112x112(data.price1Average)
+                .mul(amountIn)
+                .decode144();
+        }
+    }
+
+    // ------- External ----------
+
+    /// Updates prices of all pairs that are due
+    /// @dev Fails if no pair is due
+    function updateAll()
+        external
+        override
+        inTimeBounds()
+        nonReentrant()
+    {
+        bool updated = false;
+        for (uint256 i = 0; i < pairs.length; i++) {
+            if (isDue(pairs[i])) {
+                _update(pairs[i]);
+                updated = true;
+            }
+        }
+        require(updated, "OracleHub: No pairs are due");
+        lastCalled = block.timestamp;
+    }
+
+    /// Updates price of one pair
+    /// @param pair The address of the pair
+    /// @dev Fails if the pair is not due
+    function update(address pair)
+        external
+        override
+        inTimeBounds()
+        nonReentrant()
+    {
+        require(isDue(pair), "OracleHub: Pair is not due");
+        _update(pair);
+        lastCalled = block.timestamp;
+    }
+
+    // ------- External, Operator ----------
+
+    /// Registers a pair
+    /// @param tokenA 1st token address.
+    /// @param tokenB 2nd token address.
+    /// @return pair The address of the pair
+    function addPair(address tokenA, address tokenB)
+        external
+        onlyOperator
+        returns (address pair)
+    {
+        pair = UniswapLibrary.pairFor(uniswapFactory, tokenA, tokenB);
+        require(
+            !isRegistered(pair),
+            "OracleHub: Pair is already registered"
+        );
+        IUniswapV2Pair _pair = IUniswapV2Pair(pair);
+        (uint112 reserve0, uint112 reserve1, uint32 blockTimestamp) =
+            _pair.getReserves();
+        require(
+            reserve0 != 0 && reserve1 != 0,
+            "OracleHub: No reserves in the uniswap pool"
+        ); // ensure that there's liquidity in the pair
+        PairData storage data = pairData[pair];
+        data.token0 = _pair.token0();
+        data.token1 = _pair.token1();
+        data.price0CumulativeLast = _pair.price0CumulativeLast(); // fetch the current accumulated price value (1 / 0)
+        data.price1CumulativeLast = _pair.price1CumulativeLast(); // fetch the current accumulated price value (0 / 1)
+        data.blockTimestampLast = blockTimestamp;
+        data.lastUpdated = uint64(block.timestamp);
+        AddressList.add(pairs, pairPositions, pair);
+        emit PairAdded(msg.sender, pair);
+    }
+
+    /// Unregisters a pair
+    /// @param pair The address of the pair
+    /// @dev Tokens that use the pair must be moved to another oracle first
+    function removePair(address pair) external onlyOperator {
+        require(
+            AddressList.remove(pairs, pairPositions, pair),
+            "OracleHub: Pair is not registered"
+        );
+        delete pairData[pair];
+        emit PairRemoved(msg.sender, pair);
+    }
+
+    // ------- Internal ----------
+
+    function _update(address pair) internal {
+        PairData storage data = pairData[pair];
+        (
+            uint256 price0Cumulative,
+            uint256 price1Cumulative,
+            uint32 blockTimestamp
+        ) = UniswapV2OracleLibrary.currentCumulativePrices(pair);
+        uint256 timeElapsed = block.timestamp - data.lastUpdated;
+        // overflow is desired, casting never truncates
+        // cumulative price is in (uq112x112 price * seconds) units so we simply wrap it after division by time elapsed
+        data.price0Average = uint224(
+            (price0Cumulative - data.price0CumulativeLast) / timeElapsed
+        );
+        data.price1Average = uint224(
+            (price1Cumulative - data.price1CumulativeLast) / timeElapsed
+        );
+        emit Updated(
+            pair,
+            data.price0CumulativeLast,
+            price0Cumulative,
+            data.price1CumulativeLast,
+            price1Cumulative
+        );
+        data.price0CumulativeLast = price0Cumulative;
+        data.price1CumulativeLast = price1Cumulative;
+        data.blockTimestampLast = blockTimestamp;
+        data.lastUpdated = uint64(block.timestamp);
+    }
+
+    event Updated(
+        address indexed pair,
+        uint256 price0CumulativeBefore,
+        uint256 price0CumulativeAfter,
+        uint256 price1CumulativeBefore,
+        uint256 price1CumulativeAfter
+    );
+    event PairAdded(address indexed operator, address pair);
+    event PairRemoved(address indexed operator, address pair);
+}
@@ -6,6 +6,7 @@ import "@uniswap/v2-periphery/contracts/interfaces/IUniswapV2Router02.sol";
 import "./access/Operatable.sol";
 import "./access/Migratable.sol";
 import "./interfaces/IVault.sol";
+import "./libraries/AddressList.sol";
 
 contract StabFund is Operatable, Migratable {
     address[] public allowedTokens;
@@ -13,6 +14,13 @@ contract StabFund is Operatable, Migratable {
     address[] public allowedVaults;
     address public router;
 
+    /// 1-based positions in `allowedTokens` (0 if not allowed)
+    mapping(address => uint256) allowedTokenPositions;
+    /// 1-based positions in `allowedTraders` (0 if not allowed)
+    mapping(address => uint256) allowedTraderPositions;
+    /// 1-based positions in `allowedVaults` (0 if not allowed)
+    mapping(address => uint256) allowedVaultPositions;
+
     /// Creates a new contract.
     /// @param _router an address of uniswap router V2 02
     /// @param _allowedTokens a list of allowed tokens for trade
@@ -23,8 +31,20 @@ contract StabFund is Operatable, Migratable {
         address[] memory _allowedTraders
     ) public {
         router = _router;
-        allowedTraders = _allowedTraders;
-        allowedTokens = _allowedTokens;
+        for (uint256 i = 0; i < _allowedTraders.length; i++) {
+            AddressList.add(
+                allowedTraders,
+                allowedTraderPositions,
+                _allowedTraders[i]
+            );
+        }
+        for (uint256 i = 0; i < _allowedTokens.length; i++) {
+            AddressList.add(
+                allowedTokens,
+                allowedTokenPositions,
+                _allowedTokens[i]
+            );
+        }
     }
 
     /// Returns a list of all tokens allowed for trade
@@ -45,34 +65,19 @@ contract StabFund is Operatable, Migratable {
     /// Checks if token is allowed for trade
     /// @param token token to check
     function isAllowedToken(address token) public view returns (bool) {
-        for (uint256 i = 0; i < allowedTokens.length; i++) {
-            if (allowedTokens[i] == token) {
-                return true;
-            }
-        }
-        return false;
+        return AddressList.contains(allowedTokenPositions, token);
     }
 
     /// Checks if trader is allowed to trade
     /// @param trader trader to check
     function isAllowedTrader(address trader) public view returns (bool) {
-        for (uint256 i = 0; i < allowedTraders.length; i++) {
-            if (allowedTraders[i] == trader) {
-                return true;
-            }
-        }
-        return false;
+        return AddressList.contains(allowedTraderPositions, trader);
     }
 
     /// Checks if vault is allowed
     /// @param vault vault to check
     function isAllowedVault(address vault) public view returns (bool) {
-        for (uint256 i = 0; i < allowedVaults.length; i++) {
-            if (allowedVaults[i] == vault) {
-                return true;
-            }
-        }
-        return false;
+        return AddressList.contains(allowedVaultPositions, vault);
     }
 
     /// Requires token to be allowed
@@ -178,21 +183,18 @@ contract StabFund is Operatable, Migratable {
     /// Adds trader to allowed traders
     /// @param trader address of the new trader
     function addTrader(address trader) public onlyOperator {
-        if (isAllowedTrader(trader)) {
-            return;
+        if (AddressList.add(allowedTraders, allowedTraderPositions, trader)) {
+            emit TraderAdded(msg.sender, trader);
         }
-        allowedTraders.push(trader);
-        emit TraderAdded(msg.sender, trader);
     }
 
     /// Deletes trader from allowed traders
     /// @param trader address of the deleted trader
     function deleteTrader(address trader) public onlyOperator {
-        for (uint256 i = 0; i < allowedTraders.length; i++) {
-            if (allowedTraders[i] == trader) {
-                delete allowedTraders[i];
-                emit TraderDeleted(msg.sender, trader);
-            }
+        if (
+            AddressList.remove(allowedTraders, allowedTraderPositions, trader)
+        ) {
+            emit TraderDeleted(msg.sender, trader);
         }
     }
 
@@ -201,42 +203,36 @@ contract StabFund is Operatable, Migratable {
     /// Adds token to allowed tokens
     /// @param token address of the new token
     function addToken(address token) public onlyOwner {
-        if (isAllowedToken(token)) {
-            return;
+        if (AddressList.add(allowedTokens, allowedTokenPositions, token)) {
+            emit TokenAdded(msg.sender, token);
         }
-        allowedTokens.push(token);
-        emit TokenAdded(msg.sender, token);
     }
 
     /// Deletes token from allowed tokens
     /// @param token address of the deleted token
     function deleteToken(address token) public onlyOwner {
-        for (uint256 i = 0; i < allowedTokens.length; i++) {
-            if (allowedTokens[i] == token) {
-                delete allowedTokens[i];
-                emit TokenDeleted(msg.sender, token);
-            }
+        if (
+            AddressList.remove(allowedTokens, allowedTokenPositions, token)
+        ) {
+            emit TokenDeleted(msg.sender, token);
         }
     }
 
     /// Adds vault to allowed vaults
     /// @param vault address of the new vault
     function addVault(address vault) public onlyOwner {
-        if (isAllowedVault(vault)) {
-            return;
+        if (AddressList.add(allowedVaults, allowedVaultPositions, vault)) {
+            emit VaultAdded(msg.sender, vault);
         }
-        allowedVaults.push(vault);
-        emit VaultAdded(msg.sender, vault);
     }
 
     /// Deletes vault from allowed vaults
     /// @param vault address of the deleted vault
     function deleteVault(address vault) public onlyOwner {
-        for (uint256 i = 0; i < allowedVaults.length; i++) {
-            if (allowedVaults[i] == vault) {
-                delete allowedVaults[i];
-                emit VaultDeleted(msg.sender, vault);
-            }
+        if (
+            AddressList.remove(allowedVaults, allowedVaultPositions, vault)
+        ) {
+            emit VaultDeleted(msg.sender, vault);
         }
     }
 
@@ -1,4 +1,5 @@
 pragma solidity ^0.6.0;
+pragma experimental ABIEncoderV2;
 
 /*
  * Copyright 2020 Compound Labs, Inc.
@@ -62,6 +63,31 @@ contract Timelock {
         uint256 eta
     );
 
+    event CancelTransactions(
+        bytes32 indexed txHash,
+        address[] targets,
+        uint256[] values,
+        string[] signatures,
+        bytes[] datas,
+        uint256 eta
+    );
+    event ExecuteTransactions(
+        bytes32 indexed txHash,
+        address[] targets,
+        uint256[] values,
+        string[] signatures,
+        bytes[] datas,
+        uint256 eta
+    );
+    event QueueTransactions(
+        bytes32 indexed txHash,
+        address[] targets,
+        uint256[] values,
+        string[] signatures,
+        bytes[] datas,
+        uint256 eta
+    );
+
     uint256 public constant GRACE_PERIOD = 14 days;
     uint256 public constant MINIMUM_DELAY = 0 days;
     uint256 public constant MAXIMUM_DELAY = 30 days;
@@ -199,20 +225,9 @@ contract Timelock {
 
         queuedTransactions[txHash] = false;
 
-        bytes memory callData;
-
-        if (bytes(signature).length == 0) {
-            callData = data;
-        } else {
-            callData = abi.encodePacked(
-                bytes4(keccak256(bytes(signature))),
-                data
-            );
-        }
-
         // solium-disable-next-line security/no-call-value
         (bool success, bytes memory returnData) =
-            target.call{value: value}(callData);
+            target.call{value: value}(getCallData(signature, data));
         require(
             success,
             'Timelock::executeTransaction: Transaction execution reverted.'
@@ -223,6 +238,139 @@ contract Timelock {
         return returnData;
     }
 
+    /// Queues a batch of calls that are executed together at the same eta
+    function queueTransactions(
+        address[] memory targets,
+        uint256[] memory values,
+        string[] memory signatures,
+        bytes[] memory datas,
+        uint256 eta
+    ) public returns (bytes32) {
+        require(
+            msg.sender == admin,
+            'Timelock::queueTransactions: Call must come from admin.'
+        );
+        require(
+            eta >= getBlockTimestamp().add(delay),
+            'Timelock::queueTransactions: Estimated execution block must satisfy delay.'
+        );
+        requireSameLengths(targets, values, signatures, datas);
+
+        bytes32 txHash =
+            keccak256(abi.encode(targets, values, signatures, datas, eta));
+        queuedTransactions[txHash] = true;
+
+        emit QueueTransactions(txHash, targets, values, signatures, datas, eta);
+        return txHash;
+    }
+
+    function cancelTransactions(
+        address[] memory targets,
+        uint256[] memory values,
+        string[] memory signatures,
+        bytes[] memory datas,
+        uint256 eta
+    ) public {
+        require(
+            msg.sender == admin,
+            'Timelock::cancelTransactions: Call must come from admin.'
+        );
+
+        bytes32 txHash =
+            keccak256(abi.encode(targets, values, signatures, datas, eta));
+        queuedTransactions[txHash] = false;
+
+        emit CancelTransactions(
+            txHash,
+            targets,
+            values,
+            signatures,
+            datas,
+            eta
+        );
+    }
+
+    /// Executes a queued batch, if any call reverts the whole batch reverts
+    function executeTransactions(
+        address[] memory targets,
+        uint256[] memory values,
+        string[] memory signatures,
+        bytes[] memory datas,
+        uint256 eta
+    ) public payable returns (bytes[] memory) {
+        require(
+            msg.sender == admin,
+            'Timelock::executeTransactions: Call must come from admin.'
+        );
+
+        bytes32 txHash =
+            keccak256(abi.encode(targets, values, signatures, datas, eta));
+        require(
+            queuedTransactions[txHash],
+            "Timelock::executeTransactions: Transaction hasn't been queued."
+        );
+        require(
+            getBlockTimestamp() >= eta,
+            "Timelock::executeTransactions: Transaction hasn't surpassed time lock."
+        );
+        require(
+            getBlockTimestamp() <= eta.add(GRACE_PERIOD),
+            'Timelock::executeTransactions: Transaction is stale.'
+        );
+
+        queuedTransactions[txHash] = false;
+
+        bytes[] memory returnDatas = new bytes[](targets.length);
+        for (uint256 i = 0; i < targets.length; i++) {
+            // solium-disable-next-line security/no-call-value
+            (bool success, bytes memory returnData) =
+                targets[i].call{value: values[i]}(
+                    getCallData(signatures[i], datas[i])
+                );
+            require(
+                success,
+                'Timelock::executeTransactions: Transaction execution reverted.'
+            );
+            returnDatas[i] = returnData;
+        }
+
+        emit ExecuteTransactions(
+            txHash,
+            targets,
+            values,
+            signatures,
+            datas,
+            eta
+        );
+
+        return returnDatas;
+    }
+
+    function getCallData(string memory signature, bytes memory data)
+        internal
+        pure
+        returns (bytes memory)
+    {
+        if (bytes(signature).length == 0) {
+            return data;
+        }
+        return abi.encodePacked(bytes4(keccak256(bytes(signature))), data);
+    }
+
+    function requireSameLengths(
+        address[] memory targets,
+        uint256[] memory values,
+        string[] memory signatures,
+        bytes[] memory datas
+    ) internal pure {
+        require(
+            targets.length == values.length &&
+                targets.length == signatures.length &&
+                targets.length == datas.length,
+            'Timelock::queueTransactions: Arrays must have the same length.'
+        );
+    }
+
     function getBlockTimestamp() internal view returns (uint256) {
         // solium-disable-next-line security/no-block-members
         return block.timestamp;
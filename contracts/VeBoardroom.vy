@@ -10,11 +10,18 @@ from vyper.interfaces import ERC20
 
 interface VotingEscrow:
     def user_point_epoch(addr: address) -> uint256: view
-    def epoch() -> uint256: view
     def user_point_history(addr: address, loc: uint256) -> Point: view
-    def point_history(loc: uint256) -> Point: view
+    def point_at(_timestamp: uint256) -> EpochPoint: view
+    def user_point_at(addr: address, _timestamp: uint256) -> EpochPoint: view
     def checkpoint(): nonpayable
 
+interface VeSupplyOracle:
+    def voting_escrow() -> address: view
+    def start_time() -> uint256: view
+    def time_cursor() -> uint256: view
+    def ve_supply(week: uint256) -> uint256: view
+    def checkpoint_total_supply(): nonpayable
+
 
 event CommitAdmin:
     admin: address
@@ -22,6 +29,10 @@ event CommitAdmin:
 event ApplyAdmin:
     admin: address
 
+event SetSupplyOracle:
+    oracle: address
+    since: uint256
+
 event ToggleAllowCheckpointToken:
     toggle_flag: bool
 
@@ -42,6 +53,13 @@ struct Point:
     ts: uint256
     blk: uint256  # block
 
+struct EpochPoint:
+    epoch: uint256
+    bias: int128
+    slope: int128
+    ts: uint256
+    blk: uint256
+
 
 WEEK: constant(uint256) = 7 * 86400
 TOKEN_CHECKPOINT_DEADLINE: constant(uint256) = 86400
@@ -61,7 +79,10 @@ tokens_len: public(uint256)
 total_received: public(uint256)
 token_last_balance: public(HashMap[address, uint256])
 
-ve_supply: public(uint256[1000000000000000])  # VE total supply at week bounds
+local_ve_supply: uint256[1000000000000000]  # VE total supply at week bounds
+# Weeks from `supply_oracle_since` on are read from the shared oracle
+supply_oracle: public(address)
+supply_oracle_since: public(uint256)
 
 admin: public(address)
 future_admin: public(address)
@@ -147,39 +168,6 @@ def checkpoint_token(token: address):
     self._checkpoint_token(token)
 
 
-@internal
-def _find_timestamp_epoch(ve: address, _timestamp: uint256) -> uint256:
-    _min: uint256 = 0
-    _max: uint256 = VotingEscrow(ve).epoch()
-    for i in range(128):
-        if _min >= _max:
-            break
-        _mid: uint256 = (_min + _max + 2) / 2
-        pt: Point = VotingEscrow(ve).point_history(_mid)
-        if pt.ts <= _timestamp:
-            _min = _mid
-        else:
-            _max = _mid - 1
-    return _min
-
-
-@view
-@internal
-def _find_timestamp_user_epoch(ve: address, user: address, _timestamp: uint256, max_user_epoch: uint256) -> uint256:
-    _min: uint256 = 0
-    _max: uint256 = max_user_epoch
-    for i in range(128):
-        if _min >= _max:
-            break
-        _mid: uint256 = (_min + _max + 2) / 2
-        pt: Point = VotingEscrow(ve).user_point_history(user, _mid)
-        if pt.ts <= _timestamp:
-            _min = _mid
-        else:
-            _max = _mid - 1
-    return _min
-
-
 @view
 @external
 def ve_for_at(_user: address, _timestamp: uint256) -> uint256:
@@ -189,15 +177,19 @@ def ve_for_at(_user: address, _timestamp: uint256) -> uint256:
     @param _timestamp Epoch time
     @return uint256 veCRV balance
     """
-    ve: address = self.voting_escrow
-    max_user_epoch: uint256 = VotingEscrow(ve).user_point_epoch(_user)
-    epoch: uint256 = self._find_timestamp_user_epoch(ve, _user, _timestamp, max_user_epoch)
-    pt: Point = VotingEscrow(ve).user_point_history(_user, epoch)
+    pt: EpochPoint = VotingEscrow(self.voting_escrow).user_point_at(_user, _timestamp)
     return convert(max(pt.bias - pt.slope * convert(_timestamp - pt.ts, int128), 0), uint256)
 
 
 @internal
 def _checkpoint_total_supply():
+    oracle: address = self.supply_oracle
+    if oracle != ZERO_ADDRESS:
+        if block.timestamp >= VeSupplyOracle(oracle).time_cursor():
+            VeSupplyOracle(oracle).checkpoint_total_supply()
+        self.time_cursor = VeSupplyOracle(oracle).time_cursor()
+        return
+
     ve: address = self.voting_escrow
     t: uint256 = self.time_cursor
     rounded_timestamp: uint256 = block.timestamp / WEEK * WEEK
@@ -207,19 +199,38 @@ def _checkpoint_total_supply():
         if t > rounded_timestamp:
             break
         else:
-            epoch: uint256 = self._find_timestamp_epoch(ve, t)
-            pt: Point = VotingEscrow(ve).point_history(epoch)
+            pt: EpochPoint = VotingEscrow(ve).point_at(t)
             dt: int128 = 0
             if t > pt.ts:
                 # If the point is at 0 epoch, it can actually be earlier than the first deposit
                 # Then make dt 0
                 dt = convert(t - pt.ts, int128)
-            self.ve_supply[t] = convert(max(pt.bias - pt.slope * dt, 0), uint256)
+            self.local_ve_supply[t] = convert(max(pt.bias - pt.slope * dt, 0), uint256)
         t += WEEK
 
     self.time_cursor = t
 
 
+@view
+@internal
+def _ve_supply(week: uint256) -> uint256:
+    oracle: address = self.supply_oracle
+    if oracle != ZERO_ADDRESS and week >= self.supply_oracle_since:
+        return VeSupplyOracle(oracle).ve_supply(week)
+    return self.local_ve_supply[week]
+
+
+@view
+@external
+def ve_supply(week: uint256) -> uint256:
+    """
+    @notice Get the veCRV total supply at the start of `week`
+    @param week Epoch time of the week start
+    @return uint256 veCRV total supply
+    """
+    return self._ve_supply(week)
+
+
 @external
 def checkpoint_total_supply():
     """
@@ -244,17 +255,22 @@ def _claim(token: address, addr: address, ve: address, _last_token_time: uint256
         # No lock = no fees
         return 0
 
+    user_point: Point = empty(Point)
     week_cursor: uint256 = self.time_cursor_of[token][addr]
     if week_cursor == 0:
-        # Need to do the initial binary search
-        user_epoch = self._find_timestamp_user_epoch(ve, addr, _start_time, max_user_epoch)
+        # Need to do the initial binary search, VotingEscrow returns the point as well
+        found: EpochPoint = VotingEscrow(ve).user_point_at(addr, _start_time)
+        user_epoch = found.epoch
+        user_point = Point({bias: found.bias, slope: found.slope, ts: found.ts, blk: found.blk})
     else:
         user_epoch = self.user_epoch_of[addr]
 
     if user_epoch == 0:
         user_epoch = 1
 
-    user_point: Point = VotingEscrow(ve).user_point_history(addr, user_epoch)
+    # Empty unless found above at a non-zero epoch
+    if user_point.ts == 0:
+        user_point = VotingEscrow(ve).user_point_history(addr, user_epoch)
 
     if week_cursor == 0:
         week_cursor = (user_point.ts + WEEK - 1) / WEEK * WEEK
@@ -287,7 +303,7 @@ def _claim(token: address, addr: address, ve: address, _last_token_time: uint256
             if balance_of == 0 and user_epoch > max_user_epoch:
                 break
             if balance_of > 0:
-                to_distribute += balance_of * self.tokens_per_week[token][week_cursor] / self.ve_supply[week_cursor]
+                to_distribute += balance_of * self.tokens_per_week[token][week_cursor] / self._ve_supply(week_cursor)
 
             week_cursor += WEEK
 
@@ -464,6 +480,26 @@ def apply_admin():
     log ApplyAdmin(future_admin)
 
 
+@external
+def set_supply_oracle(_oracle: address):
+    """
+    @notice Read weekly veCRV supply from a shared `VeSupplyOracle` instead
+            of checkpointing it in this contract
+    @dev Can only be set once. Weeks before the current `time_cursor` were
+         checkpointed here and are still read from this contract.
+    @param _oracle `VeSupplyOracle` of the same VotingEscrow
+    """
+    assert msg.sender == self.admin  # dev: access denied
+    assert self.supply_oracle == ZERO_ADDRESS  # dev: oracle already set
+    assert VeSupplyOracle(_oracle).voting_escrow() == self.voting_escrow  # dev: wrong voting escrow
+    since: uint256 = self.time_cursor
+    assert VeSupplyOracle(_oracle).start_time() <= since  # dev: oracle starts too late
+
+    self.supply_oracle = _oracle
+    self.supply_oracle_since = since
+    log SetSupplyOracle(_oracle, since)
+
+
 @external
 def toggle_allow_checkpoint_token():
     """
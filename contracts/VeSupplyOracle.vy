@@ -0,0 +1,75 @@
+# @version 0.2.11
+"""
+@title Weekly Voting Escrow Supply
+@author Klondike Finance, Curve Finance
+@license MIT
+@notice Total supply of VotingEscrow at week bounds, checkpointed once and
+        shared by any number of `VeBoardroom` distributors
+"""
+
+
+interface VotingEscrow:
+    def point_at(_timestamp: uint256) -> EpochPoint: view
+    def checkpoint(): nonpayable
+
+
+event CheckpointTotalSupply:
+    time_cursor: uint256
+
+
+struct EpochPoint:
+    epoch: uint256
+    bias: int128
+    slope: int128  # - dweight / dt
+    ts: uint256
+    blk: uint256  # block
+
+
+WEEK: constant(uint256) = 7 * 86400
+
+voting_escrow: public(address)
+start_time: public(uint256)
+time_cursor: public(uint256)
+ve_supply: public(uint256[1000000000000000])  # VE total supply at week bounds
+
+
+@external
+def __init__(_voting_escrow: address):
+    """
+    @notice Contract constructor
+    @param _voting_escrow VotingEscrow contract address
+    """
+    t: uint256 = block.timestamp / WEEK * WEEK
+    self.start_time = t
+    self.time_cursor = t
+    self.voting_escrow = _voting_escrow
+
+
+@external
+def checkpoint_total_supply():
+    """
+    @notice Update the veCRV total supply checkpoint
+    @dev The same as `VeBoardroom.checkpoint_total_supply`, called by the
+         distributors reading from this contract once a week. Fills at most
+         20 weeks per call.
+    """
+    ve: address = self.voting_escrow
+    t: uint256 = self.time_cursor
+    rounded_timestamp: uint256 = block.timestamp / WEEK * WEEK
+    VotingEscrow(ve).checkpoint()
+
+    for i in range(20):
+        if t > rounded_timestamp:
+            break
+        else:
+            pt: EpochPoint = VotingEscrow(ve).point_at(t)
+            dt: int128 = 0
+            if t > pt.ts:
+                # If the point is at 0 epoch, it can actually be earlier than the first deposit
+                # Then make dt 0
+                dt = convert(t - pt.ts, int128)
+            self.ve_supply[t] = convert(max(pt.bias - pt.slope * dt, 0), uint256)
+        t += WEEK
+
+    self.time_cursor = t
+    log CheckpointTotalSupply(t)
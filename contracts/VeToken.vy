@@ -35,6 +35,14 @@ struct LockedBalance:
     amount: int128
     end: uint256
 
+# A point of `point_history` or `user_point_history` with its epoch
+struct EpochPoint:
+    epoch: uint256
+    bias: int128
+    slope: int128
+    ts: uint256
+    blk: uint256
+
 
 interface ERC20:
     def decimals() -> uint256: view
@@ -84,6 +92,8 @@ event Supply:
 WEEK: constant(uint256) = 7 * 86400  # all future times are rounded by week
 MAXTIME: constant(uint256) = 4 * 365 * 86400  # 4 years
 MULTIPLIER: constant(uint256) = 10 ** 18
+MAX_BATCH: constant(uint256) = 100  # addresses per `balanceOfMany*` call
+MAX_LOCKS: constant(uint256) = 100  # locks per `create_locks_for` call
 
 token: public(address)
 supply: public(uint256)
@@ -438,6 +448,76 @@ def create_lock(_value: uint256, _unlock_time: uint256):
     self._deposit_for(msg.sender, _value, unlock_time, _locked, CREATE_LOCK_TYPE)
 
 
+@external
+@nonreentrant('lock')
+def create_locks_for(
+    _addrs: address[MAX_LOCKS],
+    _values: uint256[MAX_LOCKS],
+    _unlock_times: uint256[MAX_LOCKS]
+):
+    """
+    @notice Create locks for many users at once with tokens of the admin
+    @dev Used to migrate stakers of the legacy boardrooms. Every user gets the
+         same lock, point and slope change as with `create_lock`, but the
+         global point is checkpointed once per call rather than once per user.
+         The list ends at the first ZERO_ADDRESS.
+    @param _addrs Users' wallet addresses, none of them may have a lock
+    @param _values Amounts to deposit
+    @param _unlock_times Epoch times when tokens unlock, rounded down to whole weeks
+    """
+    assert msg.sender == self.admin  # dev: admin only
+
+    # Bring the global point to now, so every user adds to the same point
+    self._checkpoint(ZERO_ADDRESS, empty(LockedBalance), empty(LockedBalance))
+
+    total: uint256 = 0
+    d_bias: int128 = 0
+    d_slope: int128 = 0
+    for i in range(MAX_LOCKS):
+        addr: address = _addrs[i]
+        if addr == ZERO_ADDRESS:
+            break
+        value: uint256 = _values[i]
+        unlock_time: uint256 = (_unlock_times[i] / WEEK) * WEEK  # Locktime is rounded down to weeks
+
+        assert value > 0  # dev: need non-zero value
+        assert self.locked[addr].amount == 0, "Withdraw old tokens first"
+        assert unlock_time > block.timestamp, "Can only lock until time in the future"
+        assert unlock_time <= block.timestamp + MAXTIME, "Voting lock can be 4 years max"
+
+        _locked: LockedBalance = LockedBalance({amount: convert(value, int128), end: unlock_time})
+        self.locked[addr] = _locked
+
+        u_new: Point = empty(Point)
+        u_new.slope = _locked.amount / MAXTIME
+        u_new.bias = u_new.slope * convert(unlock_time - block.timestamp, int128)
+        u_new.ts = block.timestamp
+        u_new.blk = block.number
+        d_bias += u_new.bias
+        d_slope += u_new.slope
+        self.slope_changes[unlock_time] -= u_new.slope
+
+        user_epoch: uint256 = self.user_point_epoch[addr] + 1
+        self.user_point_epoch[addr] = user_epoch
+        self.user_point_history[addr][user_epoch] = u_new
+
+        total += value
+        log Deposit(addr, value, unlock_time, CREATE_LOCK_TYPE, block.timestamp)
+
+    _epoch: uint256 = self.epoch
+    last_point: Point = self.point_history[_epoch]
+    last_point.bias += d_bias
+    last_point.slope += d_slope
+    self.point_history[_epoch] = last_point
+
+    supply_before: uint256 = self.supply
+    self.supply = supply_before + total
+    if total != 0:
+        assert ERC20(self.token).transferFrom(msg.sender, self, total)
+
+    log Supply(supply_before, supply_before + total)
+
+
 @external
 @nonreentrant('lock')
 def increase_amount(_value: uint256):
@@ -531,6 +611,74 @@ def find_block_epoch(_block: uint256, max_epoch: uint256) -> uint256:
     return _min
 
 
+@internal
+@view
+def find_user_block_epoch(addr: address, _block: uint256, max_epoch: uint256) -> uint256:
+    """
+    @notice Binary search for the last point of `addr` at or before block `_block`
+    @param addr User wallet address
+    @param _block Block to find
+    @param max_epoch Don't go beyond this user epoch
+    @return User epoch of the point
+    """
+    _min: uint256 = 0
+    _max: uint256 = max_epoch
+    for i in range(128):  # Will be always enough for 128-bit numbers
+        if _min >= _max:
+            break
+        _mid: uint256 = (_min + _max + 1) / 2
+        if self.user_point_history[addr][_mid].blk <= _block:
+            _min = _mid
+        else:
+            _max = _mid - 1
+    return _min
+
+
+@internal
+@view
+def find_timestamp_epoch(_timestamp: uint256, max_epoch: uint256) -> uint256:
+    """
+    @notice Binary search for the last global point at or before `_timestamp`
+    @param _timestamp Epoch time to find
+    @param max_epoch Don't go beyond this epoch
+    @return Epoch of the point, 0 if all points are later
+    """
+    _min: uint256 = 0
+    _max: uint256 = max_epoch
+    for i in range(128):  # Will be always enough for 128-bit numbers
+        if _min >= _max:
+            break
+        _mid: uint256 = (_min + _max + 1) / 2
+        if self.point_history[_mid].ts <= _timestamp:
+            _min = _mid
+        else:
+            _max = _mid - 1
+    return _min
+
+
+@internal
+@view
+def find_user_timestamp_epoch(addr: address, _timestamp: uint256, max_epoch: uint256) -> uint256:
+    """
+    @notice Binary search for the last point of `addr` at or before `_timestamp`
+    @param addr User wallet address
+    @param _timestamp Epoch time to find
+    @param max_epoch Don't go beyond this user epoch
+    @return User epoch of the point, 0 if all points are later
+    """
+    _min: uint256 = 0
+    _max: uint256 = max_epoch
+    for i in range(128):  # Will be always enough for 128-bit numbers
+        if _min >= _max:
+            break
+        _mid: uint256 = (_min + _max + 1) / 2
+        if self.user_point_history[addr][_mid].ts <= _timestamp:
+            _min = _mid
+        else:
+            _max = _mid - 1
+    return _min
+
+
 @external
 @view
 def balanceOf(addr: address, _t: uint256 = block.timestamp) -> uint256:
@@ -552,34 +700,14 @@ def balanceOf(addr: address, _t: uint256 = block.timestamp) -> uint256:
         return convert(last_point.bias, uint256)
 
 
-@external
+@internal
 @view
-def balanceOfAt(addr: address, _block: uint256) -> uint256:
+def _block_time(_block: uint256) -> uint256:
     """
-    @notice Measure voting power of `addr` at block height `_block`
-    @dev Adheres to MiniMe `balanceOfAt` interface: https://github.com/Giveth/minime
-    @param addr User's wallet address
-    @param _block Block to calculate the voting power at
-    @return Voting power
+    @notice Estimate the timestamp of a past block from the global points
+    @param _block Block to estimate the timestamp for
+    @return Approximate timestamp of the block
     """
-    # Copying and pasting totalSupply code because Vyper cannot pass by
-    # reference yet
-    assert _block <= block.number
-
-    # Binary search
-    _min: uint256 = 0
-    _max: uint256 = self.user_point_epoch[addr]
-    for i in range(128):  # Will be always enough for 128-bit numbers
-        if _min >= _max:
-            break
-        _mid: uint256 = (_min + _max + 1) / 2
-        if self.user_point_history[addr][_mid].blk <= _block:
-            _min = _mid
-        else:
-            _max = _mid - 1
-
-    upoint: Point = self.user_point_history[addr][_min]
-
     max_epoch: uint256 = self.epoch
     _epoch: uint256 = self.find_block_epoch(_block, max_epoch)
     point_0: Point = self.point_history[_epoch]
@@ -595,7 +723,21 @@ def balanceOfAt(addr: address, _block: uint256) -> uint256:
     block_time: uint256 = point_0.ts
     if d_block != 0:
         block_time += d_t * (_block - point_0.blk) / d_block
+    return block_time
 
+
+@internal
+@view
+def _balance_at_block_time(addr: address, _block: uint256, block_time: uint256) -> uint256:
+    """
+    @notice Voting power of `addr` at block `_block` with a known block timestamp
+    @param addr User's wallet address
+    @param _block Block to calculate the voting power at
+    @param block_time Timestamp of `_block` returned by `_block_time`
+    @return Voting power
+    """
+    _epoch: uint256 = self.find_user_block_epoch(addr, _block, self.user_point_epoch[addr])
+    upoint: Point = self.user_point_history[addr][_epoch]
     upoint.bias -= upoint.slope * convert(block_time - upoint.ts, int128)
     if upoint.bias >= 0:
         return convert(upoint.bias, uint256)
@@ -603,6 +745,98 @@ def balanceOfAt(addr: address, _block: uint256) -> uint256:
         return 0
 
 
+@external
+@view
+def balanceOfAt(addr: address, _block: uint256) -> uint256:
+    """
+    @notice Measure voting power of `addr` at block height `_block`
+    @dev Adheres to MiniMe `balanceOfAt` interface: https://github.com/Giveth/minime
+    @param addr User's wallet address
+    @param _block Block to calculate the voting power at
+    @return Voting power
+    """
+    assert _block <= block.number
+    return self._balance_at_block_time(addr, _block, self._block_time(_block))
+
+
+@external
+@view
+def balanceOfManyAt(addrs: address[MAX_BATCH], _block: uint256) -> uint256[MAX_BATCH]:
+    """
+    @notice Measure voting power of many addresses at block height `_block`
+    @dev Same as `balanceOfAt` for every address, but the block timestamp is
+         estimated only once. The list terminates at the first `ZERO_ADDRESS`.
+    @param addrs Users' wallet addresses
+    @param _block Block to calculate the voting power at
+    @return Voting power of every address
+    """
+    assert _block <= block.number
+
+    result: uint256[MAX_BATCH] = empty(uint256[MAX_BATCH])
+    block_time: uint256 = self._block_time(_block)
+    for i in range(MAX_BATCH):
+        if addrs[i] == ZERO_ADDRESS:
+            break
+        result[i] = self._balance_at_block_time(addrs[i], _block, block_time)
+    return result
+
+
+@external
+@view
+def balanceOfMany(addrs: address[MAX_BATCH], _t: uint256 = block.timestamp) -> uint256[MAX_BATCH]:
+    """
+    @notice Get the voting power of many addresses at time `_t`
+    @dev Same as `balanceOf` for every address. The list terminates at the
+         first `ZERO_ADDRESS`.
+    @param addrs Users' wallet addresses
+    @param _t Epoch time to return voting power at
+    @return Voting power of every address
+    """
+    result: uint256[MAX_BATCH] = empty(uint256[MAX_BATCH])
+    for i in range(MAX_BATCH):
+        addr: address = addrs[i]
+        if addr == ZERO_ADDRESS:
+            break
+        _epoch: uint256 = self.user_point_epoch[addr]
+        if _epoch == 0:
+            continue
+        last_point: Point = self.user_point_history[addr][_epoch]
+        last_point.bias -= last_point.slope * convert(_t - last_point.ts, int128)
+        if last_point.bias > 0:
+            result[i] = convert(last_point.bias, uint256)
+    return result
+
+
+@external
+@view
+def point_at(_timestamp: uint256) -> EpochPoint:
+    """
+    @notice Get the last global point at or before `_timestamp`
+    @dev Saves the distributors a binary search over `point_history` calls
+    @param _timestamp Epoch time
+    @return The point and its epoch, epoch 0 if all points are later
+    """
+    _epoch: uint256 = self.find_timestamp_epoch(_timestamp, self.epoch)
+    point: Point = self.point_history[_epoch]
+    return EpochPoint({epoch: _epoch, bias: point.bias, slope: point.slope, ts: point.ts, blk: point.blk})
+
+
+@external
+@view
+def user_point_at(addr: address, _timestamp: uint256) -> EpochPoint:
+    """
+    @notice Get the last point of `addr` at or before `_timestamp`
+    @dev Saves the distributors a binary search over `user_point_history` calls
+    @param addr User wallet address
+    @param _timestamp Epoch time
+    @return The point and its user epoch, epoch 0 (an empty point) if all
+            points are later
+    """
+    _epoch: uint256 = self.find_user_timestamp_epoch(addr, _timestamp, self.user_point_epoch[addr])
+    point: Point = self.user_point_history[addr][_epoch]
+    return EpochPoint({epoch: _epoch, bias: point.bias, slope: point.slope, ts: point.ts, blk: point.blk})
+
+
 @internal
 @view
 def supply_at(point: Point, t: uint256) -> uint256:
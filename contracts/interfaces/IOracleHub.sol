@@ -0,0 +1,38 @@
+//SPDX-License-Identifier: MIT
+pragma solidity =0.6.6;
+
+/// Fixed window oracle for many Uniswap pairs, each pair's average price is recomputed once every period
+interface IOracleHub {
+    /// Updates prices of all pairs that are due
+    /// @dev Fails if no pair is due
+    function updateAll() external;
+
+    /// Updates price of one pair
+    /// @param pair The address of the pair
+    /// @dev Fails if the pair is not due
+    function update(address pair) external;
+
+    /// Get the price of token in a pair.
+    /// @param pair The address of the pair
+    /// @param token The address of one of two tokens of the pair (the one to get the price for)
+    /// @param amountIn The amount of token to estimate
+    /// @return amountOut The amount of other token equivalent
+    /// @dev This will always return 0 before the pair has been updated for the first time.
+    function consult(
+        address pair,
+        address token,
+        uint256 amountIn
+    ) external view returns (uint256 amountOut);
+
+    /// Checks if the pair is registered in the hub
+    /// @param pair The address of the pair
+    function isRegistered(address pair) external view returns (bool);
+
+    /// Last time the pair was updated (or added)
+    /// @param pair The address of the pair
+    function lastUpdated(address pair) external view returns (uint256);
+
+    /// The earliest time the pair can be updated
+    /// @param pair The address of the pair
+    function nextUpdateTime(address pair) external view returns (uint256);
+}
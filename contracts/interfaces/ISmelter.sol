@@ -23,6 +23,16 @@ interface ISmelter {
         uint256 amount
     ) external;
 
+    /// Mints synthetic token to several receivers
+    /// @param syntheticTokenAddress The address of the synthetic token
+    /// @param receivers Addresses to receive minted token
+    /// @param amounts Amounts to mint to each receiver
+    function mintSyntheticBatch(
+        address syntheticTokenAddress,
+        address[] calldata receivers,
+        uint256[] calldata amounts
+    ) external;
+
     /// Check if address is token admin
     /// @param admin - address to check
     function isTokenAdmin(address admin) external view returns (bool);
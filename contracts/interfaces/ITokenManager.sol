@@ -2,11 +2,12 @@
 pragma solidity =0.6.6;
 
 import "./ISmelter.sol";
+import "./IOracleHub.sol";
 
 /// Token manager as seen by other managers
 interface ITokenManager is ISmelter {
     /// A set of synthetic tokens under management
-    /// @dev Deleted tokens are still present in the array but with address(0)
+    /// @dev Deleting a token moves the last token into its place
     function allTokens() external view returns (address[] memory);
 
     /// Checks if the token is managed by Token Manager
@@ -24,6 +25,18 @@ interface ITokenManager is ISmelter {
         view
         returns (address);
 
+    /// Shared oracle for many pairs (zero address if not set)
+    function oracleHub() external view returns (IOracleHub);
+
+    /// Uniswap pair and price oracle of the synthetic token
+    /// @param syntheticTokenAddress The address of the synthetic token
+    /// @return pair The pair of the synthetic and the underlying tokens
+    /// @return oracle The oracle of the pair (the OracleHub if it's shared)
+    function priceSources(address syntheticTokenAddress)
+        external
+        view
+        returns (address pair, address oracle);
+
     /// Average price of the synthetic token according to price oracle
     /// @param syntheticTokenAddress The address of the synthetic token
     /// @param syntheticTokenAmount The amount to be priced
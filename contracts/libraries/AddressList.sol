@@ -0,0 +1,60 @@
+//SPDX-License-Identifier: MIT
+pragma solidity =0.6.6;
+
+/// Helpers for a list of unique addresses that is kept as an array (for enumeration)
+/// together with a map of 1-based positions in the array (for O(1) lookups)
+/// @dev Position 0 means the address is not in the list
+library AddressList {
+    /// Checks if an address is in the list
+    /// @param positions Positions map of the list
+    /// @param item The address to check
+    function contains(
+        mapping(address => uint256) storage positions,
+        address item
+    ) internal view returns (bool) {
+        return positions[item] != 0;
+    }
+
+    /// Appends an address to the list
+    /// @param items Array of the list
+    /// @param positions Positions map of the list
+    /// @param item The address to add
+    /// @return False if the address is already in the list
+    function add(
+        address[] storage items,
+        mapping(address => uint256) storage positions,
+        address item
+    ) internal returns (bool) {
+        if (positions[item] != 0) {
+            return false;
+        }
+        items.push(item);
+        positions[item] = items.length;
+        return true;
+    }
+
+    /// Removes an address from the list by moving the last address into its place
+    /// @param items Array of the list
+    /// @param positions Positions map of the list
+    /// @param item The address to remove
+    /// @return False if the address is not in the list
+    function remove(
+        address[] storage items,
+        mapping(address => uint256) storage positions,
+        address item
+    ) internal returns (bool) {
+        uint256 position = positions[item];
+        if (position == 0) {
+            return false;
+        }
+        uint256 lastPosition = items.length;
+        if (position != lastPosition) {
+            address lastItem = items[lastPosition - 1];
+            items[position - 1] = lastItem;
+            positions[lastItem] = position;
+        }
+        items.pop();
+        delete positions[item];
+        return true;
+    }
+}
@@ -67,6 +67,47 @@ library UniswapLibrary {
         amountB = amountA.mul(reserveB) / reserveA;
     }
 
+    /// Given an input amount of an asset and pair reserves, returns the maximum output amount of the other asset
+    /// @param amountIn The amount of the input token
+    /// @param reserveIn The reserve of the input token
+    /// @param reserveOut The reserve of the output token
+    /// @return amountOut Output amount after the 0.3% swap fee
+    function getAmountOut(
+        uint256 amountIn,
+        uint256 reserveIn,
+        uint256 reserveOut
+    ) internal pure returns (uint256 amountOut) {
+        require(amountIn > 0, "UniswapV2Library: INSUFFICIENT_INPUT_AMOUNT");
+        require(
+            reserveIn > 0 && reserveOut > 0,
+            "UniswapV2Library: INSUFFICIENT_LIQUIDITY"
+        );
+        uint256 amountInWithFee = amountIn.mul(997);
+        uint256 numerator = amountInWithFee.mul(reserveOut);
+        uint256 denominator = reserveIn.mul(1000).add(amountInWithFee);
+        amountOut = numerator / denominator;
+    }
+
+    /// Performs chained getAmountOut calculations on any number of pairs
+    /// @param factory Uniswap factory address
+    /// @param amountIn The amount of the first token in the path
+    /// @param path Token addresses, every neighbouring two make a pair
+    /// @return amounts Amounts of every token in the path
+    function getAmountsOut(
+        address factory,
+        uint256 amountIn,
+        address[] memory path
+    ) internal view returns (uint256[] memory amounts) {
+        require(path.length >= 2, "UniswapV2Library: INVALID_PATH");
+        amounts = new uint256[](path.length);
+        amounts[0] = amountIn;
+        for (uint256 i = 0; i < path.length - 1; i++) {
+            (uint256 reserveIn, uint256 reserveOut) =
+                getReserves(factory, path[i], path[i + 1]);
+            amounts[i + 1] = getAmountOut(amounts[i], reserveIn, reserveOut);
+        }
+    }
+
     /// Fetches and sorts the reserves for a pair
     /// @param factory Uniswap factory address
     /// @param tokenA One token in the pair
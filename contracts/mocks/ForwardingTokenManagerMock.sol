@@ -0,0 +1,129 @@
+//SPDX-License-Identifier: MIT
+pragma solidity =0.6.6;
+
+import "../interfaces/ITokenManager.sol";
+
+/// Passes every call through to a TokenManager, for gas comparisons
+/// @dev Must be a token admin of the TokenManager. Mocks replaying older
+/// code paths override single functions, so the pass-through costs the same
+/// on both sides of a comparison.
+contract ForwardingTokenManagerMock is ITokenManager {
+    ITokenManager public tokenManager;
+
+    constructor(address _tokenManager) public {
+        tokenManager = ITokenManager(_tokenManager);
+    }
+
+    function allTokens() external view override returns (address[] memory) {
+        return tokenManager.allTokens();
+    }
+
+    function isManagedToken(address syntheticTokenAddress)
+        external
+        view
+        override
+        returns (bool)
+    {
+        return tokenManager.isManagedToken(syntheticTokenAddress);
+    }
+
+    function isTokenAdmin(address admin) external view override returns (bool) {
+        return tokenManager.isTokenAdmin(admin);
+    }
+
+    function underlyingToken(address syntheticTokenAddress)
+        external
+        view
+        override
+        returns (address)
+    {
+        return tokenManager.underlyingToken(syntheticTokenAddress);
+    }
+
+    function oracleHub() external view override returns (IOracleHub) {
+        return tokenManager.oracleHub();
+    }
+
+    function priceSources(address syntheticTokenAddress)
+        external
+        view
+        override
+        returns (address, address)
+    {
+        return tokenManager.priceSources(syntheticTokenAddress);
+    }
+
+    function averagePrice(
+        address syntheticTokenAddress,
+        uint256 syntheticTokenAmount
+    ) external view override returns (uint256) {
+        return
+            tokenManager.averagePrice(
+                syntheticTokenAddress,
+                syntheticTokenAmount
+            );
+    }
+
+    function currentPrice(
+        address syntheticTokenAddress,
+        uint256 syntheticTokenAmount
+    ) external view virtual override returns (uint256) {
+        return
+            tokenManager.currentPrice(
+                syntheticTokenAddress,
+                syntheticTokenAmount
+            );
+    }
+
+    function updateOracle(address syntheticTokenAddress) external override {
+        tokenManager.updateOracle(syntheticTokenAddress);
+    }
+
+    function oneSyntheticUnit(address syntheticTokenAddress)
+        external
+        view
+        virtual
+        override
+        returns (uint256)
+    {
+        return tokenManager.oneSyntheticUnit(syntheticTokenAddress);
+    }
+
+    function oneUnderlyingUnit(address syntheticTokenAddress)
+        external
+        view
+        virtual
+        override
+        returns (uint256)
+    {
+        return tokenManager.oneUnderlyingUnit(syntheticTokenAddress);
+    }
+
+    function burnSyntheticFrom(
+        address syntheticTokenAddress,
+        address owner,
+        uint256 amount
+    ) external override {
+        tokenManager.burnSyntheticFrom(syntheticTokenAddress, owner, amount);
+    }
+
+    function mintSynthetic(
+        address syntheticTokenAddress,
+        address receiver,
+        uint256 amount
+    ) external override {
+        tokenManager.mintSynthetic(syntheticTokenAddress, receiver, amount);
+    }
+
+    function mintSyntheticBatch(
+        address syntheticTokenAddress,
+        address[] calldata receivers,
+        uint256[] calldata amounts
+    ) external virtual override {
+        tokenManager.mintSyntheticBatch(
+            syntheticTokenAddress,
+            receivers,
+            amounts
+        );
+    }
+}
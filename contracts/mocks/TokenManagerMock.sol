@@ -26,6 +26,19 @@ contract TokenManagerMock is ITokenManager {
         return address(0);
     }
 
+    function oracleHub() external view override returns (IOracleHub) {
+        return IOracleHub(address(0));
+    }
+
+    function priceSources(address)
+        external
+        view
+        override
+        returns (address, address)
+    {
+        return (address(0), address(0));
+    }
+
     function averagePrice(address, uint256)
         external
         view
@@ -58,6 +71,12 @@ contract TokenManagerMock is ITokenManager {
         uint256
     ) external override {}
 
+    function mintSyntheticBatch(
+        address,
+        address[] calldata,
+        uint256[] calldata
+    ) external override {}
+
     function oneSyntheticUnit(address)
         external
         view
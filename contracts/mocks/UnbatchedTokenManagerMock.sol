@@ -0,0 +1,29 @@
+//SPDX-License-Identifier: MIT
+pragma solidity =0.6.6;
+
+import "./ForwardingTokenManagerMock.sol";
+
+/// Mints every receiver of a batch with a separate mintSynthetic call,
+/// the way positive rebases minted before mintSyntheticBatch
+contract UnbatchedTokenManagerMock is ForwardingTokenManagerMock {
+    constructor(address _tokenManager)
+        public
+        ForwardingTokenManagerMock(_tokenManager)
+    {}
+
+    function mintSyntheticBatch(
+        address syntheticTokenAddress,
+        address[] calldata receivers,
+        uint256[] calldata amounts
+    ) external override {
+        for (uint256 i = 0; i < receivers.length; i++) {
+            if (amounts[i] > 0) {
+                tokenManager.mintSynthetic(
+                    syntheticTokenAddress,
+                    receivers[i],
+                    amounts[i]
+                );
+            }
+        }
+    }
+}
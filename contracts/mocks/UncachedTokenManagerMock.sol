@@ -0,0 +1,58 @@
+//SPDX-License-Identifier: MIT
+pragma solidity =0.6.6;
+
+import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+
+import "../libraries/UniswapLibrary.sol";
+import "./ForwardingTokenManagerMock.sol";
+
+/// Reads decimals and derives the pair on every call, the way TokenManager
+/// did before caching token units
+contract UncachedTokenManagerMock is ForwardingTokenManagerMock {
+    address public immutable uniswapFactory;
+
+    constructor(address _tokenManager, address _uniswapFactory)
+        public
+        ForwardingTokenManagerMock(_tokenManager)
+    {
+        uniswapFactory = _uniswapFactory;
+    }
+
+    function currentPrice(
+        address syntheticTokenAddress,
+        uint256 syntheticTokenAmount
+    ) external view override returns (uint256) {
+        (uint256 syntheticReserve, uint256 undelyingReserve) =
+            UniswapLibrary.getReserves(
+                uniswapFactory,
+                syntheticTokenAddress,
+                tokenManager.underlyingToken(syntheticTokenAddress)
+            );
+        return
+            UniswapLibrary.quote(
+                syntheticTokenAmount,
+                syntheticReserve,
+                undelyingReserve
+            );
+    }
+
+    function oneSyntheticUnit(address syntheticTokenAddress)
+        external
+        view
+        override
+        returns (uint256)
+    {
+        return uint256(10)**ERC20(syntheticTokenAddress).decimals();
+    }
+
+    function oneUnderlyingUnit(address syntheticTokenAddress)
+        external
+        view
+        override
+        returns (uint256)
+    {
+        address underlying =
+            tokenManager.underlyingToken(syntheticTokenAddress);
+        return uint256(10)**ERC20(underlying).decimals();
+    }
+}
@@ -29,6 +29,22 @@ contract UniswapLibraryTest {
         amountB = UniswapLibrary.quote(amountA, reserveA, reserveB);
     }
 
+    function getAmountOut(
+        uint256 amountIn,
+        uint256 reserveIn,
+        uint256 reserveOut
+    ) public pure returns (uint256 amountOut) {
+        amountOut = UniswapLibrary.getAmountOut(amountIn, reserveIn, reserveOut);
+    }
+
+    function getAmountsOut(
+        address factory,
+        uint256 amountIn,
+        address[] memory path
+    ) public view returns (uint256[] memory amounts) {
+        amounts = UniswapLibrary.getAmountsOut(factory, amountIn, path);
+    }
+
     // fetches and sorts the reserves for a pair
     function getReserves(
         address factory,
@@ -10,6 +10,7 @@ import "../time/Timeboundable.sol";
 import "../SyntheticToken.sol";
 import "../interfaces/IEmissionManager.sol";
 import "../interfaces/ITokenManager.sol";
+import "../interfaces/IOracleHub.sol";
 import "../interfaces/IBondManager.sol";
 import "../interfaces/IBoardroom.sol";
 
@@ -55,6 +56,19 @@ contract EmissionManager is
     /// Pauses positive rebases
     bool public pausePositiveRebase;
 
+    /// Per token data for keepers (see `keeperInfo`)
+    struct KeeperInfo {
+        address[] syntheticTokens;
+        address[] underlyingTokens;
+        address[] pairs;
+        address[] oracles;
+        uint256[] averagePrices;
+        uint256[] currentPrices;
+        uint256[] rebaseAmounts;
+        uint256[] oracleLastCalledTimes;
+        uint256[] oracleNextCallTimes;
+    }
+
     /// Create new Emission manager
     /// @param startTime Start of the operations
     /// @param period The period between positive rebases
@@ -130,9 +144,50 @@ contract EmissionManager is
             );
     }
 
+    /// Everything a keeper needs to decide on oracle updates and rebases in one call
+    /// @return syntheticTokens All tokens of TokenManager (see `TokenManager.allTokens`)
+    /// @return underlyingTokens Underlying token of each synthetic token
+    /// @return pairs Uniswap pair of each synthetic token
+    /// @return oracles Oracle of each synthetic token
+    /// @return averagePrices Oracle price of one synthetic unit (0 if the oracle can't be consulted)
+    /// @return currentPrices Uniswap price of one synthetic unit
+    /// @return rebaseAmounts `positiveRebaseAmount` of each synthetic token (0 if not available)
+    /// @return oracleLastCalledTimes The last time the oracle was updated (the pair for OracleHub)
+    /// @return oracleNextCallTimes The earliest time the oracle can be updated (the pair for OracleHub)
+    /// @return nextRebaseTime The earliest time `makePositiveRebase` can be called
+    function keeperInfo()
+        external
+        view
+        returns (
+            address[] memory syntheticTokens,
+            address[] memory underlyingTokens,
+            address[] memory pairs,
+            address[] memory oracles,
+            uint256[] memory averagePrices,
+            uint256[] memory currentPrices,
+            uint256[] memory rebaseAmounts,
+            uint256[] memory oracleLastCalledTimes,
+            uint256[] memory oracleNextCallTimes,
+            uint256 nextRebaseTime
+        )
+    {
+        KeeperInfo memory info = _keeperInfo();
+        syntheticTokens = info.syntheticTokens;
+        underlyingTokens = info.underlyingTokens;
+        pairs = info.pairs;
+        oracles = info.oracles;
+        averagePrices = info.averagePrices;
+        currentPrices = info.currentPrices;
+        rebaseAmounts = info.rebaseAmounts;
+        oracleLastCalledTimes = info.oracleLastCalledTimes;
+        oracleNextCallTimes = info.oracleNextCallTimes;
+        nextRebaseTime = Math.max(lastCalled.add(debouncePeriod), start);
+    }
+
     // --------- Public ---------
 
     /// Makes positive rebases for all eligible tokens
+    /// @dev Tokens sharing the OracleHub get one `updateAll` per rebase
     function makePositiveRebase()
         public
         nonReentrant
@@ -142,8 +197,15 @@ contract EmissionManager is
     {
         require(!pausePositiveRebase, "EmissionManager: Rebases are paused");
         address[] memory tokens = tokenManager.allTokens();
+        IOracleHub oracleHub = tokenManager.oracleHub();
+        bool oracleHubUpdated = false;
         for (uint32 i = 0; i < tokens.length; i++) {
             if (tokens[i] != address(0)) {
+                oracleHubUpdated = _updateOracle(
+                    tokens[i],
+                    oracleHub,
+                    oracleHubUpdated
+                );
                 _makeOnePositiveRebase(tokens[i]);
             }
         }
@@ -254,105 +316,191 @@ contract EmissionManager is
         emit PositiveRebasePaused(msg.sender, pause);
     }
 
+    /// Collects `keeperInfo` for all tokens
+    function _keeperInfo() internal view returns (KeeperInfo memory info) {
+        address[] memory tokens = tokenManager.allTokens();
+        uint256 length = tokens.length;
+        info.syntheticTokens = tokens;
+        info.underlyingTokens = new address[](length);
+        info.pairs = new address[](length);
+        info.oracles = new address[](length);
+        info.averagePrices = new uint256[](length);
+        info.currentPrices = new uint256[](length);
+        info.rebaseAmounts = new uint256[](length);
+        info.oracleLastCalledTimes = new uint256[](length);
+        info.oracleNextCallTimes = new uint256[](length);
+        IOracleHub oracleHub = tokenManager.oracleHub();
+        for (uint256 i = 0; i < length; i++) {
+            if (tokens[i] != address(0)) {
+                _fillKeeperInfo(info, i, oracleHub);
+            }
+        }
+    }
+
+    /// Fills `keeperInfo` for one token
+    /// @param info Info being collected
+    /// @param i Index of the token in `info.syntheticTokens`
+    /// @param oracleHub OracleHub of TokenManager
+    /// @dev The hub updates each pair on its own schedule, so its times are taken per pair
+    function _fillKeeperInfo(
+        KeeperInfo memory info,
+        uint256 i,
+        IOracleHub oracleHub
+    ) internal view {
+        address token = info.syntheticTokens[i];
+        info.underlyingTokens[i] = tokenManager.underlyingToken(token);
+        (address pair, address oracle) = tokenManager.priceSources(token);
+        info.pairs[i] = pair;
+        info.oracles[i] = oracle;
+        if (oracle == address(oracleHub)) {
+            info.oracleLastCalledTimes[i] = oracleHub.lastUpdated(pair);
+            info.oracleNextCallTimes[i] = oracleHub.nextUpdateTime(pair);
+        } else {
+            info.oracleLastCalledTimes[i] = Debouncable(oracle).lastCalled();
+            info.oracleNextCallTimes[i] = Math.max(
+                info.oracleLastCalledTimes[i].add(
+                    Debouncable(oracle).debouncePeriod()
+                ),
+                Timeboundable(oracle).start()
+            );
+        }
+
+        uint256 unit = tokenManager.oneSyntheticUnit(token);
+        try tokenManager.averagePrice(token, unit) returns (uint256 price) {
+            info.averagePrices[i] = price;
+        } catch {}
+        try tokenManager.currentPrice(token, unit) returns (uint256 price) {
+            info.currentPrices[i] = price;
+        } catch {}
+        try this.positiveRebaseAmount(token) returns (uint256 amount) {
+            info.rebaseAmounts[i] = amount;
+        } catch {}
+    }
+
+    /// Updates the price oracle of one token before its rebase
+    /// @param syntheticTokenAddress The address of the synthetic token
+    /// @param oracleHub OracleHub of TokenManager
+    /// @param oracleHubUpdated True if the hub was already updated in this rebase
+    /// @return True if the hub was updated in this rebase (now or before)
+    /// @dev `updateAll` updates every due pair, so one call covers all tokens of the hub
+    function _updateOracle(
+        address syntheticTokenAddress,
+        IOracleHub oracleHub,
+        bool oracleHubUpdated
+    ) internal returns (bool) {
+        if (address(oracleHub) != address(0)) {
+            (, address oracle) =
+                tokenManager.priceSources(syntheticTokenAddress);
+            if (oracle == address(oracleHub)) {
+                if (!oracleHubUpdated) {
+                    try oracleHub.updateAll() {} catch {}
+                }
+                return true;
+            }
+        }
+        tokenManager.updateOracle(syntheticTokenAddress);
+        return oracleHubUpdated;
+    }
+
     /// Make positive rebase for one token
     /// @param syntheticTokenAddress The address of the synthetic token
     /// @dev The caller must ensure `managedToken` and `initialized` properties
+    /// and update the oracle of the token (see `_updateOracle`)
     function _makeOnePositiveRebase(address syntheticTokenAddress) internal {
-        tokenManager.updateOracle(syntheticTokenAddress);
-        SyntheticToken syntheticToken = SyntheticToken(syntheticTokenAddress);
         uint256 amount = positiveRebaseAmount(syntheticTokenAddress);
         if (amount == 0) {
             return;
         }
         emit PositiveRebaseTotal(syntheticTokenAddress, amount);
 
-        uint256 devFundAmount = amount.mul(devFundRate).div(100);
-        tokenManager.mintSynthetic(
+        (
+            address[] memory receivers,
+            uint256[] memory amounts,
+            uint256 boardroomsAmount
+        ) = _positiveRebaseSplit(syntheticTokenAddress, amount);
+        tokenManager.mintSyntheticBatch(
             syntheticTokenAddress,
-            devFund,
-            devFundAmount
+            receivers,
+            amounts
         );
-        emit DevFundFunded(syntheticTokenAddress, devFundAmount);
-        amount = amount.sub(devFundAmount);
 
-        uint256 stableFundAmount = amount.mul(stableFundRate).div(100);
-        tokenManager.mintSynthetic(
-            syntheticTokenAddress,
-            stableFund,
-            stableFundAmount
-        );
-        emit StableFundFunded(syntheticTokenAddress, stableFundAmount);
-        amount = amount.sub(stableFundAmount);
+        emit DevFundFunded(syntheticTokenAddress, amounts[0]);
+        emit StableFundFunded(syntheticTokenAddress, amounts[1]);
+        if (amounts[2] > 0) {
+            emit BondDistributionFunded(syntheticTokenAddress, amounts[2]);
+        }
+        if (boardroomsAmount == 0) {
+            return;
+        }
+
+        if (veBoardroomRate > 0) {
+            veBoardroom.notifyTransfer(syntheticTokenAddress, amounts[3]);
+            emit VeBoardroomFunded(syntheticTokenAddress, amounts[3]);
+        }
+        if (liquidBoardroomRate > 0) {
+            liquidBoardroom.notifyTransfer(syntheticTokenAddress, amounts[4]);
+            emit LiquidBoardroomFunded(syntheticTokenAddress, amounts[4]);
+        }
+        if (uniswapBoardroomRate() > 0) {
+            uniswapBoardroom.notifyTransfer(syntheticTokenAddress, amounts[5]);
+            emit UniswapBoardroomFunded(syntheticTokenAddress, amounts[5]);
+        }
+    }
+
+    /// Splits a positive rebase between the funds, the bond manager and the boardrooms
+    /// @param syntheticTokenAddress The address of the synthetic token
+    /// @param amount Total rebase amount
+    /// @return receivers Dev fund, stable fund, bond manager, ve, liquid and uniswap boardrooms
+    /// @return amounts Amount for each receiver (0 if the receiver gets nothing)
+    /// @return boardroomsAmount Amount left for the boardrooms after the funds and bonds
+    function _positiveRebaseSplit(
+        address syntheticTokenAddress,
+        uint256 amount
+    )
+        internal
+        view
+        returns (
+            address[] memory receivers,
+            uint256[] memory amounts,
+            uint256 boardroomsAmount
+        )
+    {
+        receivers = new address[](6);
+        amounts = new uint256[](6);
+        receivers[0] = devFund;
+        receivers[1] = stableFund;
+        receivers[2] = address(bondManager);
+        receivers[3] = address(veBoardroom);
+        receivers[4] = address(liquidBoardroom);
+        receivers[5] = address(uniswapBoardroom);
+
+        amounts[0] = amount.mul(devFundRate).div(100);
+        amount = amount.sub(amounts[0]);
+
+        amounts[1] = amount.mul(stableFundRate).div(100);
+        amount = amount.sub(amounts[1]);
 
         SyntheticToken bondToken =
             SyntheticToken(bondManager.bondIndex(syntheticTokenAddress));
         uint256 bondSupply = bondToken.totalSupply();
-        uint256 bondPoolBalance = syntheticToken.balanceOf(address(this));
+        uint256 bondPoolBalance =
+            SyntheticToken(syntheticTokenAddress).balanceOf(address(this));
         uint256 bondShortage =
             Math.max(bondSupply, bondPoolBalance).sub(bondPoolBalance);
-        uint256 bondAmount = Math.min(amount, bondShortage);
-        if (bondAmount > 0) {
-            tokenManager.mintSynthetic(
-                syntheticTokenAddress,
-                address(bondManager),
-                bondAmount
-            );
-            emit BondDistributionFunded(syntheticTokenAddress, bondAmount);
-        }
-        amount = amount.sub(bondAmount);
-        if (amount == 0) {
-            return;
+        amounts[2] = Math.min(amount, bondShortage);
+        boardroomsAmount = amount.sub(amounts[2]);
+        if (boardroomsAmount == 0) {
+            return (receivers, amounts, boardroomsAmount);
         }
 
-        uint256 veBoardroomAmount = 0;
         if (veBoardroomRate > 0) {
-            veBoardroomAmount = amount.mul(veBoardroomRate).div(100);
-            tokenManager.mintSynthetic(
-                syntheticTokenAddress,
-                address(veBoardroom),
-                veBoardroomAmount
-            );
-            veBoardroom.notifyTransfer(
-                syntheticTokenAddress,
-                veBoardroomAmount
-            );
-            emit VeBoardroomFunded(syntheticTokenAddress, veBoardroomAmount);
+            amounts[3] = boardroomsAmount.mul(veBoardroomRate).div(100);
         }
-
-        uint256 liquidBoardroomAmount = 0;
         if (liquidBoardroomRate > 0) {
-            liquidBoardroomAmount = amount.mul(liquidBoardroomRate).div(100);
-            tokenManager.mintSynthetic(
-                syntheticTokenAddress,
-                address(liquidBoardroom),
-                liquidBoardroomAmount
-            );
-            liquidBoardroom.notifyTransfer(
-                syntheticTokenAddress,
-                liquidBoardroomAmount
-            );
-            emit LiquidBoardroomFunded(
-                syntheticTokenAddress,
-                liquidBoardroomAmount
-            );
+            amounts[4] = boardroomsAmount.mul(liquidBoardroomRate).div(100);
         }
-
         if (uniswapBoardroomRate() > 0) {
-            uint256 uniswapBoardroomAmount =
-                amount.sub(veBoardroomAmount).sub(liquidBoardroomAmount);
-            tokenManager.mintSynthetic(
-                syntheticTokenAddress,
-                address(uniswapBoardroom),
-                uniswapBoardroomAmount
-            );
-            uniswapBoardroom.notifyTransfer(
-                syntheticTokenAddress,
-                uniswapBoardroomAmount
-            );
-            emit UniswapBoardroomFunded(
-                syntheticTokenAddress,
-                uniswapBoardroomAmount
-            );
+            amounts[5] = boardroomsAmount.sub(amounts[3]).sub(amounts[4]);
         }
     }
 
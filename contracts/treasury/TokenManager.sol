@@ -5,7 +5,9 @@ import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
 import "@uniswap/v2-core/contracts/interfaces/IUniswapV2Pair.sol";
 
 import "../libraries/UniswapLibrary.sol";
+import "../libraries/AddressList.sol";
 import "../interfaces/IOracle.sol";
+import "../interfaces/IOracleHub.sol";
 import "../interfaces/ITokenManager.sol";
 import "../interfaces/IBondManager.sol";
 import "../interfaces/IEmissionManager.sol";
@@ -22,17 +24,32 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         IOracle oracle;
     }
 
+    /// 10^decimals of the token pair, decimals never change after deployment
+    struct TokenUnits {
+        uint256 synthetic;
+        uint256 underlying;
+    }
+
     /// Token data (key is synthetic token address)
     mapping(address => TokenData) public tokenIndex;
+    /// Token units (key is synthetic token address)
+    /// @dev Kept apart from `tokenIndex` so that its getter stays the same as in deployed TokenManagers
+    mapping(address => TokenUnits) public tokenUnits;
     /// A set of managed synthetic token addresses
     address[] public tokens;
     /// Addresses of contracts allowed to mint / burn synthetic tokens
     address[] tokenAdmins;
+    /// 1-based positions in `tokens` (0 if not managed)
+    mapping(address => uint256) tokenPositions;
+    /// 1-based positions in `tokenAdmins` (0 if not an admin)
+    mapping(address => uint256) tokenAdminPositions;
     /// Uniswap factory address
     address public immutable uniswapFactory;
 
     IBondManager public bondManager;
     IEmissionManager public emissionManager;
+    /// Shared oracle for many pairs, tokens use it when their oracle is set to this address
+    IOracleHub public override oracleHub;
 
     // ------- Constructor ----------
 
@@ -73,7 +90,7 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
     // ------- View ----------
 
     /// A set of synthetic tokens under management
-    /// @dev Deleted tokens are still present in the array but with address(0)
+    /// @dev Deleting a token moves the last token into its place
     function allTokens() public view override returns (address[] memory) {
         return tokens;
     }
@@ -124,12 +141,7 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
     /// Check if address is token admin
     /// @param admin - address to check
     function isTokenAdmin(address admin) public view override returns (bool) {
-        for (uint256 i = 0; i < tokenAdmins.length; i++) {
-            if (tokenAdmins[i] == admin) {
-                return true;
-            }
-        }
-        return false;
+        return AddressList.contains(tokenAdminPositions, admin);
     }
 
     /// Address of the underlying token
@@ -144,6 +156,21 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         return address(tokenIndex[syntheticTokenAddress].underlyingToken);
     }
 
+    /// Uniswap pair and price oracle of the synthetic token
+    /// @param syntheticTokenAddress The address of the synthetic token
+    /// @return pair The pair of the synthetic and the underlying tokens
+    /// @return oracle The oracle of the pair (the OracleHub if it's shared)
+    function priceSources(address syntheticTokenAddress)
+        public
+        view
+        override
+        managedToken(syntheticTokenAddress)
+        returns (address pair, address oracle)
+    {
+        TokenData storage data = tokenIndex[syntheticTokenAddress];
+        return (address(data.pair), address(data.oracle));
+    }
+
     /// Average price of the synthetic token according to price oracle
     /// @param syntheticTokenAddress The address of the synthetic token
     /// @param syntheticTokenAmount The amount to be priced
@@ -159,8 +186,16 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         managedToken(syntheticTokenAddress)
         returns (uint256)
     {
-        IOracle oracle = tokenIndex[syntheticTokenAddress].oracle;
-        return oracle.consult(syntheticTokenAddress, syntheticTokenAmount);
+        TokenData storage data = tokenIndex[syntheticTokenAddress];
+        if (address(data.oracle) == address(oracleHub)) {
+            return
+                oracleHub.consult(
+                    address(data.pair),
+                    syntheticTokenAddress,
+                    syntheticTokenAmount
+                );
+        }
+        return data.oracle.consult(syntheticTokenAddress, syntheticTokenAmount);
     }
 
     /// Current price of the synthetic token according to Uniswap
@@ -178,14 +213,13 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         managedToken(syntheticTokenAddress)
         returns (uint256)
     {
-        address underlyingTokenAddress =
-            address(tokenIndex[syntheticTokenAddress].underlyingToken);
+        TokenData storage data = tokenIndex[syntheticTokenAddress];
+        (uint256 reserve0, uint256 reserve1, ) = data.pair.getReserves();
+        // the pair sorts its tokens by address
         (uint256 syntheticReserve, uint256 undelyingReserve) =
-            UniswapLibrary.getReserves(
-                uniswapFactory,
-                syntheticTokenAddress,
-                underlyingTokenAddress
-            );
+            syntheticTokenAddress < address(data.underlyingToken)
+                ? (reserve0, reserve1)
+                : (reserve1, reserve0);
         return
             UniswapLibrary.quote(
                 syntheticTokenAmount,
@@ -204,9 +238,7 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         managedToken(syntheticTokenAddress)
         returns (uint256)
     {
-        SyntheticToken synToken =
-            SyntheticToken(tokenIndex[syntheticTokenAddress].syntheticToken);
-        return uint256(10)**synToken.decimals();
+        return tokenUnits[syntheticTokenAddress].synthetic;
     }
 
     /// Get one underlying unit
@@ -219,8 +251,7 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         managedToken(syntheticTokenAddress)
         returns (uint256)
     {
-        ERC20 undToken = tokenIndex[syntheticTokenAddress].underlyingToken;
-        return uint256(10)**undToken.decimals();
+        return tokenUnits[syntheticTokenAddress].underlying;
     }
 
     // ------- External --------------------
@@ -233,8 +264,12 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         override
         managedToken(syntheticTokenAddress)
     {
-        IOracle oracle = tokenIndex[syntheticTokenAddress].oracle;
-        try oracle.update() {} catch {}
+        TokenData storage data = tokenIndex[syntheticTokenAddress];
+        if (address(data.oracle) == address(oracleHub)) {
+            try oracleHub.update(address(data.pair)) {} catch {}
+            return;
+        }
+        try data.oracle.update() {} catch {}
     }
 
     // ------- External, Owner ----------
@@ -281,19 +316,21 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
                     underlyingTokenAddress
                 )
             );
+        uint8 syntheticDecimals = syntheticToken.decimals();
         require(
-            syntheticToken.decimals() == bondToken.decimals(),
+            syntheticDecimals == bondToken.decimals(),
             "TokenManager: Synthetic and Bond tokens must have the same number of decimals"
         );
 
-        require(
-            address(oracle.pair()) == address(pair),
-            "TokenManager: Tokens and Oracle tokens are different"
-        );
+        _checkOracle(oracle, pair);
         TokenData memory tokenData =
             TokenData(syntheticToken, underlyingTkn, pair, oracle);
         tokenIndex[syntheticTokenAddress] = tokenData;
-        tokens.push(syntheticTokenAddress);
+        tokenUnits[syntheticTokenAddress] = TokenUnits(
+            uint256(10)**syntheticDecimals,
+            uint256(10)**underlyingTkn.decimals()
+        );
+        AddressList.add(tokens, tokenPositions, syntheticTokenAddress);
         bondManager.addBondToken(syntheticTokenAddress, bondTokenAddress);
         emit TokenAdded(
             syntheticTokenAddress,
@@ -314,17 +351,12 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         initialized
     {
         bondManager.deleteBondToken(syntheticTokenAddress, newOperator);
-        uint256 pos;
-        for (uint256 i = 0; i < tokens.length; i++) {
-            if (tokens[i] == syntheticTokenAddress) {
-                pos = i;
-            }
-        }
-        TokenData memory data = tokenIndex[tokens[pos]];
+        TokenData memory data = tokenIndex[syntheticTokenAddress];
         data.syntheticToken.transferOperator(newOperator);
         data.syntheticToken.transferOwnership(newOperator);
         delete tokenIndex[syntheticTokenAddress];
-        delete tokens[pos];
+        delete tokenUnits[syntheticTokenAddress];
+        AddressList.remove(tokens, tokenPositions, syntheticTokenAddress);
         emit TokenDeleted(
             syntheticTokenAddress,
             address(data.underlyingToken),
@@ -371,6 +403,34 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         token.mint(receiver, amount);
     }
 
+    /// Mints synthetic token to several receivers in one call
+    /// @param syntheticTokenAddress The address of the synthetic token
+    /// @param receivers Addresses to receive minted token
+    /// @param amounts Amounts to mint to each receiver
+    /// @dev Zero amounts are skipped
+    function mintSyntheticBatch(
+        address syntheticTokenAddress,
+        address[] calldata receivers,
+        uint256[] calldata amounts
+    )
+        external
+        override
+        managedToken(syntheticTokenAddress)
+        initialized
+        tokenAdmin
+    {
+        require(
+            receivers.length == amounts.length,
+            "TokenManager: Receivers and amounts must have the same length"
+        );
+        SyntheticToken token = tokenIndex[syntheticTokenAddress].syntheticToken;
+        for (uint256 i = 0; i < receivers.length; i++) {
+            if (amounts[i] > 0) {
+                token.mint(receivers[i], amounts[i]);
+            }
+        }
+    }
+
     // --------- Operator -----------
 
     /// Updates bond manager address
@@ -408,30 +468,62 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         managedToken(syntheticTokenAddress)
     {
         IOracle oracle = IOracle(oracleAddress);
-        require(
-            oracle.pair() == tokenIndex[syntheticTokenAddress].pair,
-            "TokenManager: Tokens and Oracle tokens are different"
-        );
+        _checkOracle(oracle, tokenIndex[syntheticTokenAddress].pair);
         tokenIndex[syntheticTokenAddress].oracle = oracle;
         emit OracleUpdated(msg.sender, syntheticTokenAddress, oracleAddress);
     }
 
+    /// Updates the shared oracle hub address
+    /// @param _oracleHub new oracle hub
+    /// @dev Tokens using the current hub must be moved to another oracle first
+    function setOracleHub(address _oracleHub) public onlyOperator {
+        require(
+            address(oracleHub) != _oracleHub,
+            "TokenManager: oracleHub with this address already set"
+        );
+        if (address(oracleHub) != address(0)) {
+            for (uint256 i = 0; i < tokens.length; i++) {
+                require(
+                    tokenIndex[tokens[i]].oracle != IOracle(address(oracleHub)),
+                    "TokenManager: oracleHub is used by tokens"
+                );
+            }
+        }
+        oracleHub = IOracleHub(_oracleHub);
+        emit OracleHubChanged(msg.sender, _oracleHub);
+    }
+
     // ------- Internal ----------
 
-    function _addTokenAdmin(address admin) internal {
-        if (isTokenAdmin(admin)) {
+    /// Fails if the oracle doesn't price the pair
+    /// @param oracle Oracle of the pair or the oracle hub
+    /// @param pair Uniswap pair of the synthetic and underlying tokens
+    function _checkOracle(IOracle oracle, IUniswapV2Pair pair) internal view {
+        if (
+            address(oracle) != address(0) &&
+            address(oracle) == address(oracleHub)
+        ) {
+            require(
+                oracleHub.isRegistered(address(pair)),
+                "TokenManager: Pair is not registered in oracleHub"
+            );
             return;
         }
-        tokenAdmins.push(admin);
-        emit TokenAdminAdded(msg.sender, admin);
+        require(
+            address(oracle.pair()) == address(pair),
+            "TokenManager: Tokens and Oracle tokens are different"
+        );
+    }
+
+    function _addTokenAdmin(address admin) internal {
+        if (AddressList.add(tokenAdmins, tokenAdminPositions, admin)) {
+            emit TokenAdminAdded(msg.sender, admin);
+        }
     }
 
     function _deleteTokenAdmin(address admin) internal {
-        for (uint256 i = 0; i < tokenAdmins.length; i++) {
-            if (tokenAdmins[i] == admin) {
-                delete tokenAdmins[i];
-                emit TokenAdminDeleted(msg.sender, admin);
-            }
+        if (AddressList.remove(tokenAdmins, tokenAdminPositions, admin)) {
+            emit TokenAdminDeleted(msg.sender, admin);
         }
     }
 
@@ -457,6 +549,8 @@ contract TokenManager is ITokenManager, Operatable, Migratable {
         address indexed syntheticTokenAddress,
         address oracleAddress
     );
+    /// Emitted each time OracleHub is updated
+    event OracleHubChanged(address indexed operator, address newOracleHub);
     /// Emitted each time BondManager is updated
     event BondManagerChanged(address indexed operator, address newManager);
     /// Emitted each time EmissionManager is updated
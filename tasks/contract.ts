@@ -14,6 +14,7 @@ import { writeFileSync } from "fs";
 import { ethers } from "hardhat";
 import https from "https";
 import axios from "axios";
+import { submitTransaction } from "./utils";
 
 task("contract:deploy", "Deploys a contract")
   .addParam(
@@ -50,6 +51,9 @@ task("contract:verify:all", "Verifies contracts").setAction(
   }
 );
 
+// Deployments in progress by registry name
+const DEPLOYING: { [registryName: string]: Promise<Contract> } = {};
+
 export async function contractDeploy(
   hre: HardhatRuntimeEnvironment,
   name: string,
@@ -65,7 +69,18 @@ export async function contractDeploy(
 
     return contract;
   }
-  return await contractHardDeploy(hre, name, registryName, ...args);
+  // concurrent deploy steps can ask for the same contract (e.g. the local Uniswap factory)
+  if (!DEPLOYING[registryName]) {
+    DEPLOYING[registryName] = contractHardDeploy(
+      hre,
+      name,
+      registryName,
+      ...args
+    ).finally(() => {
+      delete DEPLOYING[registryName];
+    });
+  }
+  return await DEPLOYING[registryName];
 }
 
 export async function findExistingContract(
@@ -93,7 +108,7 @@ export async function contractHardDeploy(
   const factory = (await hre.ethers.getContractFactory(name)).connect(operator);
   const tx = factory.getDeployTransaction(...args);
   console.log("Sending transaction to the pool...");
-  const txResp = await operator.sendTransaction(tx);
+  const txResp = await submitTransaction(hre, tx);
   const address = getContractAddress(txResp).toLowerCase();
   console.log(
     `Sent tx \`${txResp.hash}\` to the pool. Waiting 1 confirmation...`
@@ -22,9 +22,21 @@ task("cron:tick")
     log(
       `Processing oracle updates for tokens ${tokens} at TokenManager ${tokenManager.address}`
     );
+    const oracleHub = await findOracleHub(hre, tokenManager);
+    const oracleHubPairs: string[] = [];
     for (const token of tokens) {
+      if (oracleHub !== hre.ethers.constants.AddressZero) {
+        const [, , pair, oracleAddress] = await tokenManager.tokenIndex(token);
+        if (oracleAddress.toLowerCase() === oracleHub.toLowerCase()) {
+          oracleHubPairs.push(pair);
+          continue;
+        }
+      }
       await oracleTick(hre, token, tokenManager, emissionManager, dry);
     }
+    if (oracleHubPairs.length > 0) {
+      await oracleHubTick(hre, oracleHub, oracleHubPairs, emissionManager, dry);
+    }
 
     await emissionManagerTick(hre, emissionManager, dry);
   });
@@ -189,6 +201,78 @@ async function oracleTick(
   log(`Updated`);
 }
 
+// TokenManagers deployed before the OracleHub don't have the `oracleHub`
+// getter, their tokens all have own oracles
+async function findOracleHub(
+  hre: HardhatRuntimeEnvironment,
+  tokenManager: Contract
+): Promise<string> {
+  try {
+    return await tokenManager.oracleHub();
+  } catch (e) {
+    return hre.ethers.constants.AddressZero;
+  }
+}
+
+// All pairs of the hub are updated with one `updateAll` transaction, at the
+// same time before the rebase as separate oracles. Each pair has its own
+// update time, the transaction is sent when any of the `pairs` is due.
+async function oracleHubTick(
+  hre: HardhatRuntimeEnvironment,
+  oracleHubAddress: string,
+  pairs: string[],
+  emissionManager: Contract,
+  dry: boolean
+) {
+  log("+++++++++++++");
+  log(`Processing OracleHub ${oracleHubAddress} for pairs ${pairs}`);
+  const oracleHub = new Contract(
+    oracleHubAddress,
+    (await hre.artifacts.readArtifact("OracleHub")).abi,
+    hre.ethers.provider
+  );
+  const start = (await oracleHub.start()).toNumber();
+  const now = Math.floor(new Date().getTime() / 1000);
+  if (start > now) {
+    log(`Starts at ${new Date(start * 1000)} - skipping`);
+    return;
+  }
+
+  const emissionManagerLastCalled = (
+    await emissionManager.lastCalled()
+  ).toNumber();
+  const emDebouncePeriod = (await emissionManager.debouncePeriod()).toNumber();
+  const oracleRebaseCallTime =
+    emissionManagerLastCalled + emDebouncePeriod - CALL_BEFORE_REBASE_SECS;
+  let updateBeforeRebase = false;
+  for (const pair of pairs) {
+    const nextUpdateTime = (await oracleHub.nextUpdateTime(pair)).toNumber();
+    if (nextUpdateTime > now) {
+      log(
+        `Pair ${pair} update date \`${new Date(
+          nextUpdateTime * 1000
+        ).toISOString()}\` is in future. Skipping.`
+      );
+      continue;
+    }
+    const lastUpdated = (await oracleHub.lastUpdated(pair)).toNumber();
+    if (lastUpdated < oracleRebaseCallTime && now > oracleRebaseCallTime) {
+      updateBeforeRebase = true;
+    }
+  }
+  log(`Should update before rebase: ${updateBeforeRebase}`);
+  if (!updateBeforeRebase) {
+    return;
+  }
+
+  log(`Updating all OracleHub pairs`);
+  const tx = await oracleHub.populateTransaction.updateAll();
+  if (!dry) {
+    await sendTransactionWithIncreasedGas(hre, tx);
+  }
+  log(`Updated`);
+}
+
 async function sendTransactionWithIncreasedGas(
   hre: HardhatRuntimeEnvironment,
   tx: PopulatedTransaction
@@ -1,10 +1,13 @@
 import { BigNumber, ethers } from "ethers";
 import { readFileSync } from "fs";
-import { task } from "hardhat/config";
+import { task, types } from "hardhat/config";
 import { HardhatRuntimeEnvironment } from "hardhat/types";
 import { contractDeploy, findExistingContract } from "./contract";
+import { runPipeline, Step } from "./pipeline";
 import {
+  completeStep,
   getRegistryContract,
+  isStepCompleted,
   updateRegistry,
   writeIfMissing,
 } from "./registry";
@@ -24,6 +27,7 @@ import { tokenDeploy } from "./token";
 import { ETH, BTC, isProd, now, pairFor, sendTransaction } from "./utils";
 
 const DAY_TICK = 60; // for mainnet deploy set to 86400
+const DEPLOY_CONCURRENCY = 8;
 const T = Math.floor(new Date().getTime() / 1000);
 const VE_TOKEN_START = T;
 const ORACLE_START_DATE = T;
@@ -61,9 +65,16 @@ const INITIAL_KWBTC_LIQUIDITY = LP_KWBTC_WBTC_KWBTC_AMOUNT.add(
   BigNumber.from(1).mul(ETH)
 );
 
-task("deploy", "Deploys the system").setAction(async (_, hre) => {
-  await deploy(hre);
-});
+task("deploy", "Deploys the system")
+  .addOptionalParam(
+    "concurrency",
+    "Deploy steps running at the same time (1 to deploy step by step)",
+    DEPLOY_CONCURRENCY,
+    types.int
+  )
+  .setAction(async ({ concurrency }, hre) => {
+    await deploy(hre, concurrency);
+  });
 
 function trader(hre: HardhatRuntimeEnvironment) {
   return isProd(hre)
@@ -71,7 +82,10 @@ function trader(hre: HardhatRuntimeEnvironment) {
     : "0xac602665f618652d53565519eaf24d0326c2ec1a";
 }
 
-export async function deploy(hre: HardhatRuntimeEnvironment) {
+export async function deploy(
+  hre: HardhatRuntimeEnvironment,
+  concurrency: number = DEPLOY_CONCURRENCY
+) {
   console.log(`Deploying on network ${hre.network.name}`);
   console.log(
     process.env.REDEPLOY
@@ -79,18 +93,75 @@ export async function deploy(hre: HardhatRuntimeEnvironment) {
       : "Continuing previous deploy"
   );
 
-  await importExternalIntoRegistry(hre);
-  await deploySyntheticTokens(hre);
-  await deployKlonX(hre);
-  await deployVeKlonX(hre);
-  await deployFunds(hre);
-  await deployTreasury(hre, 1, TREASURY_START_DATE, EMISSION_MANAGER_PERIOD);
-  await deployTimelockAndMultisig(hre);
-  await deploySpecificPools(hre);
-  await deployBoardrooms(hre);
-  await setLinks(hre);
-  await addTokensToTokenManagerAndVeBoardroom(hre);
-  await transferOwnerships(hre);
+  const steps: Step[] = [
+    { name: "external", deps: [], run: () => importExternalIntoRegistry(hre) },
+    {
+      name: "syntheticTokens",
+      deps: ["external"],
+      run: () => deploySyntheticTokens(hre),
+    },
+    {
+      name: "syntheticLiquidity",
+      deps: ["syntheticTokens"],
+      run: () => addSyntheticLiquidity(hre),
+    },
+    {
+      name: "oracles",
+      deps: ["syntheticLiquidity"],
+      run: () => deployOracles(hre),
+    },
+    { name: "klonX", deps: ["syntheticTokens"], run: () => deployKlonX(hre) },
+    { name: "veKlonX", deps: ["klonX"], run: () => deployVeKlonX(hre) },
+    { name: "funds", deps: ["syntheticTokens"], run: () => deployFunds(hre) },
+    {
+      name: "treasury",
+      deps: [],
+      run: () =>
+        deployTreasury(hre, 1, TREASURY_START_DATE, EMISSION_MANAGER_PERIOD),
+    },
+    {
+      name: "timelockAndMultisig",
+      deps: [],
+      run: () => deployTimelockAndMultisig(hre),
+    },
+    {
+      name: "pools",
+      deps: ["klonX", "timelockAndMultisig"],
+      run: () => deploySpecificPools(hre),
+    },
+    {
+      name: "boardrooms",
+      deps: ["klonX", "veKlonX", "treasury", "timelockAndMultisig"],
+      run: () => deployBoardrooms(hre),
+    },
+    {
+      name: "links",
+      deps: ["funds", "pools", "boardrooms"],
+      run: () => setLinks(hre),
+    },
+    {
+      name: "managedTokens",
+      deps: ["links", "oracles"],
+      run: () => addTokensToTokenManagerAndVeBoardroom(hre),
+    },
+    {
+      name: "ownerships",
+      deps: ["managedTokens"],
+      run: () => transferOwnerships(hre),
+    },
+  ];
+  const start = Date.now();
+  const timings = await runPipeline(steps, {
+    concurrency,
+    isCompleted: (name) => isStepCompleted(hre, name),
+    complete: (name) => completeStep(hre, name),
+  });
+  const sequential = Object.values(timings).reduce((a, b) => a + b, 0);
+  console.log(
+    `Deployed in ${(Date.now() - start) / 1000}s, steps took ${
+      sequential / 1000
+    }s in total`
+  );
 }
 
 async function deployTimelockAndMultisig(hre: HardhatRuntimeEnvironment) {
@@ -119,76 +190,99 @@ async function deployTimelockAndMultisig(hre: HardhatRuntimeEnvironment) {
 async function deploySyntheticTokens(hre: HardhatRuntimeEnvironment) {
   const initialExternalLiquidity = ETH.mul(1000000);
   const [op] = await hre.ethers.getSigners();
-  const kwbtc = await tokenDeploy(hre, "KWBTC", "KWBTC");
-  const kbwbtc = await tokenDeploy(hre, "KB-WBTC", "KB-WBTC");
-  const wbtc = await tokenDeploy(hre, "WBTC", "WBTC", 8);
-  const kxusd = await tokenDeploy(hre, "KXUSD", "KXUSD");
-  const kbusd = await tokenDeploy(hre, "KB-USD", "KB-USD");
-  const dai = await tokenDeploy(hre, "DAI", "DAI");
+  await Promise.all([
+    tokenDeploy(hre, "KWBTC", "KWBTC"),
+    tokenDeploy(hre, "KB-WBTC", "KB-WBTC"),
+    tokenDeploy(hre, "WBTC", "WBTC", 8),
+    tokenDeploy(hre, "KXUSD", "KXUSD"),
+    tokenDeploy(hre, "KB-USD", "KB-USD"),
+    tokenDeploy(hre, "DAI", "DAI"),
+  ]);
   if (!isProd(hre)) {
+    const mints = [];
     for (const address of [op.address, ...EXTERNAL_TESTERS]) {
-      await mint(
-        hre,
-        "WBTC",
-        address,
-        initialExternalLiquidity.div(BigNumber.from(10).pow(10))
+      mints.push(
+        mint(
+          hre,
+          "WBTC",
+          address,
+          initialExternalLiquidity.div(BigNumber.from(10).pow(10))
+        ),
+        mint(hre, "DAI", address, initialExternalLiquidity),
+        mint(hre, "KWBTC", address, initialExternalLiquidity),
+        mint(hre, "KXUSD", address, initialExternalLiquidity)
       );
-      await mint(hre, "DAI", address, initialExternalLiquidity);
-      await mint(hre, "KWBTC", address, initialExternalLiquidity);
-      await mint(hre, "KXUSD", address, initialExternalLiquidity);
     }
+    await Promise.all(mints);
   } else {
-    await mint(hre, "KWBTC", op.address, INITIAL_KWBTC_LIQUIDITY);
-    await mint(hre, "KXUSD", op.address, INITIAL_KXUSD_LIQUIDITY);
+    await Promise.all([
+      mint(hre, "KWBTC", op.address, INITIAL_KWBTC_LIQUIDITY),
+      mint(hre, "KXUSD", op.address, INITIAL_KXUSD_LIQUIDITY),
+    ]);
   }
+}
+
+async function addSyntheticLiquidity(hre: HardhatRuntimeEnvironment) {
+  const [op] = await hre.ethers.getSigners();
+  const wbtc = await findExistingContract(hre, "WBTC");
+  const dai = await findExistingContract(hre, "DAI");
   const wbtcBalance = await wbtc.balanceOf(op.address);
   if (wbtcBalance < LP_KWBTC_WBTC_WBTC_AMOUNT) {
     throw new Error(
       `LP-KWBTC-WBTC: Current WBTC balance \`${wbtcBalance}\` < required Uniswap balance \`${LP_KLONX_WBTC_WBTC_AMOUNT}\``
     );
   }
-  await addLiquidity(
-    hre,
-    "KWBTC",
-    "WBTC",
-    BigNumber.from(LP_KWBTC_WBTC_KWBTC_AMOUNT),
-    BigNumber.from(LP_KWBTC_WBTC_WBTC_AMOUNT)
-  );
-
   const daiBalance = await dai.balanceOf(op.address);
   if (daiBalance < LP_KXUSD_DAI_DAI_AMOUNT) {
     throw new Error(
       `LP-KXUSD-DAI: Current DAI balance \`${daiBalance}\` < required Uniswap balance \`${LP_KXUSD_DAI_DAI_AMOUNT}\``
     );
   }
-  await addLiquidity(
-    hre,
-    "KXUSD",
-    "DAI",
-    BigNumber.from(LP_KXUSD_DAI_KXUSD_AMOUNT),
-    BigNumber.from(LP_KXUSD_DAI_DAI_AMOUNT)
-  );
+  await Promise.all([
+    addLiquidity(
+      hre,
+      "KWBTC",
+      "WBTC",
+      BigNumber.from(LP_KWBTC_WBTC_KWBTC_AMOUNT),
+      BigNumber.from(LP_KWBTC_WBTC_WBTC_AMOUNT)
+    ),
+    addLiquidity(
+      hre,
+      "KXUSD",
+      "DAI",
+      BigNumber.from(LP_KXUSD_DAI_KXUSD_AMOUNT),
+      BigNumber.from(LP_KXUSD_DAI_DAI_AMOUNT)
+    ),
+  ]);
+}
 
-  await contractDeploy(
-    hre,
-    "Oracle",
-    "KWBTCWBTCOracle",
-    UNISWAP_V2_FACTORY_ADDRESS,
-    kwbtc.address,
-    wbtc.address,
-    ORACLE_PERIOD,
-    ORACLE_START_DATE
-  );
-  await contractDeploy(
-    hre,
-    "Oracle",
-    "KXUSDDAIOracle",
-    UNISWAP_V2_FACTORY_ADDRESS,
-    kxusd.address,
-    dai.address,
-    ORACLE_PERIOD,
-    ORACLE_START_DATE
-  );
+async function deployOracles(hre: HardhatRuntimeEnvironment) {
+  const kwbtc = await findExistingContract(hre, "KWBTC");
+  const wbtc = await findExistingContract(hre, "WBTC");
+  const kxusd = await findExistingContract(hre, "KXUSD");
+  const dai = await findExistingContract(hre, "DAI");
+  await Promise.all([
+    contractDeploy(
+      hre,
+      "Oracle",
+      "KWBTCWBTCOracle",
+      UNISWAP_V2_FACTORY_ADDRESS,
+      kwbtc.address,
+      wbtc.address,
+      ORACLE_PERIOD,
+      ORACLE_START_DATE
+    ),
+    contractDeploy(
+      hre,
+      "Oracle",
+      "KXUSDDAIOracle",
+      UNISWAP_V2_FACTORY_ADDRESS,
+      kxusd.address,
+      dai.address,
+      ORACLE_PERIOD,
+      ORACLE_START_DATE
+    ),
+  ]);
 }
 
 async function deployFunds(hre: HardhatRuntimeEnvironment) {
@@ -196,15 +290,17 @@ async function deployFunds(hre: HardhatRuntimeEnvironment) {
   const wbtc = await findExistingContract(hre, "WBTC");
   const kxusd = await findExistingContract(hre, "KXUSD");
   const dai = await findExistingContract(hre, "DAI");
-  await contractDeploy(
-    hre,
-    "StabFund",
-    "StabFundV1",
-    UNISWAP_V2_ROUTER_ADDRESS,
-    [kwbtc.address, wbtc.address, kxusd.address, dai.address],
-    [trader(hre)]
-  );
-  await contractDeploy(hre, "DevFund", "DevFundV1");
+  await Promise.all([
+    contractDeploy(
+      hre,
+      "StabFund",
+      "StabFundV1",
+      UNISWAP_V2_ROUTER_ADDRESS,
+      [kwbtc.address, wbtc.address, kxusd.address, dai.address],
+      [trader(hre)]
+    ),
+    contractDeploy(hre, "DevFund", "DevFundV1"),
+  ]);
 }
 
 async function transferPoolOwnership(
@@ -246,28 +342,32 @@ async function transferPoolOwnership(
 }
 
 async function transferOwnerships(hre: HardhatRuntimeEnvironment) {
-  await transferFullOwnership(hre, "KlonX", "Timelock");
-  await transferFullOwnership(hre, "KXUSD", "TokenManagerV1");
-  await transferFullOwnership(hre, "KWBTC", "TokenManagerV1");
-  await transferFullOwnership(hre, "KB-USD", "BondManagerV1");
-  await transferFullOwnership(hre, "KB-WBTC", "BondManagerV1");
-
-  await transferPoolOwnership(hre, "KlonXWBTCLPKlonXPool", "MultiSigWallet");
-  await transferPoolOwnership(hre, "KWBTCWBTCLPKlonXPool", "MultiSigWallet");
-  await transferPoolOwnership(hre, "KXUSDDAILPKlonXPool", "MultiSigWallet");
-  await transferOperator(hre, "LiquidBoardroomV1", "MultiSigWallet");
-  await transferOwnership(hre, "LiquidBoardroomV1", "Timelock");
-  await transferOperator(hre, "UniswapBoardroomV1", "MultiSigWallet");
-  await transferOwnership(hre, "UniswapBoardroomV1", "Timelock");
-  await transferOperator(hre, "TokenManagerV1", "MultiSigWallet");
-  await transferOwnership(hre, "TokenManagerV1", "Timelock");
-  await transferOperator(hre, "BondManagerV1", "MultiSigWallet");
-  await transferOwnership(hre, "BondManagerV1", "Timelock");
-  await transferOperator(hre, "EmissionManagerV1", "MultiSigWallet");
-  await transferOwnership(hre, "EmissionManagerV1", "Timelock");
-  await transferOperator(hre, "StabFundV1", "MultiSigWallet");
-  await transferOwnership(hre, "StabFundV1", "Timelock");
+  // transfers of different contracts don't depend on each other
+  await Promise.all([
+    transferFullOwnership(hre, "KlonX", "Timelock"),
+    transferFullOwnership(hre, "KXUSD", "TokenManagerV1"),
+    transferFullOwnership(hre, "KWBTC", "TokenManagerV1"),
+    transferFullOwnership(hre, "KB-USD", "BondManagerV1"),
+    transferFullOwnership(hre, "KB-WBTC", "BondManagerV1"),
+    transferPoolOwnership(hre, "KlonXWBTCLPKlonXPool", "MultiSigWallet"),
+    transferPoolOwnership(hre, "KWBTCWBTCLPKlonXPool", "MultiSigWallet"),
+    transferPoolOwnership(hre, "KXUSDDAILPKlonXPool", "MultiSigWallet"),
+    ...[
+      "LiquidBoardroomV1",
+      "UniswapBoardroomV1",
+      "TokenManagerV1",
+      "BondManagerV1",
+      "EmissionManagerV1",
+      "StabFundV1",
+    ].map(async (name) => {
+      await transferOperator(hre, name, "MultiSigWallet");
+      await transferOwnership(hre, name, "Timelock");
+    }),
+    transferVeAdmins(hre),
+  ]);
+}
 
+async function transferVeAdmins(hre: HardhatRuntimeEnvironment) {
   const veKlonX = await findExistingContract(hre, "VeKlonX");
   const timelock = await getRegistryContract(hre, "Timelock");
   const veKlonXOwner = await veKlonX.admin();
@@ -513,32 +613,34 @@ async function deployBoardrooms(hre: HardhatRuntimeEnvironment) {
   const veklonx = await findExistingContract(hre, "VeKlonX");
   const timelock = await getRegistryContract(hre, "Timelock");
 
-  await contractDeploy(
-    hre,
-    "LiquidBoardroom",
-    "LiquidBoardroomV1",
-    klonx.address,
-    tokenManager.address,
-    emissionManager.address,
-    BOARDROOM_START_DATE
-  );
-  await contractDeploy(
-    hre,
-    "UniswapBoardroom",
-    "UniswapBoardroomV1",
-    pairFor(UNISWAP_V2_FACTORY_ADDRESS, klonx.address, wbtc.address),
-    tokenManager.address,
-    emissionManager.address,
-    BOARDROOM_START_DATE
-  );
-  await contractDeploy(
-    hre,
-    "VeBoardroom",
-    "VeBoardroomV1",
-    veklonx.address,
-    op.address,
-    timelock.address
-  );
+  await Promise.all([
+    contractDeploy(
+      hre,
+      "LiquidBoardroom",
+      "LiquidBoardroomV1",
+      klonx.address,
+      tokenManager.address,
+      emissionManager.address,
+      BOARDROOM_START_DATE
+    ),
+    contractDeploy(
+      hre,
+      "UniswapBoardroom",
+      "UniswapBoardroomV1",
+      pairFor(UNISWAP_V2_FACTORY_ADDRESS, klonx.address, wbtc.address),
+      tokenManager.address,
+      emissionManager.address,
+      BOARDROOM_START_DATE
+    ),
+    contractDeploy(
+      hre,
+      "VeBoardroom",
+      "VeBoardroomV1",
+      veklonx.address,
+      op.address,
+      timelock.address
+    ),
+  ]);
 }
 
 async function deploySpecificPools(hre: HardhatRuntimeEnvironment) {
@@ -549,38 +651,24 @@ async function deploySpecificPools(hre: HardhatRuntimeEnvironment) {
   const wbtc = await findExistingContract(hre, "WBTC");
   const multisig = await getRegistryContract(hre, "MultiSigWallet");
   const [op] = await hre.ethers.getSigners();
-  await contractDeploy(
-    hre,
-    "RewardsPool",
-    "KlonXWBTCLPKlonXPool",
-    "KlonXWBTCLPKlonXPool",
-    op.address,
-    multisig.address,
-    klonx.address,
-    pairFor(UNISWAP_V2_FACTORY_ADDRESS, klonx.address, wbtc.address),
-    REWARDS_POOL_INITIAL_DURATION
-  );
-  await contractDeploy(
-    hre,
-    "RewardsPool",
-    "KWBTCWBTCLPKlonXPool",
-    "KWBTCWBTCLPKlonXPool",
-    op.address,
-    multisig.address,
-    klonx.address,
-    pairFor(UNISWAP_V2_FACTORY_ADDRESS, kwbtc.address, wbtc.address),
-    REWARDS_POOL_INITIAL_DURATION
-  );
-  await contractDeploy(
-    hre,
-    "RewardsPool",
-    "KXUSDDAILPKlonXPool",
-    "KXUSDDAILPKlonXPool",
-    op.address,
-    multisig.address,
-    klonx.address,
-    pairFor(UNISWAP_V2_FACTORY_ADDRESS, kxusd.address, dai.address),
-    REWARDS_POOL_INITIAL_DURATION
+  await Promise.all(
+    [
+      ["KlonXWBTCLPKlonXPool", klonx, wbtc],
+      ["KWBTCWBTCLPKlonXPool", kwbtc, wbtc],
+      ["KXUSDDAILPKlonXPool", kxusd, dai],
+    ].map(([name, tokenA, tokenB]: any[]) =>
+      contractDeploy(
+        hre,
+        "RewardsPool",
+        name,
+        name,
+        op.address,
+        multisig.address,
+        klonx.address,
+        pairFor(UNISWAP_V2_FACTORY_ADDRESS, tokenA.address, tokenB.address),
+        REWARDS_POOL_INITIAL_DURATION
+      )
+    )
   );
 }
 
@@ -642,9 +730,11 @@ async function deployKlonX(hre: HardhatRuntimeEnvironment) {
   }
   await tokenDeploy(hre, "KlonX", "KlonX");
   if (!isProd(hre)) {
-    for (const address of [op.address, ...EXTERNAL_TESTERS]) {
-      await mint(hre, "KlonX", address, ETH.mul(1000000000));
-    }
+    await Promise.all(
+      [op.address, ...EXTERNAL_TESTERS].map((address) =>
+        mint(hre, "KlonX", address, ETH.mul(1000000000))
+      )
+    );
   }
   await mint(hre, "KlonX", op.address, ETH);
   await addLiquidity(
@@ -80,14 +80,21 @@ task("timelock:generate:migration")
   .addParam("eta", "Time for execution in secs", undefined, types.int)
   .addParam(
     "method",
-    "Timelock method: queueTransaction | executeTransaction",
+    "Timelock method: queueTransaction | executeTransaction | queueTransactions | executeTransactions",
     undefined,
     types.string
   )
   .setAction(async ({ eta, method }, hre) => {
-    if (method !== "queueTransaction" && method !== "executeTransaction") {
+    if (
+      ![
+        "queueTransaction",
+        "executeTransaction",
+        "queueTransactions",
+        "executeTransactions",
+      ].includes(method)
+    ) {
       console.log(
-        "Method must be either queueTransaction or executeTransaction"
+        "Method must be one of queueTransaction, executeTransaction, queueTransactions or executeTransactions"
       );
       return;
     }
@@ -97,28 +104,25 @@ task("timelock:generate:migration")
     const kbtc = contracts["KWBTC"];
     const klon = contracts["Klon"];
     const tokenManager = contracts["TokenManagerV1"];
+    const calls: TimelockCall[] = [
+      ["Treasury", "migrate", [bondManager.address]],
+      [
+        "BondManagerV1",
+        "migrateOwnership",
+        [[kbtc.address], tokenManager.address],
+      ],
+      ["BondManagerV1", "migrateOwnership", [[klon.address], timelock.address]],
+    ];
     console.log("Contract:");
     console.log(getMultisig(hre));
     console.log("-----------------------");
-    await printTimelockGenerate(hre, method, eta, "Treasury", "migrate", [
-      bondManager.address,
-    ]);
-    await printTimelockGenerate(
-      hre,
-      method,
-      eta,
-      "BondManagerV1",
-      "migrateOwnership",
-      [[kbtc.address], tokenManager.address]
-    );
-    await printTimelockGenerate(
-      hre,
-      method,
-      eta,
-      "BondManagerV1",
-      "migrateOwnership",
-      [[klon.address], timelock.address]
-    );
+    if (method.endsWith("Transactions")) {
+      await printTimelockGenerateBatch(hre, method, eta, calls);
+      return;
+    }
+    for (const [name, methodName, args] of calls) {
+      await printTimelockGenerate(hre, method, eta, name, methodName, args);
+    }
   });
 
 task("multisig:generate:distribute")
@@ -255,6 +259,75 @@ async function timelockGenerate(
   return { calldata: data, address: timelock.address, signature };
 }
 
+type TimelockCall = [string, string, any[]];
+
+async function printTimelockGenerateBatch(
+  hre: HardhatRuntimeEnvironment,
+  timelockMethod: string,
+  eta: number,
+  calls: TimelockCall[]
+) {
+  const { calldata, address, signatures } = await timelockGenerateBatch(
+    hre,
+    timelockMethod,
+    eta,
+    calls
+  );
+  // the reason is already logged by timelockGenerateBatch
+  if (!calldata || !signatures) {
+    return;
+  }
+  console.log("Methods:");
+  calls.forEach(([name], i) => console.log(`${name}#${signatures[i]}`));
+  console.log("Address:");
+  console.log(address);
+  console.log(`Data:`);
+  console.log(calldata);
+  console.log("-----------------------");
+}
+
+// Calldata for `queueTransactions` / `executeTransactions`, i.e. all calls
+// in one Timelock transaction with one eta
+async function timelockGenerateBatch(
+  hre: HardhatRuntimeEnvironment,
+  timelockMethod: string,
+  eta: number,
+  calls: TimelockCall[]
+) {
+  const contracts = getMergedContracts(hre) as any;
+  const timelock = new ethers.Contract(
+    contracts["Timelock"].address,
+    contracts["Timelock"].abi
+  );
+  const targets = [];
+  const signatures = [];
+  const datas = [];
+  for (const [name, methodName, args] of calls) {
+    const { address, calldata, signature } = await getCallData(
+      hre,
+      name,
+      methodName,
+      args
+    );
+    if (!calldata) {
+      console.log(`Could not create calldata for ${name}#${methodName}`);
+      return {};
+    }
+    targets.push(address);
+    signatures.push(signature);
+    datas.push(`0x${calldata.slice(10)}`); //remove method hash
+  }
+
+  const method = timelock.populateTransaction[timelockMethod];
+  if (!method) {
+    console.log(`Method ${timelockMethod} not found on Timelock`);
+    return {};
+  }
+  const values = calls.map(() => 0);
+  const data = (await method(targets, values, signatures, datas, eta)).data;
+  return { calldata: data, address: timelock.address, signatures };
+}
+
 function getMergedContracts(hre: HardhatRuntimeEnvironment) {
   const deploymentsV1Kovan = require("../tmp/deployments.v1.kovan.json");
   const deploymentsV1Mainnet = require("../tmp/deployments.v1.mainnet.json");
@@ -0,0 +1,119 @@
+import { log } from "./utils";
+
+// A unit of a deployment, runs once all its dependencies are completed
+export type Step = {
+  name: string;
+  deps: string[];
+  run: () => Promise<void>;
+};
+
+export type PipelineOptions = {
+  // Steps running at the same time at most
+  concurrency: number;
+  // Checks if the step was completed by a previous run
+  isCompleted: (name: string) => boolean;
+  // Checkpoints a completed step
+  complete: (name: string) => void;
+};
+
+// Fails on unknown dependencies and dependency cycles
+function checkSteps(steps: Step[]) {
+  const index: { [name: string]: Step } = {};
+  for (const step of steps) {
+    if (index[step.name]) {
+      throw `Step \`${step.name}\` is defined twice`;
+    }
+    index[step.name] = step;
+  }
+  const state: { [name: string]: "visiting" | "visited" } = {};
+  const visit = (step: Step, path: string[]) => {
+    if (state[step.name] === "visited") {
+      return;
+    }
+    if (state[step.name] === "visiting") {
+      throw `Steps have a dependency cycle: ${[...path, step.name].join(
+        " -> "
+      )}`;
+    }
+    state[step.name] = "visiting";
+    for (const dep of step.deps) {
+      if (!index[dep]) {
+        throw `Step \`${step.name}\` depends on unknown step \`${dep}\``;
+      }
+      visit(index[dep], [...path, step.name]);
+    }
+    state[step.name] = "visited";
+  };
+  for (const step of steps) {
+    visit(step, []);
+  }
+}
+
+// Runs steps as soon as their dependencies are completed, skipping the ones
+// completed before, and returns the time each step took in ms. After a failure
+// no new steps are started, the running ones are awaited and checkpointed, so
+// the next run resumes from the failed step.
+export async function runPipeline(
+  steps: Step[],
+  options: PipelineOptions
+): Promise<{ [name: string]: number }> {
+  checkSteps(steps);
+  const completed = new Set<string>();
+  for (const step of steps) {
+    if (options.isCompleted(step.name)) {
+      log(`Step \`${step.name}\` is already completed. Skipping...`);
+      completed.add(step.name);
+    }
+  }
+  const pending = steps.filter((step) => !completed.has(step.name));
+  const running = new Map<string, Promise<void>>();
+  const timings: { [name: string]: number } = {};
+  let failure: any = undefined;
+
+  const start = (step: Step) => {
+    log(`Starting step \`${step.name}\``);
+    const startedAt = Date.now();
+    const promise = step
+      .run()
+      .then(
+        () => {
+          timings[step.name] = Date.now() - startedAt;
+          completed.add(step.name);
+          options.complete(step.name);
+          log(
+            `Step \`${step.name}\` completed in ${timings[step.name] / 1000}s`
+          );
+        },
+        (e) => {
+          log(`Step \`${step.name}\` failed: ${e}`);
+          failure = failure || e;
+        }
+      )
+      .then(() => {
+        running.delete(step.name);
+      });
+    running.set(step.name, promise);
+  };
+
+  while (pending.length > 0 || running.size > 0) {
+    if (failure === undefined) {
+      for (const step of pending.slice()) {
+        if (running.size >= options.concurrency) {
+          break;
+        }
+        if (step.deps.every((dep) => completed.has(dep))) {
+          pending.splice(pending.indexOf(step), 1);
+          start(step);
+        }
+      }
+    }
+    if (running.size === 0) {
+      break;
+    }
+    await Promise.race(running.values());
+  }
+  if (failure !== undefined) {
+    throw failure;
+  }
+  return timings;
+}
@@ -1,4 +1,5 @@
 import {
+  existsSync,
   mkdirSync,
   readdirSync,
   readFileSync,
@@ -7,6 +8,10 @@ import {
 } from "fs";
 import { HardhatRuntimeEnvironment } from "hardhat/types";
 import { resolve } from "path";
+const STEPS = {
+  data: {} as { [name: string]: string },
+  initialized: false,
+};
 const REGISTRY = {
   data: {} as { [key: string]: any },
   index: {} as { [key: string]: any },
@@ -24,7 +29,8 @@ export function initRegistry(hre: HardhatRuntimeEnvironment) {
   } catch (e) {}
 
   const files = readdirSync(root).map((f) => resolve(root, f));
-  if (!files || !files.length) {
+  // the directory can hold only deploy step checkpoints
+  if (!files || !files.length || !existsSync(resolve(root, "latest.json"))) {
     REGISTRY.initialized = true;
     return;
   }
@@ -90,3 +96,32 @@ export function writeIfMissing(
     updateRegistry(hre, registryName, defaultValue);
   }
 }
+
+function stepsPath(hre: HardhatRuntimeEnvironment) {
+  return resolve(__dirname, "..", "registry", hre.network.name, "steps.json");
+}
+
+function initSteps(hre: HardhatRuntimeEnvironment) {
+  if (STEPS.initialized) {
+    return;
+  }
+  STEPS.initialized = true;
+  if (process.env["REDEPLOY"] || !existsSync(stepsPath(hre))) {
+    return;
+  }
+  STEPS.data = JSON.parse(readFileSync(stepsPath(hre)).toString());
+}
+
+// Checks if a deploy step was completed by this or a previous run
+export function isStepCompleted(hre: HardhatRuntimeEnvironment, name: string) {
+  initSteps(hre);
+  return Boolean(STEPS.data[name]);
+}
+
+// Checkpoints a completed deploy step next to the registry
+export function completeStep(hre: HardhatRuntimeEnvironment, name: string) {
+  initSteps(hre);
+  STEPS.data[name] = new Date().toISOString();
+  mkdirSync(resolve(stepsPath(hre), ".."), { recursive: true });
+  writeFileSync(stepsPath(hre), JSON.stringify(STEPS.data, null, 2));
+}
@@ -10,25 +10,22 @@ export async function deployTreasury(
   debouncePeriod: number
 ) {
   const factory = await getUniswapFactory(hre);
-  const tokenManager = await contractDeploy(
-    hre,
-    "TokenManager",
-    `TokenManagerV${version}`,
-    factory.address
-  );
-  const bondManager = await contractDeploy(
-    hre,
-    "BondManager",
-    `BondManagerV${version}`,
-    start
-  );
-  const emissionManager = await contractDeploy(
-    hre,
-    "EmissionManager",
-    `EmissionManagerV${version}`,
-    start,
-    debouncePeriod
-  );
+  await Promise.all([
+    contractDeploy(
+      hre,
+      "TokenManager",
+      `TokenManagerV${version}`,
+      factory.address
+    ),
+    contractDeploy(hre, "BondManager", `BondManagerV${version}`, start),
+    contractDeploy(
+      hre,
+      "EmissionManager",
+      `EmissionManagerV${version}`,
+      start,
+      debouncePeriod
+    ),
+  ]);
 }
 
 export async function setTreasuryLinks(
@@ -57,9 +57,27 @@ export async function getUniswapRouter(
   );
 }
 
+// Approvals in progress by token, concurrent deploy steps can share a token
+const APPROVING: { [address: string]: Promise<void> } = {};
+
 export async function approveUniswap(
   hre: HardhatRuntimeEnvironment,
   registryNameOrAddressToken: string
+) {
+  const key = registryNameOrAddressToken.toLowerCase();
+  if (!APPROVING[key]) {
+    APPROVING[key] = sendApproval(hre, registryNameOrAddressToken).finally(
+      () => {
+        delete APPROVING[key];
+      }
+    );
+  }
+  await APPROVING[key];
+}
+
+async function sendApproval(
+  hre: HardhatRuntimeEnvironment,
+  registryNameOrAddressToken: string
 ) {
   const [operator] = await hre.ethers.getSigners();
   const tokenRegistry = getRegistryContract(hre, registryNameOrAddressToken);
@@ -75,7 +93,11 @@ export async function approveUniswap(
     console.log("Allowance is set, skipping...");
     return;
   }
-  await token.approve(router.address, hre.ethers.constants.MaxUint256);
+  const tx = await token.populateTransaction.approve(
+    router.address,
+    hre.ethers.constants.MaxUint256
+  );
+  await sendTransaction(hre, tx);
   console.log("Done");
 }
 
@@ -1,4 +1,4 @@
-import { BigNumber, PopulatedTransaction } from "ethers";
+import { BigNumber, PopulatedTransaction, providers, Signer } from "ethers";
 import { keccak256 } from "ethers/lib/utils";
 import { HardhatRuntimeEnvironment } from "hardhat/types";
 
@@ -10,18 +10,82 @@ export async function now(hre: HardhatRuntimeEnvironment): Promise<number> {
   return timestamp;
 }
 
+// Confirmations to wait for, local chains don't mine blocks without transactions
+export function confirmations(hre: HardhatRuntimeEnvironment) {
+  return ["hardhat", "dev", "localhost"].includes(hre.network.name) ? 1 : 2;
+}
+
+// Transactions of a sender are signed and sent one at a time, so that they
+// reach the node in nonce order. Senders are kept per provider, the same
+// address can send on several networks in one process (e.g. in tests).
+type Senders = {
+  // last transaction of each sender, sent or failed
+  queues: { [address: string]: Promise<unknown> };
+  // next nonce of each sender, the first transaction reads it from the node
+  nonces: { [address: string]: number };
+};
+const SENDERS = new WeakMap<providers.Provider, Senders>();
+
+function senders(signer: Signer): Senders {
+  if (!signer.provider) {
+    throw "Signer is not connected to a provider";
+  }
+  let result = SENDERS.get(signer.provider);
+  if (!result) {
+    result = { queues: {}, nonces: {} };
+    SENDERS.set(signer.provider, result);
+  }
+  return result;
+}
+
+// Sends a transaction with a locally counted nonce without waiting for it
+export async function submitTransactionFrom(
+  signer: Signer,
+  tx: PopulatedTransaction | providers.TransactionRequest
+): Promise<providers.TransactionResponse> {
+  const { queues, nonces } = senders(signer);
+  // estimated before queueing, a failed estimate doesn't hold up the sender
+  const gasLimit = tx.gasLimit || (await signer.estimateGas(tx));
+  const key = (await signer.getAddress()).toLowerCase();
+  const send = async () => {
+    const nonce =
+      key in nonces ? nonces[key] : await signer.getTransactionCount("pending");
+    try {
+      const response = await signer.sendTransaction({ ...tx, gasLimit, nonce });
+      nonces[key] = nonce + 1;
+      return response;
+    } catch (e) {
+      // nothing else of the sender is in flight, so the node's count is exact
+      delete nonces[key];
+      throw e;
+    }
+  };
+  const response = (queues[key] || Promise.resolve()).then(send);
+  // the next transaction waits until this one is sent or has failed
+  queues[key] = response.catch(() => undefined);
+  return response;
+}
+
+// Sends a transaction from the operator, see `submitTransactionFrom`
+export async function submitTransaction(
+  hre: HardhatRuntimeEnvironment,
+  tx: PopulatedTransaction | providers.TransactionRequest
+): Promise<providers.TransactionResponse> {
+  const [operator] = await hre.ethers.getSigners();
+  return submitTransactionFrom(operator, tx);
+}
+
 export async function sendTransaction(
   hre: HardhatRuntimeEnvironment,
   tx: PopulatedTransaction
 ) {
   console.log("Sending transaction to the pool...");
 
-  const [operator] = await hre.ethers.getSigners();
-  const txResp = await operator.sendTransaction(tx);
+  const txResp = await submitTransaction(hre, tx);
   console.log(
     `Sent transaction with hash \`${txResp.hash}\`. Waiting confirmation`
   );
-  await txResp.wait(2);
+  await txResp.wait(confirmations(hre));
   console.log("Transaction confirmed");
 }
 
@@ -0,0 +1,202 @@
+import { expect } from "chai";
+import { Contract, ContractFactory, Signer } from "ethers";
+import { ethers } from "hardhat";
+
+describe("MultiSigWallet", () => {
+  let MultiSigWallet: ContractFactory;
+  let wallet: Contract;
+  let alice: Signer;
+  let bob: Signer;
+  let charlie: Signer;
+  let dave: Signer;
+  let destination: string;
+  before(async () => {
+    MultiSigWallet = await ethers.getContractFactory("MultiSigWallet");
+    [alice, bob, charlie, dave] = (await ethers.getSigners()).slice(1);
+    destination = await dave.getAddress();
+  });
+  beforeEach(async () => {
+    const owners = await Promise.all(
+      [alice, bob, charlie].map((s) => s.getAddress())
+    );
+    wallet = await MultiSigWallet.deploy(owners, 2);
+  });
+
+  async function submit(from: Signer = alice) {
+    const id = await wallet.transactionCount();
+    await wallet.connect(from).submitTransaction(destination, 0, "0x");
+    return id.toNumber();
+  }
+
+  async function execute(from: Signer = alice) {
+    const id = await submit(from);
+    await wallet.connect(bob).confirmTransaction(id);
+    return id;
+  }
+
+  function ids(values: any[]) {
+    return values.map((v) => v.toNumber());
+  }
+
+  describe("#confirmations", () => {
+    it("counts confirmations of owners", async () => {
+      const id = await submit();
+      expect(await wallet.confirmations(id, await alice.getAddress())).to.eq(
+        true
+      );
+      expect(await wallet.confirmations(id, await bob.getAddress())).to.eq(
+        false
+      );
+      expect(await wallet.getConfirmationCount(id)).to.eq(1);
+      expect(await wallet.isConfirmed(id)).to.eq(false);
+      expect(await wallet.getConfirmations(id)).to.eql([
+        await alice.getAddress(),
+      ]);
+    });
+    it("executes at the required number of confirmations", async () => {
+      const id = await execute();
+      expect(await wallet.getConfirmationCount(id)).to.eq(2);
+      expect(await wallet.isConfirmed(id)).to.eq(true);
+      expect((await wallet.transactions(id)).executed).to.eq(true);
+    });
+    it("does not count revoked confirmations", async () => {
+      const id = await submit();
+      await wallet.connect(alice).revokeConfirmation(id);
+      expect(await wallet.getConfirmationCount(id)).to.eq(0);
+      await expect(wallet.connect(alice).revokeConfirmation(id)).to.be
+        .reverted;
+    });
+    it("does not count confirmations of removed owners", async () => {
+      const id = await submit();
+      const data = wallet.interface.encodeFunctionData("removeOwner", [
+        await alice.getAddress(),
+      ]);
+      await wallet.connect(bob).submitTransaction(wallet.address, 0, data);
+      await wallet.connect(charlie).confirmTransaction(id + 1);
+      expect(await wallet.isOwner(await alice.getAddress())).to.eq(false);
+      expect(await wallet.getConfirmationCount(id)).to.eq(0);
+      expect(await wallet.getConfirmations(id)).to.eql([]);
+    });
+    it("does not give confirmations of a replaced owner to the new one", async () => {
+      const id = await submit();
+      const data = wallet.interface.encodeFunctionData("replaceOwner", [
+        await alice.getAddress(),
+        destination,
+      ]);
+      await wallet.connect(bob).submitTransaction(wallet.address, 0, data);
+      await wallet.connect(charlie).confirmTransaction(id + 1);
+      expect(await wallet.getConfirmationCount(id)).to.eq(0);
+      await wallet.connect(dave).confirmTransaction(id);
+      expect(await wallet.getConfirmations(id)).to.eql([destination]);
+    });
+  });
+
+  describe("#getTransactionIds", () => {
+    it("lists pending and executed transactions", async () => {
+      const pending0 = await submit();
+      const executed = await execute();
+      const pending1 = await submit();
+      const pending2 = await submit();
+      await wallet.connect(bob).confirmTransaction(pending0);
+
+      expect(await wallet.getTransactionCount(true, false)).to.eq(2);
+      expect(await wallet.getTransactionCount(false, true)).to.eq(2);
+      expect(await wallet.getTransactionCount(true, true)).to.eq(4);
+      expect(ids(await wallet.getTransactionIds(0, 2, true, false))).to.eql([
+        pending1,
+        pending2,
+      ]);
+      expect(ids(await wallet.getTransactionIds(1, 2, true, false))).to.eql([
+        pending2,
+      ]);
+      expect(ids(await wallet.getTransactionIds(0, 2, false, true))).to.eql([
+        pending0,
+        executed,
+      ]);
+      expect(ids(await wallet.getTransactionIds(1, 4, true, true))).to.eql([
+        1,
+        2,
+        3,
+      ]);
+      expect(ids(await wallet.getPendingTransactionIds())).to.eql([
+        pending1,
+        pending2,
+      ]);
+    });
+    it("keeps pending transactions in ascending order", async () => {
+      const pending = [await submit(), await submit(), await submit()];
+      await wallet.connect(bob).confirmTransaction(pending[1]);
+      const pending3 = await submit();
+      expect(ids(await wallet.getPendingTransactionIds())).to.eql([
+        pending[0],
+        pending[2],
+        pending3,
+      ]);
+      expect(ids(await wallet.getTransactionIds(1, 3, true, false))).to.eql([
+        pending[2],
+        pending3,
+      ]);
+    });
+    it("rejects ranges past the last transaction", async () => {
+      await submit();
+      await execute();
+      await expect(wallet.getTransactionIds(0, 3, true, true)).to.be.reverted;
+      await expect(wallet.getTransactionIds(0, 2, true, false)).to.be.reverted;
+    });
+    it("keeps failed executions pending", async () => {
+      const data = wallet.interface.encodeFunctionData("changeRequirement", [
+        10,
+      ]);
+      await wallet.connect(alice).submitTransaction(wallet.address, 0, data);
+      await wallet.connect(bob).confirmTransaction(0);
+      expect((await wallet.transactions(0)).executed).to.eq(false);
+      expect(ids(await wallet.getPendingTransactionIds())).to.eql([0]);
+    });
+  });
+
+  describe("1000 executed transactions", function () {
+    this.timeout(600000);
+    const PENDING = 5;
+
+    async function measure(id: number) {
+      const pendingCount = await wallet.getTransactionCount(true, false);
+      const calls: [string, any[]][] = [
+        ["isConfirmed", [id]],
+        ["getConfirmationCount", [id]],
+        ["getConfirmations", [id]],
+        ["getTransactionCount", [true, false]],
+        ["getTransactionIds", [0, pendingCount, true, false]],
+      ];
+      const result: { [name: string]: { gas: number; ms: number } } = {};
+      for (const [name, args] of calls) {
+        const gas = await wallet.estimateGas[name](...args);
+        const start = Date.now();
+        for (let i = 0; i < 20; i++) {
+          await wallet[name](...args);
+        }
+        result[name] = { gas: gas.toNumber(), ms: (Date.now() - start) / 20 };
+      }
+      return result;
+    }
+
+    it("views cost and take the same as with 10 executed transactions", async () => {
+      for (let i = 0; i < 10; i++) {
+        await execute();
+      }
+      const id = await submit();
+      for (let i = 1; i < PENDING; i++) {
+        await submit();
+      }
+      const small = await measure(id);
+      for (let i = 0; i < 1000; i++) {
+        await execute();
+      }
+      const large = await measure(id);
+      for (const name of Object.keys(small)) {
+        expect(large[name].gas).to.be.lte(small[name].gas * 1.05);
+        // wall-clock time of a local call is noisy, allow a few milliseconds
+        expect(large[name].ms).to.be.lte(small[name].ms * 1.5 + 5);
+      }
+    });
+  });
+});
@@ -0,0 +1,111 @@
+import { expect } from "chai";
+import { Contract, ContractFactory } from "ethers";
+import { ethers } from "hardhat";
+
+describe("Multicall", () => {
+  let Multicall: ContractFactory;
+  let SyntheticToken: ContractFactory;
+  let multicall: Contract;
+  let token: Contract;
+  const balanceOf = ethers.utils.id("balanceOf(address)").slice(0, 10);
+  before(async () => {
+    Multicall = await ethers.getContractFactory("Multicall");
+    SyntheticToken = await ethers.getContractFactory("SyntheticToken");
+  });
+  beforeEach(async () => {
+    multicall = await Multicall.deploy();
+    token = await SyntheticToken.deploy("Synth", "SYN", 18);
+  });
+
+  describe("#balancesOf", () => {
+    it("returns values for all accounts", async () => {
+      const [owner, alice, bob] = await ethers.getSigners();
+      await token.mint(alice.address, 12);
+      await token.mint(bob.address, 34);
+      const accounts = [alice.address, owner.address, bob.address];
+      const values = await multicall.balancesOf(
+        token.address,
+        balanceOf,
+        accounts
+      );
+      expect(values.map((v: any) => v.toNumber())).to.eql([12, 0, 34]);
+    });
+    it("fails when the call fails", async () => {
+      const [owner] = await ethers.getSigners();
+      await expect(
+        multicall.balancesOf(multicall.address, balanceOf, [owner.address])
+      ).to.be.revertedWith("Multicall: call failed");
+    });
+  });
+
+  describe("#balancesOfAt", () => {
+    it("passes the argument with every account", async () => {
+      const [owner, alice] = await ethers.getSigners();
+      await token.mint(alice.address, 12);
+      await token.approve(alice.address, 56);
+      const allowance = ethers.utils
+        .id("allowance(address,address)")
+        .slice(0, 10);
+      // an address is passed as a uint256 word here
+      const values = await multicall.balancesOfAt(
+        token.address,
+        allowance,
+        [owner.address, alice.address],
+        alice.address
+      );
+      expect(values.map((v: any) => v.toNumber())).to.eql([56, 0]);
+    });
+  });
+
+  describe("#valuesOf", () => {
+    it("returns values for all calls", async () => {
+      const [owner, alice] = await ethers.getSigners();
+      await token.mint(alice.address, 12);
+      await token.approve(alice.address, 56);
+      const data = [
+        token.interface.encodeFunctionData("allowance", [
+          owner.address,
+          alice.address,
+        ]),
+        token.interface.encodeFunctionData("balanceOf", [alice.address]),
+        token.interface.encodeFunctionData("totalSupply"),
+      ];
+      const values = await multicall.valuesOf(token.address, data);
+      expect(values.map((v: any) => v.toNumber())).to.eql([56, 12, 12]);
+    });
+    it("fails when the call fails", async () => {
+      await expect(
+        multicall.valuesOf(multicall.address, ["0x12345678"])
+      ).to.be.revertedWith("Multicall: call failed");
+    });
+  });
+
+  describe("#aggregate", () => {
+    it("returns results of calls to many contracts", async () => {
+      const [, alice] = await ethers.getSigners();
+      const other = await SyntheticToken.deploy("Other", "OTH", 8);
+      await token.mint(alice.address, 12);
+      const [blockNumber, successes, results] = await multicall.aggregate(
+        [token.address, other.address, multicall.address],
+        [
+          token.interface.encodeFunctionData("balanceOf", [alice.address]),
+          other.interface.encodeFunctionData("symbol"),
+          token.interface.encodeFunctionData("symbol"),
+        ]
+      );
+      expect(blockNumber).to.eq(await ethers.provider.getBlockNumber());
+      expect(successes).to.eql([true, true, false]);
+      expect(
+        token.interface.decodeFunctionResult("balanceOf", results[0])[0]
+      ).to.eq(12);
+      expect(
+        other.interface.decodeFunctionResult("symbol", results[1])[0]
+      ).to.eq("OTH");
+    });
+    it("fails when lengths are different", async () => {
+      await expect(multicall.aggregate([token.address], [])).to.be.revertedWith(
+        "Multicall: targets and data lengths are different"
+      );
+    });
+  });
+});
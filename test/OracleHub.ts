@@ -0,0 +1,289 @@
+import { expect } from "chai";
+import { BigNumber, Contract, ContractFactory } from "ethers";
+import { ethers } from "hardhat";
+import {
+  addUniswapPair,
+  BTC,
+  deployUniswap,
+  ETH,
+  fastForwardAndMine,
+  now,
+} from "./helpers/helpers";
+
+describe("OracleHub", () => {
+  let OracleHub: ContractFactory;
+  let Oracle: ContractFactory;
+  let oracleHub: Contract;
+  let factory: Contract;
+  let router: Contract;
+  let underlying: Contract;
+  let synthetic: Contract;
+  let pair: Contract;
+
+  before(async () => {
+    OracleHub = await ethers.getContractFactory("OracleHub");
+    Oracle = await ethers.getContractFactory("Oracle");
+  });
+
+  beforeEach(async () => {
+    const { factory: f, router: r } = await deployUniswap();
+    const { underlying: u, synthetic: s, pair: p } = await addUniswapPair(
+      f,
+      r,
+      "WBTC",
+      8,
+      "KBTC",
+      18
+    );
+    factory = f;
+    router = r;
+    underlying = u;
+    synthetic = s;
+    pair = p;
+    oracleHub = await OracleHub.deploy(factory.address, 3600, await now());
+  });
+
+  async function addPairs(count: number) {
+    const pairs = [];
+    for (let i = 0; i < count; i++) {
+      const { underlying: u, synthetic: s, pair: p } = await addUniswapPair(
+        factory,
+        router,
+        "WBTC",
+        8,
+        "KBTC",
+        18
+      );
+      await oracleHub.addPair(u.address, s.address);
+      pairs.push({ underlying: u, synthetic: s, pair: p });
+    }
+    return pairs;
+  }
+
+  describe("#addPair", () => {
+    describe("when called by operator", () => {
+      it("registers the pair", async () => {
+        await expect(oracleHub.addPair(underlying.address, synthetic.address))
+          .to.emit(oracleHub, "PairAdded")
+          .withArgs((await ethers.getSigners())[0].address, pair.address);
+        expect(await oracleHub.isRegistered(pair.address)).to.eq(true);
+        expect(await oracleHub.allPairs()).to.eql([pair.address]);
+      });
+    });
+    describe("when the pair is already registered", () => {
+      it("fails", async () => {
+        await oracleHub.addPair(underlying.address, synthetic.address);
+        await expect(
+          oracleHub.addPair(synthetic.address, underlying.address)
+        ).to.be.revertedWith("OracleHub: Pair is already registered");
+      });
+    });
+    describe("when zero liquidity in the pool", () => {
+      it("fails", async () => {
+        const SyntheticToken = await ethers.getContractFactory(
+          "SyntheticToken"
+        );
+        const tokenA = await SyntheticToken.deploy("A", "A", 18);
+        const tokenB = await SyntheticToken.deploy("B", "B", 18);
+        await factory.createPair(tokenA.address, tokenB.address);
+        await expect(
+          oracleHub.addPair(tokenA.address, tokenB.address)
+        ).to.be.revertedWith("OracleHub: No reserves in the uniswap pool");
+      });
+    });
+    describe("when called not by operator", () => {
+      it("fails", async () => {
+        const [, other] = await ethers.getSigners();
+        await expect(
+          oracleHub
+            .connect(other)
+            .addPair(underlying.address, synthetic.address)
+        ).to.be.revertedWith("Only operator can call this method");
+      });
+    });
+  });
+
+  describe("#removePair", () => {
+    it("unregisters the pair", async () => {
+      const pairs = await addPairs(3);
+      await oracleHub.removePair(pairs[0].pair.address);
+      expect(await oracleHub.isRegistered(pairs[0].pair.address)).to.eq(false);
+      expect(await oracleHub.allPairs()).to.eql([
+        pairs[2].pair.address,
+        pairs[1].pair.address,
+      ]);
+      await expect(
+        oracleHub.removePair(pairs[0].pair.address)
+      ).to.be.revertedWith("OracleHub: Pair is not registered");
+    });
+  });
+
+  describe("#updateAll", () => {
+    describe("before the period passed", () => {
+      it("fails", async () => {
+        await addPairs(2);
+        await expect(oracleHub.updateAll()).to.be.revertedWith(
+          "OracleHub: No pairs are due"
+        );
+      });
+    });
+    describe("after the period passed", () => {
+      it("updates prices of all pairs", async () => {
+        const pairs = await addPairs(3);
+        await fastForwardAndMine(ethers.provider, 3600);
+        const tx = await oracleHub.updateAll();
+        for (const { underlying: u, synthetic: s, pair: p } of pairs) {
+          await expect(tx).to.emit(oracleHub, "Updated");
+          expect(await oracleHub.isDue(p.address)).to.eq(false);
+          expect(await oracleHub.consult(p.address, u.address, BTC)).to.eq(
+            ETH
+          );
+          expect(await oracleHub.consult(p.address, s.address, ETH)).to.eq(
+            BTC.sub(1)
+          );
+        }
+        expect(await oracleHub.lastCalled()).to.eq(await now());
+      });
+    });
+    describe("when only some pairs are due", () => {
+      it("updates only them", async () => {
+        const [first] = await addPairs(1);
+        await fastForwardAndMine(ethers.provider, 1800);
+        const [second] = await addPairs(1);
+        await fastForwardAndMine(ethers.provider, 1800);
+        await oracleHub.updateAll();
+        expect(
+          await oracleHub.consult(
+            first.pair.address,
+            first.underlying.address,
+            BTC
+          )
+        ).to.eq(ETH);
+        expect(
+          await oracleHub.consult(
+            second.pair.address,
+            second.underlying.address,
+            BTC
+          )
+        ).to.eq(0);
+        expect(await oracleHub.isDue(second.pair.address)).to.eq(false);
+        await fastForwardAndMine(ethers.provider, 1800);
+        expect(await oracleHub.isDue(second.pair.address)).to.eq(true);
+      });
+    });
+    describe("before start time", () => {
+      it("fails", async () => {
+        oracleHub = await OracleHub.deploy(
+          factory.address,
+          3600,
+          (await now()) + 7200
+        );
+        await addPairs(1);
+        await fastForwardAndMine(ethers.provider, 3600);
+        await expect(oracleHub.updateAll()).to.be.revertedWith(
+          "Timeboundable: Not started yet"
+        );
+      });
+    });
+  });
+
+  describe("#update", () => {
+    it("updates one pair", async () => {
+      const [first, second] = await addPairs(2);
+      await fastForwardAndMine(ethers.provider, 3600);
+      await oracleHub.update(first.pair.address);
+      expect(await oracleHub.isDue(first.pair.address)).to.eq(false);
+      expect(await oracleHub.isDue(second.pair.address)).to.eq(true);
+      await expect(oracleHub.update(first.pair.address)).to.be.revertedWith(
+        "OracleHub: Pair is not due"
+      );
+    });
+    describe("when the pair is not registered", () => {
+      it("fails", async () => {
+        await fastForwardAndMine(ethers.provider, 3600);
+        await expect(oracleHub.update(pair.address)).to.be.revertedWith(
+          "OracleHub: Pair is not due"
+        );
+      });
+    });
+  });
+
+  describe("#nextUpdateTime", () => {
+    it("is one period after the last update of the pair", async () => {
+      const [first] = await addPairs(1);
+      const added = await now();
+      await fastForwardAndMine(ethers.provider, 1800);
+      const [second] = await addPairs(1);
+      expect(await oracleHub.lastUpdated(first.pair.address)).to.eq(added);
+      expect(await oracleHub.nextUpdateTime(first.pair.address)).to.eq(
+        added + 3600
+      );
+      await fastForwardAndMine(ethers.provider, 1800);
+      await oracleHub.updateAll();
+      expect(await oracleHub.nextUpdateTime(first.pair.address)).to.eq(
+        (await now()) + 3600
+      );
+      expect(await oracleHub.nextUpdateTime(second.pair.address)).to.eq(
+        (await oracleHub.lastUpdated(second.pair.address)).add(3600)
+      );
+    });
+    describe("before start time", () => {
+      it("is the start time", async () => {
+        const start = (await now()) + 7200;
+        oracleHub = await OracleHub.deploy(factory.address, 3600, start);
+        const [first] = await addPairs(1);
+        expect(await oracleHub.nextUpdateTime(first.pair.address)).to.eq(start);
+      });
+    });
+  });
+
+  describe("#consult", () => {
+    describe("when token address is invalid", () => {
+      it("fails", async () => {
+        await oracleHub.addPair(underlying.address, synthetic.address);
+        await expect(
+          oracleHub.consult(pair.address, ethers.constants.AddressZero, BTC)
+        ).to.be.revertedWith("OracleHub: Invalid token address");
+        await expect(
+          oracleHub.consult(
+            underlying.address,
+            ethers.constants.AddressZero,
+            BTC
+          )
+        ).to.be.revertedWith("OracleHub: Invalid token address");
+      });
+    });
+  });
+
+  describe("gas", () => {
+    it("updateAll is cheaper than separate oracles", async () => {
+      const count = 10;
+      const pairs = await addPairs(count);
+      const oracles = [];
+      for (const { underlying: u, synthetic: s } of pairs) {
+        oracles.push(
+          await Oracle.deploy(
+            factory.address,
+            u.address,
+            s.address,
+            3600,
+            await now()
+          )
+        );
+      }
+      // the first update of each oracle initializes `lastCalled`
+      for (const oracle of oracles) {
+        await oracle.update();
+      }
+      await fastForwardAndMine(ethers.provider, 3600);
+
+      let oraclesGas = BigNumber.from(0);
+      for (const oracle of oracles) {
+        const receipt = await (await oracle.update()).wait();
+        oraclesGas = oraclesGas.add(receipt.gasUsed);
+      }
+      const hubGas = (await (await oracleHub.updateAll()).wait()).gasUsed;
+      expect(hubGas.lt(oraclesGas)).to.eq(true);
+    });
+  });
+});
@@ -196,6 +196,55 @@ describe("StabFund", () => {
     });
   });
 
+  describe("#deleteTrader with several traders", () => {
+    it("moves the last trader into the place of deleted", async () => {
+      await stabFund.addTrader(op.address);
+      await stabFund.addTrader(other.address);
+      await stabFund.addTrader(another.address);
+      await stabFund.deleteTrader(op.address);
+      expect(await stabFund.allAllowedTraders()).to.eql([
+        another.address,
+        other.address,
+      ]);
+      await stabFund.deleteTrader(another.address);
+      expect(await stabFund.allAllowedTraders()).to.eql([other.address]);
+      expect(await stabFund.isAllowedTrader(other.address)).to.eq(true);
+      expect(await stabFund.isAllowedTrader(another.address)).to.eq(false);
+    });
+  });
+
+  describe("allowlist checks", () => {
+    it("cost the same gas for 1, 10 and 100 entries", async () => {
+      const tokenGas: number[] = [];
+      const traderGas: number[] = [];
+      const vaultGas: number[] = [];
+      let count = 0;
+      for (const size of [1, 10, 100]) {
+        for (; count < size; count++) {
+          const address = ethers.utils.getAddress(
+            ethers.utils.hexZeroPad(ethers.utils.hexlify(count + 1), 20)
+          );
+          await stabFund.addToken(address);
+          await stabFund.addTrader(address);
+          await stabFund.addVault(address);
+        }
+        tokenGas.push(
+          (await stabFund.estimateGas.isAllowedToken(kwbtc.address)).toNumber()
+        );
+        traderGas.push(
+          (await stabFund.estimateGas.isAllowedTrader(op.address)).toNumber()
+        );
+        vaultGas.push(
+          (await stabFund.estimateGas.isAllowedVault(vault.address)).toNumber()
+        );
+      }
+      for (const gas of [tokenGas, traderGas, vaultGas]) {
+        expect(gas[1]).to.eq(gas[0]);
+        expect(gas[2]).to.eq(gas[0]);
+      }
+    });
+  });
+
   describe("#allAllowedTokens", () => {
     it("returns all allowed tokens", async () => {
       await stabFund.addToken(kwbtc.address);
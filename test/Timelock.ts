@@ -0,0 +1,207 @@
+import { expect } from "chai";
+import { BigNumber, Contract, ContractFactory } from "ethers";
+import { ethers } from "hardhat";
+import { fastForwardAndMine, now } from "./helpers/helpers";
+
+describe("Timelock", () => {
+  const DELAY = 3600;
+  let Timelock: ContractFactory;
+  let SyntheticToken: ContractFactory;
+  let timelock: Contract;
+  let token: Contract;
+  before(async () => {
+    Timelock = await ethers.getContractFactory("Timelock");
+    SyntheticToken = await ethers.getContractFactory("SyntheticToken");
+  });
+  beforeEach(async () => {
+    const [owner] = await ethers.getSigners();
+    timelock = await Timelock.deploy(owner.address, DELAY);
+    token = await SyntheticToken.deploy("Synth", "SYN", 18);
+    await token.transferOperator(timelock.address);
+  });
+
+  function mints(count: number) {
+    const targets = [];
+    const values = [];
+    const signatures = [];
+    const datas = [];
+    for (let i = 0; i < count; i++) {
+      targets.push(token.address);
+      values.push(0);
+      signatures.push("mint(address,uint256)");
+      datas.push(
+        ethers.utils.defaultAbiCoder.encode(
+          ["address", "uint256"],
+          [ethers.Wallet.createRandom().address, i + 1]
+        )
+      );
+    }
+    return { targets, values, signatures, datas };
+  }
+
+  async function gasUsed(tx: Promise<any>): Promise<BigNumber> {
+    return (await (await tx).wait()).gasUsed;
+  }
+
+  describe("#queueTransactions", () => {
+    it("queues the batch under one hash", async () => {
+      const { targets, values, signatures, datas } = mints(3);
+      const eta = (await now()) + DELAY + 100;
+      const hash = ethers.utils.keccak256(
+        ethers.utils.defaultAbiCoder.encode(
+          ["address[]", "uint256[]", "string[]", "bytes[]", "uint256"],
+          [targets, values, signatures, datas, eta]
+        )
+      );
+      await expect(
+        timelock.queueTransactions(targets, values, signatures, datas, eta)
+      ).to.emit(timelock, "QueueTransactions");
+      expect(await timelock.queuedTransactions(hash)).to.eq(true);
+    });
+    it("fails if arrays have different lengths", async () => {
+      const { targets, values, signatures, datas } = mints(3);
+      const eta = (await now()) + DELAY + 100;
+      await expect(
+        timelock.queueTransactions(
+          targets,
+          values.slice(1),
+          signatures,
+          datas,
+          eta
+        )
+      ).to.be.revertedWith(
+        "Timelock::queueTransactions: Arrays must have the same length."
+      );
+    });
+    it("fails if called not by admin", async () => {
+      const [, other] = await ethers.getSigners();
+      const { targets, values, signatures, datas } = mints(3);
+      const eta = (await now()) + DELAY + 100;
+      await expect(
+        timelock
+          .connect(other)
+          .queueTransactions(targets, values, signatures, datas, eta)
+      ).to.be.revertedWith(
+        "Timelock::queueTransactions: Call must come from admin."
+      );
+    });
+  });
+
+  describe("#executeTransactions", () => {
+    it("executes all calls of the batch", async () => {
+      const { targets, values, signatures, datas } = mints(3);
+      const eta = (await now()) + DELAY + 100;
+      await timelock.queueTransactions(targets, values, signatures, datas, eta);
+      await expect(
+        timelock.executeTransactions(targets, values, signatures, datas, eta)
+      ).to.be.revertedWith(
+        "Timelock::executeTransactions: Transaction hasn't surpassed time lock."
+      );
+      await fastForwardAndMine(ethers.provider, DELAY + 100);
+      await timelock.executeTransactions(
+        targets,
+        values,
+        signatures,
+        datas,
+        eta
+      );
+      expect(await token.totalSupply()).to.eq(6);
+      await expect(
+        timelock.executeTransactions(targets, values, signatures, datas, eta)
+      ).to.be.revertedWith(
+        "Timelock::executeTransactions: Transaction hasn't been queued."
+      );
+    });
+    it("reverts all calls if one of them reverts", async () => {
+      const { targets, values, signatures, datas } = mints(3);
+      signatures[2] = "burn(uint256)";
+      datas[2] = ethers.utils.defaultAbiCoder.encode(["uint256"], [1000]);
+      const eta = (await now()) + DELAY + 100;
+      await timelock.queueTransactions(targets, values, signatures, datas, eta);
+      await fastForwardAndMine(ethers.provider, DELAY + 100);
+      await expect(
+        timelock.executeTransactions(targets, values, signatures, datas, eta)
+      ).to.be.revertedWith(
+        "Timelock::executeTransactions: Transaction execution reverted."
+      );
+      expect(await token.totalSupply()).to.eq(0);
+    });
+    it("does not execute cancelled batches", async () => {
+      const { targets, values, signatures, datas } = mints(3);
+      const eta = (await now()) + DELAY + 100;
+      await timelock.queueTransactions(targets, values, signatures, datas, eta);
+      await timelock.cancelTransactions(
+        targets,
+        values,
+        signatures,
+        datas,
+        eta
+      );
+      await fastForwardAndMine(ethers.provider, DELAY + 100);
+      await expect(
+        timelock.executeTransactions(targets, values, signatures, datas, eta)
+      ).to.be.revertedWith(
+        "Timelock::executeTransactions: Transaction hasn't been queued."
+      );
+    });
+    it("costs less gas than separate transactions", async () => {
+      const count = 20;
+      const { targets, values, signatures, datas } = mints(count);
+      let eta = (await now()) + DELAY + 100;
+      let single = BigNumber.from(0);
+      for (let i = 0; i < count; i++) {
+        single = single.add(
+          await gasUsed(
+            timelock.queueTransaction(
+              targets[i],
+              values[i],
+              signatures[i],
+              datas[i],
+              eta
+            )
+          )
+        );
+      }
+      await fastForwardAndMine(ethers.provider, DELAY + 100);
+      for (let i = 0; i < count; i++) {
+        single = single.add(
+          await gasUsed(
+            timelock.executeTransaction(
+              targets[i],
+              values[i],
+              signatures[i],
+              datas[i],
+              eta
+            )
+          )
+        );
+      }
+
+      // fresh recipients, so both runs pay for new balances
+      const fresh = mints(count);
+      eta = (await now()) + DELAY + 100;
+      let batch = await gasUsed(
+        timelock.queueTransactions(
+          fresh.targets,
+          fresh.values,
+          fresh.signatures,
+          fresh.datas,
+          eta
+        )
+      );
+      await fastForwardAndMine(ethers.provider, DELAY + 100);
+      batch = batch.add(
+        await gasUsed(
+          timelock.executeTransactions(
+            fresh.targets,
+            fresh.values,
+            fresh.signatures,
+            fresh.datas,
+            eta
+          )
+        )
+      );
+      expect(batch).to.be.lt(single);
+    });
+  });
+});
@@ -82,6 +82,60 @@ describe("UniswapLibrary", () => {
       });
     });
   });
+  describe("#getAmountOut", () => {
+    it("returns the uniswap output amount after the 0.3% fee", async () => {
+      // 1000 * 997 * 2000 / (5000 * 1000 + 1000 * 997)
+      expect(await uniswapLibrary.getAmountOut(1000, 5000, 2000)).to.eq(332);
+    });
+    describe("when amount == 0", () => {
+      it("fails", async () => {
+        await expect(uniswapLibrary.getAmountOut(0, 50, 25)).to.be.revertedWith(
+          "UniswapV2Library: INSUFFICIENT_INPUT_AMOUNT"
+        );
+      });
+    });
+    describe("when one of reserves == 0", () => {
+      it("fails", async () => {
+        await expect(uniswapLibrary.getAmountOut(20, 0, 25)).to.be.revertedWith(
+          "UniswapV2Library: INSUFFICIENT_LIQUIDITY"
+        );
+        await expect(uniswapLibrary.getAmountOut(20, 50, 0)).to.be.revertedWith(
+          "UniswapV2Library: INSUFFICIENT_LIQUIDITY"
+        );
+      });
+    });
+  });
+  describe("#getAmountsOut", () => {
+    it("returns the same amounts as the uniswap router", async () => {
+      const { factory, router } = await deployUniswap();
+      const { underlying, synthetic } = await addUniswapPair(
+        factory,
+        router,
+        "WBTC",
+        8,
+        "KBTC",
+        18
+      );
+      const path = [underlying.address, synthetic.address];
+      const amounts = await uniswapLibrary.getAmountsOut(
+        factory.address,
+        BTC,
+        path
+      );
+      expect(amounts).to.eql(await router.getAmountsOut(BTC, path));
+      expect(amounts[0]).to.eq(BTC);
+      expect(amounts[1]).to.eq(
+        await uniswapLibrary.getAmountOut(BTC, BTC.mul(10), ETH.mul(10))
+      );
+    });
+    describe("when path has less than 2 tokens", () => {
+      it("fails", async () => {
+        await expect(
+          uniswapLibrary.getAmountsOut(UNISWAP_V2_FACTORY_ADDRESS, 20, [wbtc])
+        ).to.be.revertedWith("UniswapV2Library: INVALID_PATH");
+      });
+    });
+  });
   describe("#getReserves", () => {
     it("returns reserves in the pair according to input order", async () => {
       const { factory, router } = await deployUniswap();
@@ -0,0 +1,215 @@
+import { expect } from "chai";
+import { providers } from "ethers";
+import hre from "hardhat";
+import { HttpNetworkConfig } from "hardhat/types";
+import { runPipeline, Step } from "../../tasks/pipeline";
+import { submitTransaction, submitTransactionFrom } from "../../tasks/utils";
+
+describe("Pipeline", () => {
+  const STEP_TIME = 50;
+  let order: string[];
+  let running: number;
+  let maxRunning: number;
+
+  function sleep(ms: number) {
+    return new Promise((resolve) => setTimeout(resolve, ms));
+  }
+
+  function step(name: string, deps: string[], fail = false): Step {
+    return {
+      name,
+      deps,
+      run: async () => {
+        running++;
+        maxRunning = Math.max(maxRunning, running);
+        await sleep(STEP_TIME);
+        running--;
+        if (fail) {
+          throw `${name} failed`;
+        }
+        order.push(name);
+      },
+    };
+  }
+
+  async function failure(promise: Promise<any>) {
+    try {
+      await promise;
+    } catch (e) {
+      return e;
+    }
+    throw "The promise didn't fail";
+  }
+
+  function checkpoints(done: string[] = []) {
+    const completed = new Set(done);
+    return {
+      completed,
+      isCompleted: (name: string) => completed.has(name),
+      complete: (name: string) => {
+        completed.add(name);
+      },
+    };
+  }
+
+  // tokens -> (klonx -> ve, funds) -> boardrooms
+  function graph(failing?: string): Step[] {
+    return [
+      step("boardrooms", ["ve", "funds"], failing === "boardrooms"),
+      step("ve", ["klonx"], failing === "ve"),
+      step("tokens", [], failing === "tokens"),
+      step("klonx", ["tokens"], failing === "klonx"),
+      step("funds", ["tokens"], failing === "funds"),
+    ];
+  }
+
+  beforeEach(() => {
+    order = [];
+    running = 0;
+    maxRunning = 0;
+  });
+
+  describe("#runPipeline", () => {
+    it("runs steps after their dependencies", async () => {
+      const storage = checkpoints();
+      await runPipeline(graph(), { concurrency: 8, ...storage });
+      expect(order[0]).to.eq("tokens");
+      expect(order.indexOf("ve")).to.be.gt(order.indexOf("klonx"));
+      expect(order[order.length - 1]).to.eq("boardrooms");
+      expect(Array.from(storage.completed).sort()).to.eql(
+        ["boardrooms", "funds", "klonx", "tokens", "ve"].sort()
+      );
+    });
+
+    it("runs independent steps concurrently up to the limit", async () => {
+      const steps = [1, 2, 3, 4, 5, 6].map((i) => step(`s${i}`, []));
+      await runPipeline(steps, { concurrency: 4, ...checkpoints() });
+      expect(maxRunning).to.eq(4);
+      expect(order.length).to.eq(6);
+    });
+
+    it("is faster than running steps one by one", async () => {
+      const steps = [1, 2, 3, 4, 5, 6].map((i) => step(`s${i}`, []));
+      let start = Date.now();
+      await runPipeline(steps, { concurrency: 1, ...checkpoints() });
+      const sequential = Date.now() - start;
+      start = Date.now();
+      await runPipeline(steps, { concurrency: 8, ...checkpoints() });
+      const concurrent = Date.now() - start;
+      expect(sequential).to.be.gte(STEP_TIME * 6);
+      expect(concurrent).to.be.lt(STEP_TIME * 3);
+    });
+
+    it("resumes after a failed step", async () => {
+      const storage = checkpoints();
+      expect(
+        await failure(
+          runPipeline(graph("klonx"), { concurrency: 8, ...storage })
+        )
+      ).to.eq("klonx failed");
+      // `funds` was running along with `klonx`, it's awaited and checkpointed
+      expect(Array.from(storage.completed).sort()).to.eql(["funds", "tokens"]);
+
+      order = [];
+      await runPipeline(graph(), { concurrency: 8, ...storage });
+      expect(order).to.eql(["klonx", "ve", "boardrooms"]);
+    });
+
+    it("fails on unknown dependencies", async () => {
+      expect(
+        await failure(
+          runPipeline([step("a", ["b"])], { concurrency: 1, ...checkpoints() })
+        )
+      ).to.eq("Step `a` depends on unknown step `b`");
+    });
+
+    it("fails on dependency cycles", async () => {
+      expect(
+        await failure(
+          runPipeline([step("a", ["b"]), step("b", ["a"])], {
+            concurrency: 1,
+            ...checkpoints(),
+          })
+        )
+      ).to.eq("Steps have a dependency cycle: a -> b -> a");
+      expect(order).to.eql([]);
+    });
+  });
+
+  describe("#submitTransaction", () => {
+    it("sends concurrent transactions with consecutive nonces", async () => {
+      const [op, other] = await hre.ethers.getSigners();
+      const first = await hre.ethers.provider.getTransactionCount(
+        op.address,
+        "pending"
+      );
+      const responses = await Promise.all(
+        [1, 2, 3, 4, 5].map((value) =>
+          submitTransaction(hre, { to: other.address, value })
+        )
+      );
+      await Promise.all(responses.map((r) => r.wait()));
+      expect(responses.map((r) => r.nonce).sort((a, b) => a - b)).to.eql([
+        first,
+        first + 1,
+        first + 2,
+        first + 3,
+        first + 4,
+      ]);
+    });
+
+    // Requests over HTTP can overtake each other, unlike calls to the
+    // in-process network, so this needs a node: `yarn dev`
+    describe("on a local node", function () {
+      this.timeout(120000);
+      const COUNT = 10;
+      let signer: providers.JsonRpcSigner;
+      let to: string;
+
+      before(async function () {
+        const provider = new providers.JsonRpcProvider(
+          (hre.config.networks.dev as HttpNetworkConfig).url
+        );
+        provider.pollingInterval = 100;
+        try {
+          await provider.getNetwork();
+        } catch (e) {
+          this.skip();
+        }
+        signer = provider.getSigner(0);
+        to = await provider.getSigner(1).getAddress();
+      });
+
+      it("sends concurrent transactions in nonce order", async () => {
+        const first = await signer.getTransactionCount("pending");
+        const responses = await Promise.all(
+          [...Array(COUNT).keys()].map((value) =>
+            submitTransactionFrom(signer, { to, value })
+          )
+        );
+        const receipts = await Promise.all(responses.map((r) => r.wait()));
+        expect(responses.map((r) => r.nonce)).to.eql(
+          [...Array(COUNT).keys()].map((i) => first + i)
+        );
+        expect(receipts.every((r) => r.status === 1)).to.eq(true);
+        expect(await signer.getTransactionCount()).to.eq(first + COUNT);
+      });
+
+      it("is faster than waiting for every transaction", async () => {
+        let start = Date.now();
+        for (let i = 0; i < COUNT; i++) {
+          await (await submitTransactionFrom(signer, { to, value: i })).wait();
+        }
+        const sequential = Date.now() - start;
+        start = Date.now();
+        await Promise.all(
+          [...Array(COUNT).keys()].map(async (value) =>
+            (await submitTransactionFrom(signer, { to, value })).wait()
+          )
+        );
+        const concurrent = Date.now() - start;
+        expect(concurrent).to.be.lt(sequential);
+      });
+    });
+  });
+});
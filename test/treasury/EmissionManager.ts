@@ -239,6 +239,131 @@ describe("EmissionManager", () => {
       });
     });
   });
+  describe("#keeperInfo", () => {
+    it("returns addresses, prices and rebase amounts for all tokens", async () => {
+      await addPair(8, 18);
+      await router.swapExactTokensForTokens(
+        BTC,
+        0,
+        [underlying.address, synthetic.address],
+        op.address,
+        (await now()) + 1800
+      );
+      await tokenManager.updateOracle(synthetic.address);
+      await fastForwardAndMine(ethers.provider, 3600);
+      await tokenManager.updateOracle(synthetic.address);
+      const s1 = synthetic;
+      const o1 = oracle;
+      await addPair(8, 18);
+
+      const [
+        syntheticTokens,
+        underlyingTokens,
+        pairs,
+        oracles,
+        averagePrices,
+        currentPrices,
+        rebaseAmounts,
+        oracleLastCalledTimes,
+        oracleNextCallTimes,
+        nextRebaseTime,
+      ] = await manager.keeperInfo();
+      expect(syntheticTokens).to.eql([s1.address, synthetic.address]);
+      expect(underlyingTokens[1]).to.eq(underlying.address);
+      expect(pairs[1]).to.eq(pair.address);
+      expect(oracles).to.eql([o1.address, oracle.address]);
+      expect(averagePrices[0]).to.eq(
+        await tokenManager.averagePrice(s1.address, ETH)
+      );
+      expect(averagePrices[1]).to.eq(0);
+      expect(currentPrices[0]).to.eq(
+        await tokenManager.currentPrice(s1.address, ETH)
+      );
+      expect(currentPrices[1]).to.eq(
+        await tokenManager.currentPrice(synthetic.address, ETH)
+      );
+      expect(rebaseAmounts[0]).to.gt(0);
+      expect(rebaseAmounts[0]).to.eq(
+        await manager.positiveRebaseAmount(s1.address)
+      );
+      expect(rebaseAmounts[1]).to.eq(0);
+      expect(oracleLastCalledTimes[0]).to.eq(await o1.lastCalled());
+      expect(oracleLastCalledTimes[1]).to.eq(0);
+      expect(oracleNextCallTimes[0]).to.eq(
+        (await o1.lastCalled()).add(await o1.debouncePeriod())
+      );
+      expect(oracleNextCallTimes[1]).to.eq(await oracle.start());
+      expect(nextRebaseTime).to.eq(await manager.start());
+    });
+  });
+  describe("when tokens share the OracleHub", () => {
+    let oracleHub: Contract;
+    beforeEach(async () => {
+      const OracleHub = await ethers.getContractFactory("OracleHub");
+      oracleHub = await OracleHub.deploy(factory.address, 3600, await now());
+      await tokenManager.setOracleHub(oracleHub.address);
+    });
+
+    async function addHubPair() {
+      await addPair(8, 18, 18, BigNumber.from(0));
+      await oracleHub.addPair(underlying.address, synthetic.address);
+      await tokenManager.setOracle(synthetic.address, oracleHub.address);
+      await router.swapExactTokensForTokens(
+        BTC,
+        0,
+        [underlying.address, synthetic.address],
+        op.address,
+        (await now()) + 1800
+      );
+      return { synthetic, pair };
+    }
+
+    it("returns the update times of their pairs from keeperInfo", async () => {
+      const first = await addHubPair();
+      await fastForwardAndMine(ethers.provider, 1800);
+      const second = await addHubPair();
+      const info = await manager.keeperInfo();
+      expect(info.oracles).to.eql([oracleHub.address, oracleHub.address]);
+      expect(await oracleHub.lastCalled()).to.eq(0);
+      const pairs = [first.pair, second.pair];
+      for (let i = 0; i < pairs.length; i++) {
+        const lastUpdated = await oracleHub.lastUpdated(pairs[i].address);
+        expect(info.oracleLastCalledTimes[i]).to.eq(lastUpdated);
+        expect(info.oracleNextCallTimes[i]).to.eq(lastUpdated.add(3600));
+      }
+      expect(info.oracleNextCallTimes[1]).to.be.gt(info.oracleNextCallTimes[0]);
+    });
+
+    it("updates all pairs of the hub once per rebase", async () => {
+      const tokens = [await addHubPair(), await addHubPair()];
+      const other = await addUniswapPair(
+        factory,
+        router,
+        "WBTC",
+        8,
+        "KBTC",
+        18
+      );
+      await oracleHub.addPair(
+        other.underlying.address,
+        other.synthetic.address
+      );
+      await fastForwardAndMine(ethers.provider, 3600);
+      const receipt = await (await manager.makePositiveRebase()).wait();
+      const updated = receipt.logs.filter(
+        (l: any) =>
+          l.address === oracleHub.address &&
+          l.topics[0] === oracleHub.interface.getEventTopic("Updated")
+      );
+      expect(updated.length).to.eq(3);
+      expect(await oracleHub.isDue(other.pair.address)).to.eq(false);
+      for (const { synthetic: s, pair: p } of tokens) {
+        expect(await oracleHub.isDue(p.address)).to.eq(false);
+        expect(await s.balanceOf(devFund.address)).to.be.gt(0);
+        expect(await oracleHub.consult(p.address, s.address, ETH)).to.be.gt(0);
+      }
+    });
+  });
   describe("#makePositiveRebase", () => {
     describe("price move up 20% and threshold is 105", () => {
       describe("zero bonds", () => {
@@ -677,6 +802,64 @@ describe("EmissionManager", () => {
       });
     });
 
+    describe("1 to 10 eligible tokens", function () {
+      this.timeout(120000);
+      it("costs about the same gas for every added token", async () => {
+        const gas: number[] = [];
+        for (let count = 1; count <= 10; count++) {
+          await addPair(8, 18, 18, BigNumber.from(0));
+          await router.swapExactTokensForTokens(
+            BTC,
+            0,
+            [underlying.address, synthetic.address],
+            op.address,
+            (await now()) + 1800
+          );
+          await tokenManager.updateOracle(synthetic.address);
+          await fastForwardAndMine(ethers.provider, 3600);
+          gas.push((await manager.estimateGas.makePositiveRebase()).toNumber());
+        }
+        const perToken = gas.slice(1).map((g, i) => g - gas[i]);
+        for (const cost of perToken) {
+          expect(cost).to.be.lt(perToken[0] * 1.2);
+          expect(cost).to.be.gt(perToken[0] * 0.8);
+        }
+      });
+
+      it("costs less than minting to every receiver separately", async () => {
+        const Forwarding = await ethers.getContractFactory(
+          "ForwardingTokenManagerMock"
+        );
+        const Unbatched = await ethers.getContractFactory(
+          "UnbatchedTokenManagerMock"
+        );
+        const batched = await Forwarding.deploy(tokenManager.address);
+        const unbatched = await Unbatched.deploy(tokenManager.address);
+        await tokenManager.addTokenAdmin(batched.address);
+        await tokenManager.addTokenAdmin(unbatched.address);
+        let saved = BigNumber.from(0);
+        for (let count = 1; count <= 10; count++) {
+          await addPair(8, 18, 18, BigNumber.from(0));
+          await router.swapExactTokensForTokens(
+            BTC,
+            0,
+            [underlying.address, synthetic.address],
+            op.address,
+            (await now()) + 1800
+          );
+          await tokenManager.updateOracle(synthetic.address);
+          await fastForwardAndMine(ethers.provider, 3600);
+          await manager.setTokenManager(unbatched.address);
+          const before = await manager.estimateGas.makePositiveRebase();
+          await manager.setTokenManager(batched.address);
+          const after = await manager.estimateGas.makePositiveRebase();
+          expect(after).to.be.lt(before);
+          expect(before.sub(after)).to.be.gt(saved);
+          saved = before.sub(after);
+        }
+      });
+    });
+
     describe("when veBoardroomRate is 0", () => {
       it("doesn't call veBoardroom", async () => {
         await addPair(8, 18, 18, BigNumber.from(0));
@@ -899,4 +1082,63 @@ describe("EmissionManager", () => {
       );
     });
   });
+
+  describe("gas", () => {
+    it("costs less for a bond and rebase cycle with cached token data", async () => {
+      const Forwarding = await ethers.getContractFactory(
+        "ForwardingTokenManagerMock"
+      );
+      const Uncached = await ethers.getContractFactory(
+        "UncachedTokenManagerMock"
+      );
+      const cached = await Forwarding.deploy(tokenManager.address);
+      const uncached = await Uncached.deploy(
+        tokenManager.address,
+        factory.address
+      );
+      await tokenManager.addTokenAdmin(cached.address);
+      await tokenManager.addTokenAdmin(uncached.address);
+      await addPair(8, 18, 18, BigNumber.from(0));
+      async function estimate(proxy: Contract, call: () => Promise<BigNumber>) {
+        await bondManager.setTokenManager(proxy.address);
+        await manager.setTokenManager(proxy.address);
+        return call();
+      }
+
+      await router.swapExactTokensForTokens(
+        ETH,
+        0,
+        [synthetic.address, underlying.address],
+        op.address,
+        (await now()) + 1800
+      );
+      await tokenManager.updateOracle(synthetic.address);
+      await fastForwardAndMine(ethers.provider, 3600);
+      await synthetic.approve(tokenManager.address, ETH.div(10));
+      const buyBonds = () =>
+        bondManager.estimateGas.buyBonds(synthetic.address, ETH.div(10), 0);
+      expect(await estimate(cached, buyBonds)).to.be.lt(
+        await estimate(uncached, buyBonds)
+      );
+
+      await router.swapExactTokensForTokens(
+        BTC.mul(3),
+        0,
+        [underlying.address, synthetic.address],
+        op.address,
+        (await now()) + 1800
+      );
+      await tokenManager.updateOracle(synthetic.address);
+      await fastForwardAndMine(ethers.provider, 3600);
+      const rebase = () => manager.estimateGas.makePositiveRebase();
+      expect(await estimate(cached, rebase)).to.be.lt(
+        await estimate(uncached, rebase)
+      );
+      await manager.setTokenManager(cached.address);
+      await expect(manager.makePositiveRebase()).to.emit(
+        manager,
+        "PositiveRebaseTotal"
+      );
+    });
+  });
 });
@@ -477,8 +477,8 @@ describe("TokenManager", () => {
             );
           expect(await manager.isManagedToken(s1.address)).to.eq(false);
           expect(await manager.isManagedToken(s2.address)).to.eq(true);
-          expect(await manager.tokens(0)).to.eq(ethers.constants.AddressZero);
-          expect(await manager.tokens(1)).to.eq(s2.address);
+          expect(await manager.allTokens()).to.eql([s2.address]);
+          expect((await manager.tokenUnits(s1.address)).synthetic).to.eq(0);
           expect(await s1.operator()).to.eq(op.address);
           expect(await s1.owner()).to.eq(op.address);
         });
@@ -501,6 +501,43 @@ describe("TokenManager", () => {
     });
   });
 
+  describe("#oneSyntheticUnit and #oneUnderlyingUnit", () => {
+    it("return units stored when the token is added", async () => {
+      await addPair(8, 18);
+      await manager.addToken(
+        synthetic.address,
+        bond.address,
+        underlying.address,
+        oracle.address
+      );
+      const units = await manager.tokenUnits(synthetic.address);
+      expect(units.synthetic).to.eq(ETH);
+      expect(units.underlying).to.eq(BTC);
+      expect(await manager.oneSyntheticUnit(synthetic.address)).to.eq(ETH);
+      expect(await manager.oneUnderlyingUnit(synthetic.address)).to.eq(BTC);
+    });
+    it("keep the tokenIndex getter of deployed TokenManagers", async () => {
+      const getter = manager.interface.getFunction("tokenIndex");
+      expect(getter.outputs!.map((o) => o.name)).to.eql([
+        "syntheticToken",
+        "underlyingToken",
+        "pair",
+        "oracle",
+      ]);
+    });
+    describe("when Synthetic token is not managed", () => {
+      it("fails", async () => {
+        await addPair(8, 18);
+        await expect(
+          manager.oneSyntheticUnit(synthetic.address)
+        ).to.be.revertedWith("TokenManager: Token is not managed");
+        await expect(
+          manager.oneUnderlyingUnit(synthetic.address)
+        ).to.be.revertedWith("TokenManager: Token is not managed");
+      });
+    });
+  });
+
   describe("#isInitialized", () => {
     describe("when BondManager and TokenManager are set", () => {
       it("returns true", async () => {
@@ -691,6 +728,102 @@ describe("TokenManager", () => {
     });
   });
 
+  describe("#setOracleHub", () => {
+    let oracleHub: Contract;
+    beforeEach(async () => {
+      const OracleHub = await ethers.getContractFactory("OracleHub");
+      oracleHub = await OracleHub.deploy(factory.address, 3600, await now());
+    });
+
+    describe("when called by Operator", () => {
+      it("updates OracleHub", async () => {
+        await expect(manager.setOracleHub(oracleHub.address))
+          .to.emit(manager, "OracleHubChanged")
+          .withArgs(op.address, oracleHub.address);
+        expect(await manager.oracleHub()).to.eq(oracleHub.address);
+      });
+    });
+    describe("when called twice", () => {
+      it("fails", async () => {
+        await manager.setOracleHub(oracleHub.address);
+        await expect(
+          manager.setOracleHub(oracleHub.address)
+        ).to.be.revertedWith(
+          "TokenManager: oracleHub with this address already set"
+        );
+      });
+    });
+    describe("when tokens use the current OracleHub", () => {
+      it("fails", async () => {
+        await addPair(8, 18);
+        await manager.addToken(
+          synthetic.address,
+          bond.address,
+          underlying.address,
+          oracle.address
+        );
+        await manager.setOracleHub(oracleHub.address);
+        await oracleHub.addPair(underlying.address, synthetic.address);
+        await manager.setOracle(synthetic.address, oracleHub.address);
+        await expect(
+          manager.setOracleHub(ethers.constants.AddressZero)
+        ).to.be.revertedWith("TokenManager: oracleHub is used by tokens");
+      });
+    });
+    describe("when the pair is not registered in OracleHub", () => {
+      it("fails to set it as an oracle", async () => {
+        await addPair(8, 18);
+        await manager.addToken(
+          synthetic.address,
+          bond.address,
+          underlying.address,
+          oracle.address
+        );
+        await manager.setOracleHub(oracleHub.address);
+        await expect(
+          manager.setOracle(synthetic.address, oracleHub.address)
+        ).to.be.revertedWith(
+          "TokenManager: Pair is not registered in oracleHub"
+        );
+      });
+    });
+    describe("when a token uses OracleHub", () => {
+      it("updates and reads the price of its pair", async () => {
+        await addPair(8, 18);
+        await manager.setOracleHub(oracleHub.address);
+        await oracleHub.addPair(underlying.address, synthetic.address);
+        await manager.addToken(
+          synthetic.address,
+          bond.address,
+          underlying.address,
+          oracleHub.address
+        );
+        await fastForwardAndMine(ethers.provider, 3600);
+        await manager.updateOracle(synthetic.address);
+        const pair = pairFor(
+          factory.address,
+          underlying.address,
+          synthetic.address
+        );
+        expect(await oracleHub.isDue(pair)).to.eq(false);
+        expect(await manager.averagePrice(synthetic.address, ETH)).to.eq(
+          await oracleHub.consult(pair, synthetic.address, ETH)
+        );
+        // not due anymore, the failed update is ignored
+        await expect(manager.updateOracle(synthetic.address)).to.not.be
+          .reverted;
+      });
+    });
+    describe("when called not by Operator", () => {
+      it("fails", async () => {
+        const [_, other] = await ethers.getSigners();
+        await expect(
+          manager.connect(other).setOracleHub(oracleHub.address)
+        ).to.be.revertedWith("Only operator can call this method");
+      });
+    });
+  });
+
   describe("#burnSyntheticFrom", () => {
     describe("when called by BondManager and token is approved to TokenManager", () => {
       it("burns syntetic token", async () => {
@@ -837,6 +970,34 @@ describe("TokenManager", () => {
     });
   });
 
+  describe("#priceSources", () => {
+    describe("when synthetic token is under management", () => {
+      it("returns the pair and the oracle", async () => {
+        await addPair(8, 18);
+        await manager.addToken(
+          synthetic.address,
+          bond.address,
+          underlying.address,
+          oracle.address
+        );
+        expect(await manager.priceSources(synthetic.address)).to.eql([
+          ethers.utils.getAddress(
+            pairFor(factory.address, underlying.address, synthetic.address)
+          ),
+          oracle.address,
+        ]);
+      });
+    });
+    describe("when synthetic token is not under management", () => {
+      it("fails", async () => {
+        await addPair(8, 18);
+        await expect(
+          manager.priceSources(synthetic.address)
+        ).to.be.revertedWith("TokenManager: Token is not managed");
+      });
+    });
+  });
+
   describe("#mintSynthetic", () => {
     describe("when called by EmissionManager", () => {
       it("mints synthetic token", async () => {
@@ -932,6 +1093,104 @@ describe("TokenManager", () => {
     });
   });
 
+  describe("#mintSyntheticBatch", () => {
+    describe("when called by tokenAdmin", () => {
+      it("mints synthetic token to every receiver", async () => {
+        const [_, a, b, c] = await ethers.getSigners();
+        await addPair(8, 18);
+        await manager.addToken(
+          synthetic.address,
+          bond.address,
+          underlying.address,
+          oracle.address
+        );
+        await manager.addTokenAdmin(op.address);
+        await expect(
+          manager.mintSyntheticBatch(
+            synthetic.address,
+            [a.address, b.address, c.address],
+            [123, 0, 456]
+          )
+        )
+          .to.emit(synthetic, "Transfer")
+          .withArgs(ethers.constants.AddressZero, a.address, 123)
+          .and.to.emit(synthetic, "Transfer")
+          .withArgs(ethers.constants.AddressZero, c.address, 456);
+        expect(await synthetic.balanceOf(a.address)).to.eq(123);
+        expect(await synthetic.balanceOf(b.address)).to.eq(0);
+        expect(await synthetic.balanceOf(c.address)).to.eq(456);
+      });
+
+      it("costs less than separate mintSynthetic calls", async () => {
+        const signers = await ethers.getSigners();
+        await addPair(8, 18);
+        await manager.addToken(
+          synthetic.address,
+          bond.address,
+          underlying.address,
+          oracle.address
+        );
+        await manager.addTokenAdmin(op.address);
+        const receivers = signers.slice(1, 7).map((s) => s.address);
+        const amounts = receivers.map((_, i) => i + 1);
+        // mint once to every receiver, so both paths update existing balances
+        await manager.mintSyntheticBatch(synthetic.address, receivers, amounts);
+        let separate = 0;
+        for (let i = 0; i < receivers.length; i++) {
+          const gas = await manager.estimateGas.mintSynthetic(
+            synthetic.address,
+            receivers[i],
+            amounts[i]
+          );
+          // the base cost of a transaction is paid once in the batch
+          separate += gas.toNumber() - 21000;
+        }
+        const batch =
+          (
+            await manager.estimateGas.mintSyntheticBatch(
+              synthetic.address,
+              receivers,
+              amounts
+            )
+          ).toNumber() - 21000;
+        expect(batch).to.be.lt(separate);
+      });
+    });
+
+    describe("when receivers and amounts have different lengths", () => {
+      it("fails", async () => {
+        await addPair(8, 18);
+        await manager.addToken(
+          synthetic.address,
+          bond.address,
+          underlying.address,
+          oracle.address
+        );
+        await manager.addTokenAdmin(op.address);
+        await expect(
+          manager.mintSyntheticBatch(synthetic.address, [op.address], [1, 2])
+        ).to.be.revertedWith(
+          "TokenManager: Receivers and amounts must have the same length"
+        );
+      });
+    });
+
+    describe("when called not by tokenAdmin", () => {
+      it("fails", async () => {
+        await addPair(8, 18);
+        await manager.addToken(
+          synthetic.address,
+          bond.address,
+          underlying.address,
+          oracle.address
+        );
+        await expect(
+          manager.mintSyntheticBatch(synthetic.address, [op.address], [123])
+        ).to.be.revertedWith("TokenManager: Must be called by token admin");
+      });
+    });
+  });
+
   describe("#validTokenPermissions", () => {
     describe("when all synthetic tokens are managed by TokenManager", () => {
       it("returns true", async () => {
@@ -1202,15 +1461,16 @@ describe("TokenManager", () => {
       });
     });
     describe("when token address is in the admins list", () => {
-      it("zeroes out token manager", async () => {
+      it("removes token admin", async () => {
         let admins = await manager.allTokenAdmins();
         expect(admins.length).to.eq(2);
         await manager.deleteTokenAdmin(bondManager.address);
         admins = Array.from(await manager.allTokenAdmins());
-        expect(admins.sort()).to.eql([
-          ethers.constants.AddressZero,
-          emissionManager.address,
-        ]);
+        expect(admins).to.eql([emissionManager.address]);
+        expect(await manager.isTokenAdmin(bondManager.address)).to.eq(false);
+        expect(await manager.isTokenAdmin(emissionManager.address)).to.eq(
+          true
+        );
       });
     });
     describe("when called not by the owner", () => {
@@ -1223,6 +1483,28 @@ describe("TokenManager", () => {
       });
     });
   });
+  describe("#isTokenAdmin", () => {
+    it("costs the same gas for 1, 10 and 100 admins", async () => {
+      const signers = await ethers.getSigners();
+      await manager.deleteTokenAdmin(emissionManager.address);
+      const gas: number[] = [];
+      let count = 1;
+      for (const size of [1, 10, 100]) {
+        for (; count < size; count++) {
+          await manager.addTokenAdmin(
+            ethers.utils.getAddress(
+              ethers.utils.hexZeroPad(ethers.utils.hexlify(count + 1), 20)
+            )
+          );
+        }
+        gas.push(
+          (await manager.estimateGas.isTokenAdmin(signers[1].address)).toNumber()
+        );
+      }
+      expect(gas[1]).to.eq(gas[0]);
+      expect(gas[2]).to.eq(gas[0]);
+    });
+  });
   describe("#addTokenAdmin", () => {
     describe("when token address is not in the admins list", () => {
       it("adds token to managers", async () => {
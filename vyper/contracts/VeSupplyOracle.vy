@@ -0,0 +1 @@
+../../contracts/VeSupplyOracle.vy
\ No newline at end of file
@@ -0,0 +1,109 @@
+# @version 0.2.11
+"""
+@notice Point lookups of `VeBoardroom` before and after `VotingEscrow.point_at`
+        and `VotingEscrow.user_point_at`, for gas comparisons
+"""
+
+
+interface VotingEscrow:
+    def user_point_epoch(addr: address) -> uint256: view
+    def epoch() -> uint256: view
+    def user_point_history(addr: address, loc: uint256) -> Point: view
+    def point_history(loc: uint256) -> Point: view
+    def point_at(_timestamp: uint256) -> EpochPoint: view
+    def user_point_at(addr: address, _timestamp: uint256) -> EpochPoint: view
+
+
+struct Point:
+    bias: int128
+    slope: int128  # - dweight / dt
+    ts: uint256
+    blk: uint256  # block
+
+struct EpochPoint:
+    epoch: uint256
+    bias: int128
+    slope: int128
+    ts: uint256
+    blk: uint256
+
+
+voting_escrow: public(address)
+
+
+@external
+def __init__(_voting_escrow: address):
+    self.voting_escrow = _voting_escrow
+
+
+@view
+@internal
+def _find_timestamp_epoch(ve: address, _timestamp: uint256) -> uint256:
+    _min: uint256 = 0
+    _max: uint256 = VotingEscrow(ve).epoch()
+    for i in range(128):
+        if _min >= _max:
+            break
+        _mid: uint256 = (_min + _max + 2) / 2
+        pt: Point = VotingEscrow(ve).point_history(_mid)
+        if pt.ts <= _timestamp:
+            _min = _mid
+        else:
+            _max = _mid - 1
+    return _min
+
+
+@view
+@internal
+def _find_timestamp_user_epoch(ve: address, user: address, _timestamp: uint256, max_user_epoch: uint256) -> uint256:
+    _min: uint256 = 0
+    _max: uint256 = max_user_epoch
+    for i in range(128):
+        if _min >= _max:
+            break
+        _mid: uint256 = (_min + _max + 2) / 2
+        pt: Point = VotingEscrow(ve).user_point_history(user, _mid)
+        if pt.ts <= _timestamp:
+            _min = _mid
+        else:
+            _max = _mid - 1
+    return _min
+
+
+@view
+@external
+def ve_for_at_search(_user: address, _timestamp: uint256) -> uint256:
+    ve: address = self.voting_escrow
+    max_user_epoch: uint256 = VotingEscrow(ve).user_point_epoch(_user)
+    epoch: uint256 = self._find_timestamp_user_epoch(ve, _user, _timestamp, max_user_epoch)
+    pt: Point = VotingEscrow(ve).user_point_history(_user, epoch)
+    return convert(max(pt.bias - pt.slope * convert(_timestamp - pt.ts, int128), 0), uint256)
+
+
+@view
+@external
+def ve_for_at(_user: address, _timestamp: uint256) -> uint256:
+    pt: EpochPoint = VotingEscrow(self.voting_escrow).user_point_at(_user, _timestamp)
+    return convert(max(pt.bias - pt.slope * convert(_timestamp - pt.ts, int128), 0), uint256)
+
+
+@view
+@external
+def supply_at_search(t: uint256) -> uint256:
+    ve: address = self.voting_escrow
+    epoch: uint256 = self._find_timestamp_epoch(ve, t)
+    pt: Point = VotingEscrow(ve).point_history(epoch)
+    dt: int128 = 0
+    if t > pt.ts:
+        dt = convert(t - pt.ts, int128)
+    return convert(max(pt.bias - pt.slope * dt, 0), uint256)
+
+
+@view
+@external
+def supply_at(t: uint256) -> uint256:
+    pt: EpochPoint = VotingEscrow(self.voting_escrow).point_at(t)
+    dt: int128 = 0
+    if t > pt.ts:
+        dt = convert(t - pt.ts, int128)
+    return convert(max(pt.bias - pt.slope * dt, 0), uint256)
@@ -0,0 +1,398 @@
+"""
+Caching aggregation service behind the dashboard.
+
+Every dashboard page (see `dashboard/src/pages`) is described here as cards
+with the same fields its components read. All fields of a page are read with
+`Multicall.aggregate` (see `contracts/Multicall.sol`): one `eth_call` for the
+fields of the deployed contracts and one more for every level of fields that
+depend on them (e.g. `decimals` of a boardroom's `stakingToken`). The page
+documents are kept for `ttl` seconds and dropped as soon as a new block is
+seen. The scheduler rebuilds them once per block, so visitors only check the
+latest block number. When a visitor sees a block before the scheduler does,
+the page is rebuilt once however many visitors wait for it.
+
+The documents are served as JSON, one per page:
+
+    GET /pages          names of the pages
+    GET /pages/<page>   {"page", "block", "cards": [{"title", "address", "values"}]}
+
+Integers are encoded as decimal strings, failed calls as null (the components
+fall back to defaults for them the same way).
+
+brownie run dashboard_cache main <multicall> [network] [port] [interval] [ttl] --network mainnet
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from brownie import web3
+from eth_abi import decode_abi, encode_abi
+from hexbytes import HexBytes
+
+from scripts import hardhat
+from scripts.uniswap_quote import pair_for
+from scripts.utils import log
+
+DATA = Path(__file__).resolve().parents[2] / "dashboard" / "src" / "data"
+UNISWAP_V2_FACTORY = "0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"
+TTL = 60  # seconds
+INTERVAL = 5  # seconds between block checks
+MAX_ROUNDS = 4
+
+# name : value key in the card, method : view to call, args : call arguments,
+# target : contract to call if not the one of the card, abi : its ABI,
+# each : the view is called with every index below this value.
+# `@field` in target, args and each is the value of another field of the
+# card, `#Contract` is the address of a deployed contract.
+Field = namedtuple(
+    "Field", ["name", "method", "args", "target", "abi", "each"], defaults=((), None, None, None)
+)
+Card = namedtuple("Card", ["title", "contract", "fields", "abi"], defaults=(None,))
+Entry = namedtuple("Entry", ["block", "expires", "document"])
+
+# the components read other tokens with the ABI of any deployed token
+TOKEN_ABI = "KlonX"
+
+
+def views(*names):
+    """
+    Fields for views without arguments, named after the views.
+    """
+    return [Field(name, name) for name in names]
+
+
+def reward_pool(name):
+    return Card(name, name, views(
+        "owner", "nominatedOwner", "rewardsDistribution", "rewardsToken", "stakingToken",
+        "boardroom", "periodFinish", "rewardsDuration", "rewardRate", "rewardPerToken",
+        "rewardPerTokenStored", "totalSupply", "lastTimeRewardApplicable", "lastUpdateTime",
+        "paused",
+    ) + [
+        Field("stakingTokenDecimals", "decimals", target="@stakingToken", abi=TOKEN_ABI),
+        Field("rewardTokenBalance", "balanceOf", (f"#{name}",), "@rewardsToken", TOKEN_ABI),
+        Field("rewardTokenDecimals", "decimals", target="@rewardsToken", abi=TOKEN_ABI),
+    ])
+
+
+def uniswap_cards(sources):
+    cards = []
+    for a, b in (("WBTC", "KWBTC"), ("WBTC", "KlonX"), ("DAI", "KXUSD")):
+        pair = pair_for(UNISWAP_V2_FACTORY, sources.address(a), sources.address(b)).lower()
+        cards.append(Card(f"{b}-{a}-LP", pair, views("token0", "token1", "getReserves") + [
+            Field(f"{m}{i}", m, target=f"@token{i}", abi="KWBTC")
+            for i in (0, 1) for m in ("symbol", "decimals")
+        ], abi="unipairabi"))
+    return cards
+
+
+PAGES = {
+    "boardrooms": [
+        Card("UniswapBoardroomV1", "UniswapBoardroomV1", views(
+            "owner", "operator", "tokenManager", "emissionManager", "stakingToken",
+            "stakingTokenSupply",
+        ) + [Field("stakingTokenDecimals", "decimals", target="@stakingToken", abi=TOKEN_ABI)]),
+        Card("LiquidBoardroomV1", "LiquidBoardroomV1", views(
+            "owner", "operator", "tokenManager", "emissionManager", "stakingToken", "start",
+            "finish", "stakingTokenSupply", "shareTokenSupply", "pause", "veToken",
+        ) + [Field("stakingTokenDecimals", "decimals", target="@stakingToken", abi=TOKEN_ABI)]),
+        Card("VeBoardroomV1", "VeBoardroomV1", views(
+            "tokens_len", "time_cursor", "voting_escrow", "total_received", "admin",
+            "future_admin", "can_checkpoint_token", "emergency_return", "is_killed",
+        ) + [Field("tokens", "tokens", each="@tokens_len")]),
+    ],
+    "funds": [
+        Card("StabFundV1", "StabFundV1", views(
+            "owner", "operator", "router", "allAllowedTraders", "allAllowedVaults",
+            "allAllowedTokens",
+        ) + [
+            Field(f"balance{token}", "balanceOf", ("#StabFundV1",), token)
+            for token in ("KWBTC", "WBTC", "KXUSD", "DAI")
+        ]),
+        Card("DevFundV1", "DevFundV1", views("owner", "operator") + [
+            Field("balanceKWBTC", "balanceOf", ("#DevFundV1",), "KWBTC"),
+        ], abi="devfundabi"),
+    ],
+    "managers": [
+        Card("TokenManagerV1", "TokenManagerV1", views(
+            "owner", "operator", "bondManager", "emissionManager", "allTokens",
+            "allTokenAdmins", "isInitialized", "validTokenPermissions", "uniswapFactory",
+        )),
+        Card("BondManagerV1", "BondManagerV1", views(
+            "owner", "operator", "tokenManager", "start", "finish", "validTokenPermissions",
+            "pauseBuyBonds",
+        )),
+        Card("EmissionManagerV1", "EmissionManagerV1", views(
+            "owner", "operator", "tokenManager", "bondManager", "liquidBoardroom",
+            "uniswapBoardroom", "veBoardroom", "devFund", "stableFund", "devFundRate",
+            "stableFundRate", "liquidBoardroomRate", "uniswapBoardroomRate", "veBoardroomRate",
+            "threshold", "maxRebase", "start", "finish", "debouncePeriod", "lastCalled",
+            "isInitialized", "pausePositiveRebase",
+        )),
+    ],
+    "rewardpools": [
+        reward_pool(name)
+        for name in ("KWBTCWBTCLPKlonXPool", "KlonXWBTCLPKlonXPool", "KXUSDDAILPKlonXPool")
+    ],
+    "swappools": [
+        Card("KlonKlonXSwapPool", "KlonKlonXSwapPool", views(
+            "inToken", "outToken", "owner", "start", "finish")),
+    ],
+    "tokens": [
+        Card("VeKlonX", "VeKlonX", views(
+            "admin", "future_admin", "controller", "transfersEnabled", "epoch", "totalSupply",
+            "supply", "decimals",
+        )),
+    ] + [
+        Card(name, name, views("owner", "operator", "totalSupply", "decimals"))
+        for name in ("KlonX", "KWBTC", "KB-WBTC", "KXUSD", "KB-USD", "Klon", "WBTC", "DAI")
+    ],
+    "uniswap": uniswap_cards,
+}
+
+
+class Sources:
+    """
+    Addresses and ABIs of the dashboard contracts.
+
+    Arguments
+    ---------
+    deployments : dict
+        `{name: {"address", "abi"}}` as in `dashboard/src/data/deployments.*.json`.
+    registry : dict
+        `{name: {"address", ...}}` as in `registry/<network>/latest.json`, for
+        contracts missing in `deployments`.
+    """
+
+    def __init__(self, deployments, registry=None):
+        self.deployments = deployments
+        self.registry = registry or {}
+        self._abis = {}
+
+    @classmethod
+    def load(cls, network):
+        deployments = json.loads((DATA / f"deployments.{network}.json").read_text())
+        registry = json.loads((DATA / f"registry.{network}.json").read_text())
+        return cls(deployments, registry)
+
+    def address(self, name):
+        if name.startswith("0x"):
+            return name
+        entry = self.deployments.get(name) or self.registry[name]
+        return entry["address"]
+
+    def abi(self, name):
+        """
+        ABI of a deployed contract or of a file in `dashboard/src/data`.
+        """
+        if name not in self._abis:
+            if name in self.deployments:
+                self._abis[name] = self.deployments[name]["abi"]
+            else:
+                self._abis[name] = json.loads((DATA / f"{name}.json").read_text())
+        return self._abis[name]
+
+
+def _type(param):
+    if param["type"].startswith("tuple"):
+        inner = ",".join(_type(p) for p in param["components"])
+        return f"({inner}){param['type'][5:]}"
+    return param["type"]
+
+
+def _plain(value):
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+class PageCache:
+    """
+    Arguments
+    ---------
+    multicall : Contract
+        Deployed `Multicall` contract.
+    sources : Sources
+        Addresses and ABIs of the dashboard contracts.
+    pages : dict
+        Cards of every page, or functions building them from `sources`.
+    ttl : float
+        How long a page is kept within the same block, in seconds.
+    """
+
+    def __init__(self, multicall, sources, pages=PAGES, ttl=TTL):
+        self.multicall = multicall
+        self.sources = sources
+        self.ttl = ttl
+        self.pages = {
+            page: cards(sources) if callable(cards) else cards for page, cards in pages.items()
+        }
+        self.calls = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+        # a page is rebuilt by one thread at a time, the others wait for it
+        self._page_locks = {page: threading.Lock() for page in self.pages}
+
+    def _function(self, abi, method, nargs):
+        for item in self.sources.abi(abi):
+            if item.get("type") == "function" and item["name"] == method \
+                    and len(item["inputs"]) == nargs:
+                return item
+        raise KeyError(f"{abi} has no `{method}` with {nargs} arguments")
+
+    def _encode(self, abi, method, args):
+        fn = self._function(abi, method, len(args))
+        types = [_type(p) for p in fn["inputs"]]
+        selector = web3.keccak(text=f"{method}({','.join(types)})")[:4]
+        return selector + encode_abi(types, args), [_type(p) for p in fn["outputs"]]
+
+    def _resolve(self, ref, values):
+        if isinstance(ref, str) and ref.startswith("@"):
+            return values[ref[1:]]
+        if isinstance(ref, str) and ref.startswith("#"):
+            return self.sources.address(ref[1:])
+        return ref
+
+    def _read(self, page, block):
+        cards = self.pages[page]
+        values = [{} for _ in cards]
+        pending = [list(card.fields) for card in cards]
+        for _ in range(MAX_ROUNDS):
+            calls = []
+            for i, card in enumerate(cards):
+                waiting = []
+                for field in pending[i]:
+                    refs = (field.target, field.each) + tuple(field.args)
+                    deps = [r[1:] for r in refs if isinstance(r, str) and r.startswith("@")]
+                    if any(d not in values[i] for d in deps):
+                        waiting.append(field)
+                        continue
+                    if any(values[i][d] is None for d in deps):
+                        values[i][field.name] = None
+                        continue
+                    target = self._resolve(field.target or card.contract, values[i])
+                    abi = field.abi or (card.abi if field.target is None else field.target) \
+                        or card.contract
+                    args = [self._resolve(a, values[i]) for a in field.args]
+                    indexes = [None]
+                    if field.each:
+                        indexes = range(self._resolve(field.each, values[i]))
+                        values[i][field.name] = []
+                    for index in indexes:
+                        call_args = args if index is None else args + [index]
+                        data, outputs = self._encode(abi, field.method, call_args)
+                        calls.append((i, field, self.sources.address(target), data, outputs))
+                pending[i] = waiting
+            if not calls:
+                break
+            with self._lock:
+                self.calls += 1
+            _, successes, results = self.multicall.aggregate.call(
+                [c[2] for c in calls], [c[3] for c in calls], block_identifier=block)
+            for (i, field, _, _, outputs), success, result in zip(calls, successes, results):
+                result = bytes(HexBytes(result))
+                value = None
+                if success and len(result) >= 32 * len(outputs):
+                    decoded = decode_abi(outputs, result)
+                    value = decoded[0] if len(decoded) == 1 else list(decoded)
+                if field.each:
+                    values[i][field.name].append(value)
+                else:
+                    values[i][field.name] = value
+        return {
+            "page": page,
+            "block": block,
+            "cards": [
+                {
+                    "title": card.title,
+                    "address": self.sources.address(card.contract),
+                    "values": {f.name: _plain(values[i].get(f.name)) for f in card.fields},
+                }
+                for i, card in enumerate(cards)
+            ],
+        }
+
+    def _store(self, page, block):
+        with self._page_locks[page]:
+            entry = self._entries.get(page)
+            # another thread may have rebuilt the page while this one waited
+            if entry is None or entry.block < block or entry.expires <= time.monotonic():
+                document = self._read(page, block)
+                entry = Entry(block, time.monotonic() + self.ttl, document)
+                with self._lock:
+                    self._entries[page] = entry
+        return entry
+
+    def refresh(self):
+        """
+        Rebuild the pages made at an older block or older than `ttl`.
+        """
+        block = web3.eth.block_number
+        for page in self.pages:
+            self._store(page, block)
+        return block
+
+    def get(self, page):
+        """
+        The document of a page, read now if it's missing, expired or made
+        at an older block than the latest one.
+        """
+        return self._store(page, web3.eth.block_number).document
+
+
+def serve(cache, port, interval):
+    """
+    Refresh the pages every `interval` seconds and serve them on `port`.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = self.path.strip("/").split("/")
+            if parts == ["pages"]:
+                document = {"pages": list(cache.pages)}
+            elif len(parts) == 2 and parts[0] == "pages" and parts[1] in cache.pages:
+                document = cache.get(parts[1])
+            else:
+                self.send_error(404)
+                return
+            body = json.dumps(document).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            # the dashboard is served from another origin
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    cache.refresh()
+    server = ThreadingHTTPServer(("", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    log(f"Serving {len(cache.pages)} pages on port {port}")
+    while True:
+        time.sleep(interval)
+        try:
+            cache.refresh()
+        except Exception as e:
+            log(f"Refresh failed: {e}")
+
+
+def main(multicall=None, network="mainnet", port=8090, interval=INTERVAL, ttl=TTL):
+    if multicall is None:
+        sys.exit(
+            "Usage: brownie run dashboard_cache main <multicall> [network] [port] [interval] [ttl]"
+        )
+    cache = PageCache(hardhat.at("Multicall", multicall), Sources.load(network), ttl=float(ttl))
+    serve(cache, int(port), float(interval))
@@ -0,0 +1,71 @@
+"""
+Access to the Solidity side of the protocol from brownie.
+
+Solidity contracts are compiled by hardhat (`yarn compile` in the repository
+root), so their ABI and bytecode are loaded from `artifacts/` and the Uniswap
+builds from `node_modules/` instead of the brownie project.
+"""
+
+import json
+from pathlib import Path
+
+from brownie import Contract, web3
+
+ROOT = Path(__file__).resolve().parents[2]
+ARTIFACTS = ROOT / "artifacts" / "contracts"
+NODE_MODULES = ROOT / "node_modules"
+
+UNISWAP_BUILDS = {
+    "UniswapV2Factory": "@uniswap/v2-core/build/UniswapV2Factory.json",
+    "UniswapV2Pair": "@uniswap/v2-core/build/UniswapV2Pair.json",
+    "UniswapV2Router02": "@uniswap/v2-periphery/build/UniswapV2Router02.json",
+}
+
+
+def has_artifacts():
+    """
+    Check if hardhat artifacts and Uniswap builds are available.
+    """
+    return ARTIFACTS.exists() and (NODE_MODULES / "@uniswap").exists()
+
+
+def load_artifact(name):
+    """
+    Load ABI and bytecode of a contract.
+    Arguments
+    ---------
+    name : str
+        Solidity contract name (e.g. `Oracle`) or Uniswap build name.
+    """
+    if name in UNISWAP_BUILDS:
+        build = json.loads((NODE_MODULES / UNISWAP_BUILDS[name]).read_text())
+    else:
+        matches = sorted(ARTIFACTS.glob(f"**/{name}.json"))
+        if not matches:
+            raise FileNotFoundError(
+                f"Artifact `{name}` not found, run `yarn compile` in {ROOT}")
+        build = json.loads(matches[0].read_text())
+    bytecode = build["bytecode"]
+    if not bytecode.startswith("0x"):
+        bytecode = "0x" + bytecode
+    return build["abi"], bytecode
+
+
+def at(name, address):
+    """
+    Get a brownie `Contract` for a deployed Solidity contract.
+    """
+    abi, _ = load_artifact(name)
+    return Contract.from_abi(name, address, abi)
+
+
+def deploy(name, *args, sender):
+    """
+    Deploy a Solidity contract from `sender` and return it as a brownie `Contract`.
+    """
+    abi, bytecode = load_artifact(name)
+    args = [str(a) if hasattr(a, "address") else a for a in args]
+    factory = web3.eth.contract(abi=abi, bytecode=bytecode)
+    tx_hash = factory.constructor(*args).transact({"from": str(sender)})
+    receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
+    return Contract.from_abi(name, receipt.contractAddress, abi)
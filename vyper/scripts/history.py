@@ -0,0 +1,207 @@
+"""
+Cached asyncio reads of VeToken and VeBoardroom history.
+
+History entries never change once they are behind the head of the contract:
+
+* `VeToken.point_history(i)` for `i <= epoch()`
+* `VeToken.user_point_history(addr, i)` for `i <= user_point_epoch(addr)`
+* `VeBoardroom.ve_supply(t)` for `t < time_cursor()`
+* `VeBoardroom.tokens_per_week(token, t)` for weeks before `last_token_time(token)`
+
+Such entries are stored in a persistent sqlite cache keyed by a hash of the
+chain, contract, method and arguments, so repeated runs only go to the node
+for new data. The heads themselves are mutable and are kept in memory for
+`ttl` seconds. Brownie calls are blocking, so they run on a thread pool and
+the coroutines only pipeline them.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from brownie import web3
+
+WEEK = 86400 * 7
+CACHE_PATH = Path(__file__).resolve().parents[1] / "build" / "history-cache.sqlite"
+HEAD_TTL = 15  # seconds, about a block
+WORKERS = 16
+
+
+def _plain(value):
+    if isinstance(value, (tuple, list)):
+        return [_plain(v) for v in value]
+    if isinstance(value, int):
+        return int(value)
+    return str(value)
+
+
+class DiskCache:
+    """
+    Persistent key-value store of immutable call results.
+
+    Arguments
+    ---------
+    path : Path
+        sqlite database file, created if missing.
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.execute("CREATE TABLE IF NOT EXISTS calls (key TEXT PRIMARY KEY, value TEXT)")
+
+    def get(self, key):
+        row = self.db.execute("SELECT value FROM calls WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key, value):
+        self.db.execute(
+            "INSERT OR REPLACE INTO calls (key, value) VALUES (?, ?)", (key, json.dumps(value))
+        )
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+
+class HistoryClient:
+    """
+    Arguments
+    ---------
+    ve_token : Contract
+        `VeToken` contract.
+    ve_boardroom : Contract
+        `VeBoardroom` contract, optional.
+    cache : DiskCache
+        Cache of immutable entries.
+    ttl : float
+        How long the heads (`epoch`, `time_cursor`, ...) are kept, in seconds.
+    workers : int
+        Maximum number of calls in flight.
+    """
+
+    def __init__(self, ve_token, ve_boardroom=None, cache=None, ttl=HEAD_TTL, workers=WORKERS):
+        self.ve_token = ve_token
+        self.ve_boardroom = ve_boardroom
+        self.cache = cache or DiskCache()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._heads = {}
+        self._executor = ThreadPoolExecutor(workers)
+        # the genesis hash tells apart dev chains that reuse contract addresses
+        self._chain = web3.eth.get_block(0).hash.hex()
+
+    def _key(self, contract, method, args):
+        raw = f"{self._chain}:{contract.address}:{method}:{json.dumps(_plain(args))}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def _call(self, contract, method, *args):
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self._executor, lambda: getattr(contract, method)(*args))
+        return _plain(result)
+
+    async def _head(self, contract, method, *args):
+        key = self._key(contract, method, args)
+        cached = self._heads.get(key)
+        if cached is None or cached[0] <= time.monotonic():
+            # the call in flight is stored, so concurrent readers share it
+            task = asyncio.ensure_future(self._call(contract, method, *args))
+            cached = (time.monotonic() + self.ttl, task)
+            self._heads[key] = cached
+        try:
+            return await cached[1]
+        except Exception:
+            # failed calls are not kept
+            if self._heads.get(key) is cached:
+                del self._heads[key]
+            raise
+
+    async def _entry(self, immutable, contract, method, *args):
+        key = self._key(contract, method, args)
+        value = self.cache.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = await self._call(contract, method, *args)
+        if immutable:
+            self.cache.set(key, value)
+        return value
+
+    # ------- heads -------
+
+    async def epoch(self):
+        return await self._head(self.ve_token, "epoch")
+
+    async def user_point_epoch(self, addr):
+        return await self._head(self.ve_token, "user_point_epoch", str(addr))
+
+    async def time_cursor(self):
+        return await self._head(self.ve_boardroom, "time_cursor")
+
+    async def last_token_time(self, token):
+        return await self._head(self.ve_boardroom, "last_token_time", str(token))
+
+    # ------- history -------
+
+    async def point_history(self, epoch):
+        """
+        `VeToken.point_history(epoch)` as `[bias, slope, ts, blk]`.
+        """
+        immutable = epoch <= await self.epoch()
+        return await self._entry(immutable, self.ve_token, "point_history", epoch)
+
+    async def user_point_history(self, addr, idx):
+        """
+        `VeToken.user_point_history(addr, idx)` as `[bias, slope, ts, blk]`.
+        """
+        immutable = idx <= await self.user_point_epoch(addr)
+        return await self._entry(immutable, self.ve_token, "user_point_history", str(addr), idx)
+
+    async def ve_supply(self, week):
+        immutable = week < await self.time_cursor()
+        return await self._entry(immutable, self.ve_boardroom, "ve_supply", week)
+
+    async def tokens_per_week(self, token, week):
+        immutable = week < await self.last_token_time(token) // WEEK * WEEK
+        return await self._entry(immutable, self.ve_boardroom, "tokens_per_week", str(token), week)
+
+    # ------- batches -------
+
+    async def point_histories(self, epochs=None):
+        """
+        All global points up to the current epoch by default.
+        """
+        if epochs is None:
+            epochs = range(await self.epoch() + 1)
+        return await asyncio.gather(*(self.point_history(e) for e in epochs))
+
+    async def user_point_histories(self, addrs):
+        """
+        All points of every user in `addrs`, as a list per user.
+        """
+
+        async def one(addr):
+            last = await self.user_point_epoch(addr)
+            return await asyncio.gather(
+                *(self.user_point_history(addr, i) for i in range(1, last + 1)))
+
+        return await asyncio.gather(*(one(addr) for addr in addrs))
+
+    async def weekly(self, token, weeks):
+        """
+        `ve_supply` and `tokens_per_week` of `token` for every week in `weeks`.
+        """
+        supplies = asyncio.gather(*(self.ve_supply(w) for w in weeks))
+        tokens = asyncio.gather(*(self.tokens_per_week(token, w) for w in weeks))
+        return await asyncio.gather(supplies, tokens)
+
+    def close(self):
+        self._executor.shutdown()
+        self.cache.close()
@@ -0,0 +1,159 @@
+"""
+Keeper for oracle updates and positive rebases.
+
+Python counterpart of `cron:tick` (see `tasks/cron.ts`) that reads the whole
+state it needs with a single `EmissionManager.keeperInfo` call per tick.
+
+brownie run keeper main <emission_manager> [--dry] --network mainnet
+"""
+
+import os
+import sys
+from collections import namedtuple
+from datetime import datetime
+
+from brownie import accounts, chain, web3
+
+from scripts import hardhat
+from scripts.utils import ZERO_ADDRESS, log
+
+CALL_BEFORE_REBASE_SECS = 90 * 60
+GAS_INCREASE = 20  # percent
+
+TokenState = namedtuple(
+    "TokenState",
+    [
+        "synthetic",
+        "underlying",
+        "pair",
+        "oracle",
+        "average_price",
+        "current_price",
+        "rebase_amount",
+        "oracle_last_called",
+        "oracle_next_call_time",
+    ],
+)
+KeeperState = namedtuple("KeeperState", ["tokens", "next_rebase_time"])
+
+
+class Keeper:
+    """
+    Arguments
+    ---------
+    emission_manager : Contract
+        `EmissionManager` contract.
+    sender : Account
+        Account sending oracle updates and rebases.
+    call_before_rebase : int
+        How long before the rebase oracles are updated, in seconds.
+    """
+
+    def __init__(self, emission_manager, sender, call_before_rebase=CALL_BEFORE_REBASE_SECS):
+        self.emission_manager = emission_manager
+        self.sender = sender
+        self.call_before_rebase = call_before_rebase
+        self._oracles = {}
+        self._oracle_hub = None
+
+    def state(self):
+        """
+        Fetch the state of all tokens in one call.
+        """
+        *columns, next_rebase_time = self.emission_manager.keeperInfo()
+        tokens = [
+            TokenState(*row)
+            for row in zip(*columns)
+            if row[0] != ZERO_ADDRESS
+        ]
+        return KeeperState(tokens, next_rebase_time)
+
+    def oracle_hub(self):
+        """
+        Address of the `OracleHub` shared by tokens, fetched once.
+        """
+        if self._oracle_hub is None:
+            token_manager = hardhat.at("TokenManager", self.emission_manager.tokenManager())
+            self._oracle_hub = token_manager.oracleHub()
+        return self._oracle_hub
+
+    def _oracle(self, address):
+        if address not in self._oracles:
+            name = "OracleHub" if address == self.oracle_hub() else "Oracle"
+            self._oracles[address] = hardhat.at(name, address)
+        return self._oracles[address]
+
+    def plan(self, state, now):
+        """
+        Decide what to call, the same way as `cron:tick`.
+
+        Oracles are updated once right before the rebase, so the rebase uses
+        a fresh average price. Tokens sharing the `OracleHub` get one update
+        for all of them, once the pair of any of them is due (`keeperInfo`
+        reports the times of the hub per pair). The rebase is made as soon
+        as it's allowed.
+
+        Returns
+        -------
+        list
+            Oracle addresses to update.
+        bool
+            True if `makePositiveRebase` should be called.
+        """
+        oracle_rebase_call_time = state.next_rebase_time - self.call_before_rebase
+        updates = []
+        if now > oracle_rebase_call_time:
+            for token in state.tokens:
+                if token.oracle_next_call_time > now or token.oracle in updates:
+                    continue
+                if token.oracle_last_called < oracle_rebase_call_time:
+                    updates.append(token.oracle)
+        return updates, state.next_rebase_time <= now
+
+    def _tx_params(self):
+        gas_price = web3.eth.gas_price * (100 + GAS_INCREASE) // 100
+        return {"from": self.sender, "gas_price": gas_price}
+
+    def tick(self, now=None, dry=False):
+        """
+        Fetch the state, update oracles and make the rebase if needed.
+
+        Returns
+        -------
+        list
+            Oracle addresses that were updated.
+        bool
+            True if the rebase was made.
+        """
+        state = self.state()
+        if now is None:
+            now = chain.time()
+        updates, rebase = self.plan(state, now)
+        for token in state.tokens:
+            log(
+                f"{token.synthetic}: average price {token.average_price}, "
+                f"current price {token.current_price}, rebase amount {token.rebase_amount}"
+            )
+        for oracle in updates:
+            log(f"Updating oracle {oracle}")
+            if dry:
+                continue
+            if oracle == self.oracle_hub():
+                self._oracle(oracle).updateAll(self._tx_params())
+            else:
+                self._oracle(oracle).update(self._tx_params())
+        if rebase:
+            log(f"Making positive rebase at EmissionManager {self.emission_manager.address}")
+            if not dry:
+                self.emission_manager.makePositiveRebase(self._tx_params())
+        else:
+            log(f"Next rebase at {datetime.utcfromtimestamp(state.next_rebase_time).isoformat()}")
+        return updates, rebase
+
+
+def main(emission_manager=None, dry=""):
+    if emission_manager is None:
+        sys.exit("Usage: brownie run keeper main <emission_manager> [--dry]")
+    sender = accounts.add(os.environ["OPERATOR_PK"])
+    keeper = Keeper(hardhat.at("EmissionManager", emission_manager), sender)
+    keeper.tick(now=int(datetime.utcnow().timestamp()), dry=dry == "--dry")
@@ -0,0 +1,144 @@
+"""
+Migration of legacy boardroom stakers into VeToken with `create_locks_for`.
+
+The snapshot is streamed from a CSV file, either an export of
+`scripts/snapshot.py` (`address,balance` with raw integer balances) or one of
+the files in `docs/` (`address;amount` with a decimal comma). Holders are sent
+in batches that fit `BATCH_GAS`. Holders that already have a lock are skipped,
+so an interrupted run can be restarted with the same file.
+
+`create_locks_for` is admin only. With `--dry` the calldata of every batch is
+printed instead, to be sent through the multisig once VeToken is owned by the
+Timelock.
+
+brownie run migrate_locks main <ve_token> <snapshot> <unlock_time> [--dry] --network mainnet
+"""
+
+import csv
+import os
+import sys
+from decimal import Decimal
+
+from brownie import VeToken, accounts
+
+from scripts.utils import ZERO_ADDRESS, log
+
+MAX_LOCKS = 100  # `MAX_LOCKS` in VeToken.vy
+BATCH_GAS = 8_000_000
+# one lock writes the lock, user point and epoch and a slope change
+GAS_PER_LOCK = 180_000
+
+
+def batch_size(batch_gas=BATCH_GAS, gas_per_lock=GAS_PER_LOCK):
+    """
+    Number of locks per `create_locks_for` call that fit into `batch_gas`.
+    """
+    return max(1, min(MAX_LOCKS, batch_gas // gas_per_lock))
+
+
+def read_snapshot(path, decimals=18):
+    """
+    Stream `(holder, amount)` rows of a snapshot file, skipping zero amounts.
+
+    Arguments
+    ---------
+    path : str
+        CSV file with a `address,balance` header and raw balances, or
+        `address;amount` rows with human-readable amounts.
+    decimals : int
+        Decimals of the token, used for human-readable amounts only.
+    """
+    with open(path, newline="") as f:
+        first = f.readline()
+        raw = first.strip().lower() == "address,balance"
+        if not raw:
+            f.seek(0)
+        reader = csv.reader(f, delimiter="," if raw else ";")
+        for row in reader:
+            if not row:
+                continue
+            holder, amount = row[0].strip(), row[1].strip()
+            if raw:
+                value = int(amount)
+            else:
+                value = int(Decimal(amount.replace(",", ".")) * 10 ** decimals)
+            if value > 0:
+                yield holder, value
+
+
+def batches(rows, size):
+    """
+    Split streamed rows into lists of at most `size` rows.
+    """
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _pad(values, filler):
+    return list(values) + [filler] * (MAX_LOCKS - len(values))
+
+
+def calldata(batch, unlock_time):
+    """
+    Arguments of `create_locks_for` for one batch, padded to `MAX_LOCKS`.
+    """
+    holders, amounts = zip(*batch)
+    return (
+        _pad(holders, ZERO_ADDRESS),
+        _pad(amounts, 0),
+        _pad([unlock_time] * len(batch), 0),
+    )
+
+
+def migrate(ve_token, rows, unlock_time, sender, size=None, dry=False):
+    """
+    Create locks until `unlock_time` for all rows.
+
+    Arguments
+    ---------
+    ve_token : Contract
+        `VeToken` contract.
+    rows : iterable
+        `(holder, amount)` rows, e.g. from `read_snapshot`.
+    unlock_time : int
+        Unlock time of all locks.
+    sender : Account
+        Admin of VeToken, pays the locked tokens. Must have approved VeToken.
+    size : int
+        Locks per call, `batch_size()` by default.
+    dry : bool
+        Print calldata instead of sending transactions.
+
+    Returns
+    -------
+    int
+        Number of locks created (or printed).
+    """
+    size = size or batch_size()
+    assert 0 < size <= MAX_LOCKS
+    pending = ((h, a) for h, a in rows if ve_token.locked(h)[0] == 0)
+    count = 0
+    for batch in batches(pending, size):
+        args = calldata(batch, unlock_time)
+        if dry:
+            log(f"create_locks_for {len(batch)} holders: {ve_token.create_locks_for.encode_input(*args)}")
+        else:
+            tx = ve_token.create_locks_for(*args, {"from": sender})
+            log(f"Created {len(batch)} locks, {tx.gas_used} gas")
+        count += len(batch)
+    return count
+
+
+def main(ve_token=None, path=None, unlock_time=None, dry=""):
+    if None in (ve_token, path, unlock_time):
+        sys.exit("Usage: brownie run migrate_locks main <ve_token> <snapshot> <unlock_time> [--dry]")
+    dry = dry == "--dry"
+    sender = None if dry else accounts.add(os.environ["ADMIN_PK"])
+    count = migrate(VeToken.at(ve_token), read_snapshot(path), int(unlock_time), sender, dry=dry)
+    log(f"{count} locks migrated")
@@ -0,0 +1,318 @@
+"""
+Reward reconciliation of the Solidity boardrooms.
+
+`Boardroom`, `LiquidBoardroom` and `UniswapBoardroom` accrue rewards of a
+holder only when `updateAccruals` runs for them, as the share balance at that
+moment times the growth of `accruedRewardPerShareUnit` since the previous
+accrual, rounded down to `stakingUnit`. Every accrual that changes anything
+emits `RewardAccrued`, so the history of the boardroom is fully described by
+its logs and the logs of the share source:
+
+* `Boardroom` - `Staked` and `Withdrawn` of the boardroom
+* `LiquidBoardroom` - plus `Deposit` and `Withdraw` of the VeToken
+* `UniswapBoardroom` - plus `Staked` and `Withdrawn` of the `RewardsPool`
+
+The logs are fetched by several workers at once and decoded by hand into a
+`Ledger` of columns. `reconcile` then sorts them once and replays them in a
+single pass with the same integer rounding as the contracts. Reward per share
+values are uq-sized integers (`amount * 10^18 / supply`) that don't fit into
+machine words, so the pass works on python integers instead of numpy arrays,
+like `twap.py`. Every reported increment, total and payout is checked on the
+way, and the expected `availableForWithdraw` of every holder is compared with
+the chain through `Multicall.valuesOf`.
+
+The share source and `stakingUnit` are assumed to stay the same for the
+whole history, and `from_block` must be before both deployments.
+
+brownie run reconcile main <boardroom|liquid|uniswap> <boardroom> <multicall> <from_block> <block> [output] --network mainnet
+"""
+
+import csv
+import sys
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import web3
+from hexbytes import HexBytes
+
+from scripts import hardhat
+from scripts.utils import log
+
+STAKING_UNIT = 10 ** 18
+LOG_CHUNK = 10_000  # blocks per eth_getLogs
+BATCH_SIZE = 500  # calls per eth_call
+WORKERS = 8
+
+# ledger entry kinds
+BALANCE, NOTIFY, ACCRUE, PAID = range(4)
+
+Discrepancy = namedtuple(
+    "Discrepancy", ["block", "log_index", "kind", "token", "holder", "expected", "actual"]
+)
+Reconciliation = namedtuple("Reconciliation", ["available", "discrepancies"])
+
+
+class Ledger:
+    """
+    Boardroom history as columns of the same length, one row per log.
+
+    `position` is `block << 20 | log_index`, `amount` is signed for balance
+    changes, `total` is only set for accruals.
+    """
+
+    def __init__(self):
+        self.position = []
+        self.kind = []
+        self.token = []
+        self.holder = []
+        self.amount = []
+        self.total = []
+
+    def __len__(self):
+        return len(self.position)
+
+    def add(self, block, log_index, kind, token=None, holder=None, amount=0, total=0):
+        self.position.append(block << 20 | log_index)
+        self.kind.append(kind)
+        self.token.append(token)
+        self.holder.append(holder)
+        self.amount.append(amount)
+        self.total.append(total)
+
+    def extend(self, other):
+        for column in ("position", "kind", "token", "holder", "amount", "total"):
+            getattr(self, column).extend(getattr(other, column))
+
+
+# ------- decoding -------
+
+
+def _word(data, i):
+    return int.from_bytes(data[32 * i:32 * i + 32], "big")
+
+
+def _word_address(data, i):
+    return "0x" + data[32 * i + 12:32 * i + 32].hex()
+
+
+def _topic_address(log, i):
+    return "0x" + bytes(log["topics"][i])[-20:].hex()
+
+
+# signature : function(log, data) -> (kind, token, holder, amount, total)
+BOARDROOM_EVENTS = {
+    "Staked(address,address,uint256)": lambda log, data: (
+        BALANCE, None, _topic_address(log, 2), _word(data, 0), 0),
+    "Withdrawn(address,address,uint256)": lambda log, data: (
+        BALANCE, None, _topic_address(log, 1), -_word(data, 0), 0),
+    "IncomingBoardroomReward(address,address,uint256)": lambda log, data: (
+        NOTIFY, _topic_address(log, 1), None, _word(data, 0), 0),
+    "RewardAccrued(address,address,uint256,uint256)": lambda log, data: (
+        ACCRUE, _word_address(data, 0), _word_address(data, 1), _word(data, 2), _word(data, 3)),
+    "RewardPaid(address,address,address,uint256)": lambda log, data: (
+        PAID, _topic_address(log, 1), _topic_address(log, 2), _word(data, 0), 0),
+}
+VE_TOKEN_EVENTS = {
+    "Deposit(address,uint256,uint256,int128,uint256)": lambda log, data: (
+        BALANCE, None, _topic_address(log, 1), _word(data, 0), 0),
+    "Withdraw(address,uint256,uint256)": lambda log, data: (
+        BALANCE, None, _topic_address(log, 1), -_word(data, 0), 0),
+}
+REWARDS_POOL_EVENTS = {
+    "Staked(address,uint256)": lambda log, data: (
+        BALANCE, None, _topic_address(log, 1), _word(data, 0), 0),
+    "Withdrawn(address,uint256)": lambda log, data: (
+        BALANCE, None, _topic_address(log, 1), -_word(data, 0), 0),
+}
+
+# kind : (boardroom contract, share source getter, share source events)
+BOARDROOMS = {
+    "boardroom": ("Boardroom", None, {}),
+    "liquid": ("LiquidBoardroom", "veToken", VE_TOKEN_EVENTS),
+    "uniswap": ("UniswapBoardroom", "lpPool", REWARDS_POOL_EVENTS),
+}
+
+
+def load_events(address, events, from_block, to_block, workers=WORKERS, chunk=LOG_CHUNK):
+    """
+    Fetch and decode the logs of `events` emitted by `address`.
+
+    Arguments
+    ---------
+    address : str
+        Emitting contract.
+    events : dict
+        Decoders by event signature (e.g. `BOARDROOM_EVENTS`).
+
+    Returns
+    -------
+    Ledger
+    """
+    decoders = {web3.keccak(text=signature).hex(): f for signature, f in events.items()}
+
+    def fetch(start):
+        return web3.eth.get_logs({
+            "address": str(address),
+            "fromBlock": start,
+            "toBlock": min(start + chunk - 1, to_block),
+            "topics": [list(decoders)],
+        })
+
+    ledger = Ledger()
+    with ThreadPoolExecutor(workers) as executor:
+        for logs in executor.map(fetch, range(from_block, to_block + 1, chunk)):
+            for log in logs:
+                decode = decoders[log["topics"][0].hex()]
+                ledger.add(
+                    log["blockNumber"], log["logIndex"], *decode(log, bytes(HexBytes(log["data"]))))
+    return ledger
+
+
+# ------- reconciliation -------
+
+
+def reconcile(ledger, staking_unit=STAKING_UNIT):
+    """
+    Replay the ledger with the rounding of the boardroom contracts.
+
+    Every `RewardAccrued` is checked against the increment and the total the
+    holder should have got at that point, every `RewardPaid` against the
+    accrued reward it should pay out.
+
+    Returns
+    -------
+    Reconciliation
+        Expected `availableForWithdraw(token, holder)` of every holder with a
+        share balance or accruals, and the discrepancies found in the logs.
+    """
+    position, kind, token, holder = ledger.position, ledger.kind, ledger.token, ledger.holder
+    amount, total = ledger.amount, ledger.total
+
+    balances = defaultdict(int)
+    supply = 0
+    rpsu = defaultdict(int)  # accruedRewardPerShareUnit of the last snapshot
+    last_rpsu = defaultdict(int)  # the same at the last accrual of (token, holder)
+    accrued = defaultdict(int)
+    discrepancies = []
+
+    def report(i, name, expected, actual):
+        discrepancies.append(Discrepancy(
+            position[i] >> 20, position[i] & 0xfffff, name, token[i], holder[i], expected, actual))
+
+    for i in sorted(range(len(position)), key=position.__getitem__):
+        k = kind[i]
+        if k == BALANCE:
+            balances[holder[i]] += amount[i]
+            supply += amount[i]
+        elif k == NOTIFY:
+            if supply <= 0:
+                report(i, "notify", 0, supply)
+                continue
+            rpsu[token[i]] += amount[i] * staking_unit // supply
+        elif k == ACCRUE:
+            key = (token[i], holder[i])
+            current = rpsu[token[i]]
+            added = balances[holder[i]] * (current - last_rpsu[key]) // staking_unit
+            last_rpsu[key] = current
+            accrued[key] += added
+            if added != amount[i]:
+                report(i, "accrual", added, amount[i])
+            elif accrued[key] != total[i]:
+                report(i, "accrual total", accrued[key], total[i])
+        else:
+            key = (token[i], holder[i])
+            if accrued[key] != amount[i]:
+                report(i, "payment", accrued[key], amount[i])
+            accrued[key] = 0
+
+    available = {}
+    holders = {h for h, balance in balances.items() if balance > 0} | {h for _, h in last_rpsu}
+    for t in rpsu:
+        for h in holders:
+            key = (t, h)
+            pending = balances[h] * (rpsu[t] - last_rpsu[key]) // staking_unit
+            available[key] = accrued[key] + pending
+    return Reconciliation(available, discrepancies)
+
+
+def read_available(multicall, boardroom, keys, block, workers=WORKERS, batch_size=BATCH_SIZE):
+    """
+    `availableForWithdraw(token, holder)` for every `(token, holder)` in `keys` at `block`.
+    """
+    data = [boardroom.availableForWithdraw.encode_input(t, h) for t, h in keys]
+
+    def fetch(batch):
+        return multicall.valuesOf.call(boardroom.address, batch, block_identifier=block)
+
+    values = []
+    with ThreadPoolExecutor(workers) as executor:
+        for batch in executor.map(
+                fetch, [data[i:i + batch_size] for i in range(0, len(data), batch_size)]):
+            values.extend(batch)
+    return dict(zip(keys, values))
+
+
+def audit(kind, boardroom, multicall, from_block, block, workers=WORKERS, chunk=LOG_CHUNK):
+    """
+    Reconcile the whole history of a boardroom up to `block` with its state.
+
+    Arguments
+    ---------
+    kind : str
+        One of `BOARDROOMS`.
+    boardroom : Contract
+        The boardroom.
+    multicall : Contract
+        Deployed `Multicall` contract.
+
+    Returns
+    -------
+    Reconciliation
+        Discrepancies in the logs followed by `available` mismatches with the
+        chain at `block`.
+    """
+    _, source, source_events = BOARDROOMS[kind]
+    ledger = load_events(boardroom, BOARDROOM_EVENTS, from_block, block, workers, chunk)
+    if source is not None:
+        source_address = getattr(boardroom, source).call(block_identifier=block)
+        ledger.extend(load_events(source_address, source_events, from_block, block, workers, chunk))
+    result = reconcile(ledger, boardroom.stakingUnit())
+    keys = sorted(result.available)
+    on_chain = read_available(multicall, boardroom, keys, block, workers)
+    for t, h in keys:
+        if on_chain[(t, h)] != result.available[(t, h)]:
+            result.discrepancies.append(Discrepancy(
+                block, None, "available", t, h, result.available[(t, h)], on_chain[(t, h)]))
+    return result
+
+
+def write_csv(discrepancies, path):
+    """
+    Write discrepancies to a CSV file.
+    """
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(Discrepancy._fields)
+        for row in discrepancies:
+            writer.writerow(["" if v is None else v for v in row])
+
+
+def main(kind=None, boardroom=None, multicall=None, from_block=0, block=None, output=None):
+    if kind not in BOARDROOMS or None in (boardroom, multicall, block):
+        sys.exit(
+            "Usage: brownie run reconcile main <boardroom|liquid|uniswap> "
+            "<boardroom> <multicall> <from_block> <block> [output]"
+        )
+    result = audit(
+        kind,
+        hardhat.at(BOARDROOMS[kind][0], boardroom),
+        hardhat.at("Multicall", multicall),
+        int(from_block),
+        int(block),
+    )
+    log(f"{len(result.available)} balances checked, {len(result.discrepancies)} discrepancies")
+    if output is not None:
+        write_csv(result.discrepancies, output)
+    else:
+        for row in result.discrepancies:
+            log(row)
@@ -0,0 +1,209 @@
+"""
+Holder snapshots of boardrooms, bond tokens and VeToken.
+
+Holders are discovered from the logs of the snapshotted contract and their
+balances are read at a fixed block through `Multicall` (see
+`contracts/Multicall.sol`), hundreds of holders per `eth_call`. Log ranges
+and balance batches are fetched by several workers at once. The CSV is sorted
+by holder address and has raw integer balances, so the same block always
+gives the same file.
+
+brownie run snapshot main <kind> <address> <multicall> <from_block> <block> <output> --network mainnet
+"""
+
+import csv
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from brownie import web3
+from brownie.convert import to_address
+
+from scripts import hardhat
+from scripts.utils import ZERO_ADDRESS, log
+
+LOG_CHUNK = 10_000  # blocks per eth_getLogs
+BATCH_SIZE = 500  # holders per eth_call
+WORKERS = 8
+
+# event : event signature
+# topic : index of the holder address in the event topics
+# balance : signature of the balance view
+# at_block : True if the balance view takes a block number, it's then called
+#            at the latest block so no archive node is needed
+# shares : `ShareSource` of boardrooms whose shares are partly held elsewhere
+Source = namedtuple("Source", ["event", "topic", "balance", "at_block", "shares"], defaults=(None,))
+# getter : signature of the boardroom view returning the share source address
+# event, topic : as in `Source`, of the share source
+ShareSource = namedtuple("ShareSource", ["getter", "event", "topic"])
+
+SOURCES = {
+    # SyntheticToken bonds (and any other ERC20)
+    "token": Source("Transfer(address,address,uint256)", 2, "balanceOf(address)", False),
+    # Boardroom, and the stakes alone of LiquidBoardroom and UniswapBoardroom
+    "boardroom": Source(
+        "Staked(address,address,uint256)", 2, "stakingTokenBalances(address)", False
+    ),
+    # LiquidBoardroom stakes plus VeToken locks
+    "liquid": Source(
+        "Staked(address,address,uint256)",
+        2,
+        "shareTokenBalance(address)",
+        False,
+        ShareSource("veToken()", "Deposit(address,uint256,uint256,int128,uint256)", 1),
+    ),
+    # UniswapBoardroom stakes plus LP tokens staked in the RewardsPool
+    "uniswap": Source(
+        "Staked(address,address,uint256)",
+        2,
+        "shareTokenBalance(address)",
+        False,
+        ShareSource("lpPool()", "Staked(address,uint256)", 1),
+    ),
+    "vetoken": Source(
+        "Deposit(address,uint256,uint256,int128,uint256)",
+        1,
+        "balanceOfAt(address,uint256)",
+        True,
+    ),
+}
+
+
+def _selector(signature):
+    return web3.keccak(text=signature)[:4].hex()
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def discover_holders(address, kind, from_block, to_block, workers=WORKERS, chunk=LOG_CHUNK):
+    """
+    Find all addresses that ever had a balance in the contract, or in its
+    share source for the boardrooms that have one.
+
+    Arguments
+    ---------
+    address : str
+        Address of the snapshotted contract.
+    kind : str
+        One of `SOURCES`.
+    from_block : int
+        Deployment block of the contract.
+    to_block : int
+        Snapshot block.
+
+    Returns
+    -------
+    list
+        Checksummed holder addresses, sorted.
+    """
+    source = SOURCES[kind]
+    # (contract, event topic, index of the holder topic)
+    logs = [(str(address), web3.keccak(text=source.event).hex(), source.topic)]
+    if source.shares is not None:
+        result = web3.eth.call(
+            {"to": str(address), "data": _selector(source.shares.getter)}, to_block
+        )
+        logs.append((
+            to_address("0x" + bytes(result)[-20:].hex()),
+            web3.keccak(text=source.shares.event).hex(),
+            source.shares.topic,
+        ))
+
+    def fetch(args):
+        contract, topic, index, start = args
+        found = web3.eth.get_logs({
+            "address": contract,
+            "fromBlock": start,
+            "toBlock": min(start + chunk - 1, to_block),
+            "topics": [topic],
+        })
+        return {to_address(log["topics"][index][-20:].hex()) for log in found}
+
+    ranges = [
+        (contract, topic, index, start)
+        for contract, topic, index in logs
+        for start in range(from_block, to_block + 1, chunk)
+    ]
+    holders = set()
+    with ThreadPoolExecutor(workers) as executor:
+        for found in executor.map(fetch, ranges):
+            holders |= found
+    holders.discard(ZERO_ADDRESS)
+    return sorted(holders, key=str.lower)
+
+
+def read_balances(multicall, address, kind, holders, block, workers=WORKERS, batch_size=BATCH_SIZE):
+    """
+    Read balances of `holders` at `block`.
+
+    Arguments
+    ---------
+    multicall : Contract
+        Deployed `Multicall` contract.
+    address : str
+        Address of the snapshotted contract.
+    kind : str
+        One of `SOURCES`.
+    holders : list
+        Holder addresses.
+    block : int
+        Snapshot block.
+
+    Returns
+    -------
+    list
+        Balances in the order of `holders`.
+    """
+    source = SOURCES[kind]
+    selector = _selector(source.balance)
+
+    def fetch(batch):
+        if source.at_block:
+            return multicall.balancesOfAt.call(str(address), selector, batch, block)
+        return multicall.balancesOf.call(str(address), selector, batch, block_identifier=block)
+
+    balances = []
+    with ThreadPoolExecutor(workers) as executor:
+        for values in executor.map(fetch, _chunks(list(holders), batch_size)):
+            balances.extend(values)
+    return balances
+
+
+def snapshot(
+    multicall, address, kind, from_block, block,
+    workers=WORKERS, chunk=LOG_CHUNK, batch_size=BATCH_SIZE
+):
+    """
+    Holders of the contract with their balances at `block`, sorted by address.
+    """
+    holders = discover_holders(address, kind, from_block, block, workers, chunk)
+    balances = read_balances(multicall, address, kind, holders, block, workers, batch_size)
+    return list(zip(holders, balances))
+
+
+def write_csv(rows, path, skip_zero=False):
+    """
+    Write `(holder, balance)` rows to a CSV file.
+    """
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["address", "balance"])
+        for holder, balance in rows:
+            if skip_zero and balance == 0:
+                continue
+            writer.writerow([str(holder).lower(), int(balance)])
+
+
+def main(kind=None, address=None, multicall=None, from_block=0, block=None, output=None):
+    if kind not in SOURCES or None in (address, multicall, block, output):
+        sys.exit(
+            "Usage: brownie run snapshot main <token|boardroom|liquid|uniswap|vetoken> "
+            "<address> <multicall> <from_block> <block> <output>"
+        )
+    rows = snapshot(
+        hardhat.at("Multicall", multicall), address, kind, int(from_block), int(block)
+    )
+    write_csv(rows, output)
+    log(f"{len(rows)} holders written to {output}")
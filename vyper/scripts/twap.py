@@ -0,0 +1,286 @@
+"""
+Off-chain replay of `Oracle.update` / `Oracle.consult`.
+
+`ReserveHistory` rebuilds the cumulative prices of a Uniswap pair from its
+`Sync` events and `replay` evaluates any number of oracle debounce periods
+against the same history. The fixed point math is done on python integers
+so the averages are bit-exact with the contracts: uq112x112 values do not
+fit into machine words, that's why there are no numpy arrays here. The
+cumulative prices for all keeper ticks are computed once and shared by all
+periods, every period then only jumps between its own updates.
+"""
+
+import sys
+from bisect import bisect_left, bisect_right
+
+from scripts.utils import log
+
+RESOLUTION = 112
+UINT224_MASK = 2 ** 224 - 1
+UINT256 = 2 ** 256
+
+
+def encode_price(reserve_in, reserve_out):
+    """
+    uq112x112 price of the `reserve_in` token in `reserve_out` tokens, the same
+    as `UQ112x112.encode(reserve_out).uqdiv(reserve_in)` in the pair and
+    `FixedPoint.fraction(reserve_out, reserve_in)` in the oracle library.
+    """
+    return (reserve_out << RESOLUTION) // reserve_in
+
+
+def consult(average, amount_in):
+    """
+    `FixedPoint.uq112x112(average).mul(amount_in).decode144()` as in `Oracle.consult`.
+    """
+    amount = average * amount_in
+    if amount >= UINT256:
+        raise OverflowError("FixedPoint: MULTIPLICATION_OVERFLOW")
+    return amount >> RESOLUTION
+
+
+class ReserveHistory:
+    """
+    Reserves of a Uniswap pair over time.
+
+    Arguments
+    ---------
+    timestamps : list
+        Block timestamps of the snapshots, ascending.
+    reserves0 : list
+        `reserve0` of the pair after the snapshot block.
+    reserves1 : list
+        `reserve1` of the pair after the snapshot block.
+
+    Several snapshots in the same block are collapsed into the last one, the
+    same way the pair accumulates prices only once per block.
+    """
+
+    def __init__(self, timestamps, reserves0, reserves1):
+        assert len(timestamps) == len(reserves0) == len(reserves1)
+        assert len(timestamps) > 0, "empty reserve history"
+        self.timestamps = []
+        self.reserves0 = []
+        self.reserves1 = []
+        for t, r0, r1 in zip(timestamps, reserves0, reserves1):
+            if self.timestamps and t == self.timestamps[-1]:
+                self.reserves0[-1] = r0
+                self.reserves1[-1] = r1
+                continue
+            assert not self.timestamps or t > self.timestamps[-1], "snapshots must be sorted"
+            self.timestamps.append(t)
+            self.reserves0.append(r0)
+            self.reserves1.append(r1)
+
+        # the pair doesn't accumulate while one of the reserves is empty
+        self.prices0 = [
+            encode_price(r0, r1) if r0 and r1 else 0
+            for r0, r1 in zip(self.reserves0, self.reserves1)
+        ]
+        self.prices1 = [
+            encode_price(r1, r0) if r0 and r1 else 0
+            for r0, r1 in zip(self.reserves0, self.reserves1)
+        ]
+
+        # `priceXCumulativeLast` stored by the pair at every snapshot (relative to the first one)
+        self.cumulative0 = [0]
+        self.cumulative1 = [0]
+        for i in range(1, len(self.timestamps)):
+            dt = self.timestamps[i] - self.timestamps[i - 1]
+            self.cumulative0.append(self.cumulative0[-1] + self.prices0[i - 1] * dt)
+            self.cumulative1.append(self.cumulative1[-1] + self.prices1[i - 1] * dt)
+
+    @classmethod
+    def from_snapshots(cls, snapshots):
+        """
+        Build history from an iterable of `(timestamp, reserve0, reserve1)`.
+        """
+        snapshots = sorted(snapshots, key=lambda s: s[0])
+        return cls(*zip(*snapshots)) if snapshots else cls([], [], [])
+
+    def _indexes(self, times):
+        indexes = [bisect_right(self.timestamps, t) - 1 for t in times]
+        if indexes and min(indexes) < 0:
+            raise ValueError("time is before the first snapshot")
+        return indexes
+
+    def stored_cumulative_prices(self, times):
+        """
+        `price0CumulativeLast`, `price1CumulativeLast` and `blockTimestampLast` of the pair at `times`.
+        """
+        indexes = self._indexes(times)
+        return (
+            [self.cumulative0[i] for i in indexes],
+            [self.cumulative1[i] for i in indexes],
+            [self.timestamps[i] for i in indexes],
+        )
+
+    def cumulative_prices(self, times):
+        """
+        `UniswapV2OracleLibrary.currentCumulativePrices` at `times`.
+        """
+        indexes = self._indexes(times)
+        cumulative0 = [
+            self.cumulative0[i] + self.prices0[i] * (t - self.timestamps[i])
+            for i, t in zip(indexes, times)
+        ]
+        cumulative1 = [
+            self.cumulative1[i] + self.prices1[i] * (t - self.timestamps[i])
+            for i, t in zip(indexes, times)
+        ]
+        return cumulative0, cumulative1
+
+
+class OracleReplay:
+    """
+    Successful `Oracle.update` calls of one oracle deployment.
+
+    Arguments
+    ---------
+    period : int
+        Debounce period of the oracle.
+    update_times : list
+        Timestamps of successful updates.
+    price0_averages : list
+        `price0Average` after each update (uq112x112).
+    price1_averages : list
+        `price1Average` after each update (uq112x112).
+    """
+
+    def __init__(self, period, update_times, price0_averages, price1_averages):
+        self.period = period
+        self.update_times = update_times
+        self.price0_averages = price0_averages
+        self.price1_averages = price1_averages
+
+    def averages_at(self, times):
+        """
+        `price0Average` and `price1Average` as seen by a call at each of `times`.
+        Both are 0 before the first update.
+        """
+        price0 = []
+        price1 = []
+        for t in times:
+            i = bisect_right(self.update_times, t) - 1
+            price0.append(self.price0_averages[i] if i >= 0 else 0)
+            price1.append(self.price1_averages[i] if i >= 0 else 0)
+        return price0, price1
+
+    def consult(self, token_index, amount_in, times):
+        """
+        `Oracle.consult` at each of `times`.
+
+        Arguments
+        ---------
+        token_index : int
+            0 to price `token0` of the pair, 1 to price `token1`.
+        amount_in : int
+            Amount of the priced token.
+        times : list
+            Timestamps of the calls.
+        """
+        averages = self.averages_at(times)[token_index]
+        return [consult(average, amount_in) for average in averages]
+
+
+def replay(history, periods, ticks, deployed_at=None, start=0, last_called=0):
+    """
+    Replay `Oracle` deployments with different debounce periods.
+
+    Arguments
+    ---------
+    history : ReserveHistory
+        Reserves of the oracle pair.
+    periods : list
+        Debounce periods to evaluate, in seconds.
+    ticks : list
+        Timestamps when the keeper calls `update`. A call is successful
+        if the debounce period since the last successful call has passed.
+    deployed_at : int
+        Timestamp of the oracle deployment, the first tick by default.
+    start : int
+        `start` of the oracle (see `Timeboundable`).
+    last_called : int
+        Initial `lastCalled` of the oracle (0 for a fresh deployment).
+
+    Returns
+    -------
+    dict
+        `OracleReplay` for each period.
+    """
+    ticks = sorted(set(ticks))
+    if deployed_at is None:
+        deployed_at = ticks[0] if ticks else history.timestamps[0]
+    ticks = ticks[bisect_left(ticks, max(deployed_at, start)):]
+    (deployed0,), (deployed1,), _ = history.stored_cumulative_prices([deployed_at])
+    cumulative0, cumulative1 = history.cumulative_prices(ticks)
+
+    result = {}
+    for period in periods:
+        update_times = []
+        price0_averages = []
+        price1_averages = []
+        last0 = deployed0
+        last1 = deployed1
+        last = last_called
+        i = bisect_left(ticks, last + period)
+        while i < len(ticks):
+            t = ticks[i]
+            elapsed = t - last
+            if elapsed == 0:
+                # `update` in the same block as `lastCalled` divides by zero
+                i += 1
+                continue
+            # overflow is desired, casting to uint224 truncates
+            price0_averages.append((cumulative0[i] - last0) % UINT256 // elapsed & UINT224_MASK)
+            price1_averages.append((cumulative1[i] - last1) % UINT256 // elapsed & UINT224_MASK)
+            update_times.append(t)
+            last0 = cumulative0[i]
+            last1 = cumulative1[i]
+            last = t
+            i = bisect_left(ticks, last + period, i + 1)
+        result[period] = OracleReplay(period, update_times, price0_averages, price1_averages)
+    return result
+
+
+def history_from_pair(pair, from_block, to_block=None):
+    """
+    Build `ReserveHistory` from the `Sync` events of a deployed pair.
+    """
+    from brownie import web3
+
+    timestamps = {}
+    snapshots = []
+    for event in pair.events.get_sequence(from_block, to_block, "Sync"):
+        block = event.blockNumber
+        if block not in timestamps:
+            timestamps[block] = web3.eth.get_block(block).timestamp
+        snapshots.append((timestamps[block], event.args.reserve0, event.args.reserve1))
+    return ReserveHistory.from_snapshots(snapshots)
+
+
+def main(pair_address=None, from_block=0, periods="1800,3600,7200,14400", tick=60):
+    """
+    Print how the oracle average of a pair would have looked for different periods.
+
+    brownie run twap main <pair> <from_block> <periods> <tick> --network mainnet
+    """
+    from scripts.hardhat import at
+
+    if pair_address is None:
+        sys.exit("Usage: brownie run twap main <pair> [from_block] [periods] [tick]")
+    history = history_from_pair(at("UniswapV2Pair", pair_address), int(from_block))
+    first, last = history.timestamps[0], history.timestamps[-1]
+    ticks = list(range(first, last + 1, int(tick)))
+    replays = replay(history, [int(p) for p in periods.split(",")], ticks)
+    for period, r in replays.items():
+        if not r.update_times:
+            log(f"period {period}: no updates")
+            continue
+        # skip the first update, it averages since the oracle `lastCalled` of 0
+        averages = r.price0_averages[1:] or r.price0_averages
+        log(
+            f"period {period}: {len(r.update_times)} updates, "
+            f"price0Average min {min(averages) / 2 ** RESOLUTION:.6g} "
+            f"max {max(averages) / 2 ** RESOLUTION:.6g}"
+        )
@@ -0,0 +1,253 @@
+"""
+Off-chain mirror of `contracts/libraries/UniswapLibrary.sol`.
+
+Keepers and StabFund traders price many candidate trades against the same
+pool state before sending one. `Snapshot` reads the reserves of all pairs of
+interest at one block with a single `Multicall.aggregate` call, then `quote`
+and `amounts_out` evaluate whole lists of amounts and multi-hop paths
+without touching the node again.
+
+The math is done on python integers with the same rounding and the same
+reverts as the library, `SafeMath` overflows included, so the results are
+bit-exact with `UniswapLibrary.getAmountsOut` and the router. As in
+`twap.py` there are no numpy arrays: `amount * 997 * reserve` of 18 decimal
+tokens doesn't fit into machine words. The checks that depend only on the
+reserves are done once per hop, the per amount work is a list comprehension.
+In the batch results the amounts the contracts would revert on are None.
+
+brownie run uniswap_quote main <multicall> <factory> <amount> <token> [token ...] --network mainnet
+"""
+
+import sys
+
+from eth_abi import decode_abi
+from eth_utils import keccak, to_checksum_address
+from hexbytes import HexBytes
+
+from scripts import hardhat
+from scripts.utils import log
+
+PAIR_INIT_CODE_HASH = bytes.fromhex(
+    "96e8ac4277198ff8b6f785478aa9a39f403cb768dd02cbee326c3e7da348845f"
+)
+GET_RESERVES = keccak(text="getReserves()")[:4]
+FEE_NUMERATOR = 997
+FEE_DENOMINATOR = 1000
+UINT256 = 2 ** 256
+UINT256_MAX = UINT256 - 1
+
+
+def _address(address):
+    return int(str(address), 16)
+
+
+def _mul(a, b):
+    result = a * b
+    if result >= UINT256:
+        raise OverflowError("SafeMath: multiplication overflow")
+    return result
+
+
+def sort_tokens(token_a, token_b):
+    """
+    Token addresses of a pair in the order of the pair, as `sortTokens`.
+    """
+    if _address(token_a) == _address(token_b):
+        raise ValueError("UniswapV2Library: IDENTICAL_ADDRESSES")
+    if _address(token_a) < _address(token_b):
+        token0, token1 = token_a, token_b
+    else:
+        token0, token1 = token_b, token_a
+    if _address(token0) == 0:
+        raise ValueError("UniswapV2Library: ZERO_ADDRESS")
+    return token0, token1
+
+
+def pair_for(factory, token_a, token_b):
+    """
+    CREATE2 address of the Uniswap pair without any calls, as `pairFor`.
+    """
+    token0, token1 = sort_tokens(token_a, token_b)
+    salt = keccak(
+        _address(token0).to_bytes(20, "big") + _address(token1).to_bytes(20, "big")
+    )
+    return to_checksum_address(
+        keccak(b"\xff" + _address(factory).to_bytes(20, "big") + salt + PAIR_INIT_CODE_HASH)[12:]
+    )
+
+
+def quote(amount_a, reserve_a, reserve_b):
+    """
+    Amount of token B worth `amount_a` of token A at the reserves, no slippage.
+    """
+    if amount_a <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_AMOUNT")
+    if reserve_a <= 0 or reserve_b <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+    return _mul(amount_a, reserve_b) // reserve_a
+
+
+def get_amount_out(amount_in, reserve_in, reserve_out):
+    """
+    Output amount of a swap of `amount_in` after the 0.3% fee.
+    """
+    if amount_in <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_INPUT_AMOUNT")
+    if reserve_in <= 0 or reserve_out <= 0:
+        raise ValueError("UniswapV2Library: INSUFFICIENT_LIQUIDITY")
+    amount_in_with_fee = _mul(amount_in, FEE_NUMERATOR)
+    numerator = _mul(amount_in_with_fee, reserve_out)
+    denominator = _mul(reserve_in, FEE_DENOMINATOR) + amount_in_with_fee
+    if denominator >= UINT256:
+        raise OverflowError("SafeMath: addition overflow")
+    return numerator // denominator
+
+
+def get_amounts_out(amount_in, path, reserves):
+    """
+    Amounts of every token of a swap along `path`, as `getAmountsOut`.
+
+    Arguments
+    ---------
+    amount_in : int
+        Amount of the first token of the path.
+    path : list
+        Token addresses, every neighbouring two make a pair.
+    reserves : callable
+        `reserves(token_a, token_b)` returns the reserves of the pair in the
+        order of the arguments, e.g. `Snapshot.reserves`.
+    """
+    if len(path) < 2:
+        raise ValueError("UniswapV2Library: INVALID_PATH")
+    amounts = [amount_in]
+    for token_in, token_out in zip(path, path[1:]):
+        amounts.append(get_amount_out(amounts[-1], *reserves(token_in, token_out)))
+    return amounts
+
+
+def quote_many(amounts, reserve_a, reserve_b):
+    """
+    `quote` of every amount at the same reserves, None where it reverts.
+    """
+    if reserve_a <= 0 or reserve_b <= 0:
+        return [None] * len(amounts)
+    # `amount * reserve_b` overflows above this
+    limit = UINT256_MAX // reserve_b
+    return [
+        a * reserve_b // reserve_a if a is not None and 0 < a <= limit else None
+        for a in amounts
+    ]
+
+
+def amounts_out_many(amounts, reserve_in, reserve_out):
+    """
+    `get_amount_out` of every amount at the same reserves, None where it reverts.
+    """
+    if reserve_in <= 0 or reserve_out <= 0 or reserve_in * FEE_DENOMINATOR >= UINT256:
+        return [None] * len(amounts)
+    base = reserve_in * FEE_DENOMINATOR
+    # neither the numerator nor the denominator overflow up to this
+    limit = min(UINT256_MAX // reserve_out, UINT256_MAX - base) // FEE_NUMERATOR
+    return [
+        a * FEE_NUMERATOR * reserve_out // (base + a * FEE_NUMERATOR)
+        if a is not None and 0 < a <= limit else None
+        for a in amounts
+    ]
+
+
+def get_amounts_out_many(amounts, path, reserves):
+    """
+    `get_amounts_out` of every amount, one list of amounts per token of the path.
+
+    The reserves of every hop are looked up once. If the swap of an amount
+    reverts on any hop, all its amounts are None, the same way the whole
+    `getAmountsOut` call reverts.
+    """
+    if len(path) < 2:
+        raise ValueError("UniswapV2Library: INVALID_PATH")
+    columns = [list(amounts)]
+    for token_in, token_out in zip(path, path[1:]):
+        columns.append(amounts_out_many(columns[-1], *reserves(token_in, token_out)))
+    reverted = [i for i, a in enumerate(columns[-1]) if a is None]
+    for column in columns:
+        for i in reverted:
+            column[i] = None
+    return columns
+
+
+class Snapshot:
+    """
+    Reserves of Uniswap pairs at one block.
+
+    Arguments
+    ---------
+    factory : str
+        Uniswap factory the pairs were created by.
+    reserves : dict
+        `(reserve0, reserve1)` by pair address, pairs without code are missing.
+    block : int
+        Block the reserves were read at.
+    """
+
+    def __init__(self, factory, reserves, block=None):
+        self.factory = factory
+        self.block = block
+        self._reserves = {_address(pair): r for pair, r in reserves.items()}
+
+    @classmethod
+    def load(cls, multicall, factory, pairs, block=None):
+        """
+        Read the reserves of all `(token_a, token_b)` pairs in one `eth_call`.
+        """
+        addresses = list(dict.fromkeys(pair_for(factory, a, b) for a, b in pairs))
+        block, successes, results = multicall.aggregate.call(
+            addresses, [GET_RESERVES] * len(addresses), block_identifier=block
+        )
+        reserves = {}
+        for pair, success, result in zip(addresses, successes, results):
+            result = bytes(HexBytes(result))
+            # a call to an address without code succeeds with no data
+            if success and result:
+                reserve0, reserve1, _ = decode_abi(["uint112", "uint112", "uint32"], result)
+                reserves[pair] = (reserve0, reserve1)
+        return cls(factory, reserves, block)
+
+    def reserves(self, token_a, token_b):
+        """
+        Reserves of the pair in the order of the arguments, as `getReserves`.
+        """
+        token0, _ = sort_tokens(token_a, token_b)
+        pair = pair_for(self.factory, token_a, token_b)
+        if _address(pair) not in self._reserves:
+            raise KeyError(f"No reserves of {token_a}-{token_b} pair {pair}")
+        reserve0, reserve1 = self._reserves[_address(pair)]
+        if _address(token_a) == _address(token0):
+            return reserve0, reserve1
+        return reserve1, reserve0
+
+    def quote(self, amounts, token_a, token_b):
+        """
+        `quote_many` at the reserves of the pair.
+        """
+        return quote_many(amounts, *self.reserves(token_a, token_b))
+
+    def amounts_out(self, amounts, path):
+        """
+        `get_amounts_out_many` at the reserves of the snapshot.
+        """
+        return get_amounts_out_many(amounts, path, self.reserves)
+
+
+def main(multicall, factory, amount, *path):
+    """
+    Print the amounts of a swap of `amount` along `path` at the latest block.
+    """
+    if len(path) < 2:
+        sys.exit("At least two tokens are required")
+    snapshot = Snapshot.load(
+        hardhat.at("Multicall", multicall), factory, list(zip(path, path[1:]))
+    )
+    amounts = get_amounts_out(int(amount), path, snapshot.reserves)
+    log(f"Block {snapshot.block}")
+    for token, value in zip(path, amounts):
+        log(f"{token}: {value}")
@@ -0,0 +1,7 @@
+from datetime import datetime
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def log(message):
+    print(f"[{datetime.utcnow().isoformat()}] {message}")
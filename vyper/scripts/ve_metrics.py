@@ -0,0 +1,302 @@
+"""
+Prometheus exporter of VeBoardroom checkpoint lag and claim backlog.
+
+Every poll reads the boardroom, its tokens and all VeToken holders through
+`Multicall.valuesOf` (see `contracts/Multicall.sol`), hundreds of values per
+`eth_call`, at one block. Holders are discovered from the VeToken `Deposit`
+logs, only new blocks are scanned on later polls. The gauges are served in
+the Prometheus text format:
+
+* `veboardroom_checkpoint_lag_weeks` - weeks of ve supply not checkpointed yet
+* `veboardroom_token_checkpoint_age_seconds`, `veboardroom_token_stale` and
+  `veboardroom_stale_tokens` - tokens not checkpointed for longer than
+  `TOKEN_CHECKPOINT_DEADLINE`
+* `veboardroom_unclaimed_weeks` - quantiles of weeks with fees each holder
+  hasn't claimed yet, `veboardroom_backlog_holders` - holders that need more
+  than one claim (`CLAIM_WEEKS`) to catch up
+* `veboardroom_catch_up_gas` - rough gas estimate of the checkpoints and
+  claims needed to catch up
+
+brownie run ve_metrics main <ve_boardroom> <multicall> <from_block> [port] [interval] --network mainnet
+"""
+
+import math
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from brownie import VeBoardroom, VeToken, web3
+from brownie.convert import to_address
+
+from scripts import hardhat
+from scripts.snapshot import discover_holders
+from scripts.utils import log
+
+WEEK = 86400 * 7
+TOKEN_CHECKPOINT_DEADLINE = 86400  # the same as in VeBoardroom
+CLAIM_WEEKS = 50  # weeks one `claim` iterates over at most
+SUPPLY_WEEKS = 20  # weeks one `checkpoint_total_supply` fills at most
+BATCH_SIZE = 500  # calls per eth_call
+WORKERS = 8
+QUANTILES = (0.5, 0.9, 0.99, 1.0)
+
+# Rough gas costs, only meant to show the order of magnitude of the backlog
+CHECKPOINT_GAS = 60_000  # `checkpoint_total_supply` call
+CHECKPOINT_WEEK_GAS = 30_000  # every week it fills (a binary search over epochs)
+CLAIM_GAS = 90_000  # `claim` call with a token transfer
+CLAIM_WEEK_GAS = 6_000  # every week it iterates over
+
+TokenStats = namedtuple(
+    "TokenStats", ["token", "last_token_time", "unclaimed_weeks"]
+)
+BoardroomStats = namedtuple(
+    "BoardroomStats", ["block", "timestamp", "time_cursor", "tokens", "holders"]
+)
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _address(value):
+    return to_address(f"0x{value:040x}")
+
+
+def checkpoint_lag_weeks(time_cursor, timestamp):
+    """
+    Weeks up to the current one that `checkpoint_total_supply` hasn't filled.
+    """
+    return max(0, (timestamp // WEEK * WEEK + WEEK - time_cursor) // WEEK)
+
+
+def unclaimed_weeks(cursor, first_ts, lock_end, start_time, last_token_time):
+    """
+    Weeks `claim` of a holder still has to iterate over, the same way as
+    `VeBoardroom._claim`.
+
+    Arguments
+    ---------
+    cursor : int
+        `time_cursor_of(token, holder)`, 0 if the holder never claimed.
+    first_ts : int
+        Time of the first point of the holder.
+    lock_end : int
+        End of the lock (or time of the withdrawal), no fees after it.
+    start_time : int
+        `start_time(token)`.
+    last_token_time : int
+        `last_token_time(token)`, fees after it are not distributed yet.
+    """
+    if cursor == 0:
+        cursor = max((first_ts + WEEK - 1) // WEEK * WEEK, start_time)
+    end = min(last_token_time // WEEK * WEEK, lock_end)
+    if cursor >= end:
+        return 0
+    return (end - cursor + WEEK - 1) // WEEK
+
+
+def quantile(values, q):
+    """
+    Nearest-rank quantile of sorted `values`, 0 if there are none.
+    """
+    if not values:
+        return 0
+    return values[max(1, math.ceil(len(values) * q)) - 1]
+
+
+def catch_up_gas(lag_weeks, weeks):
+    """
+    Gas of checkpoints for `lag_weeks` and claims of holders with `weeks`
+    unclaimed weeks each.
+
+    Returns
+    -------
+    int
+        Checkpoint gas.
+    int
+        Claims gas.
+    """
+    checkpoints = -(-lag_weeks // SUPPLY_WEEKS)
+    checkpoint = checkpoints * CHECKPOINT_GAS + lag_weeks * CHECKPOINT_WEEK_GAS
+    claims = sum(-(-w // CLAIM_WEEKS) * CLAIM_GAS + w * CLAIM_WEEK_GAS for w in weeks)
+    return checkpoint, claims
+
+
+class Exporter:
+    """
+    Arguments
+    ---------
+    ve_boardroom : Contract
+        `VeBoardroom` contract.
+    multicall : Contract
+        Deployed `Multicall` contract.
+    from_block : int
+        Deployment block of the VeToken, holders are discovered from it.
+    """
+
+    def __init__(self, ve_boardroom, multicall, from_block, workers=WORKERS, batch_size=BATCH_SIZE):
+        self.ve_boardroom = ve_boardroom
+        self.ve_token = VeToken.at(ve_boardroom.voting_escrow())
+        self.multicall = multicall
+        self.workers = workers
+        self.batch_size = batch_size
+        self.holders = set()
+        self._next_block = int(from_block)
+
+    def _values(self, contract, calls, block):
+        """
+        Read `(method, *args)` calls of `contract` at `block` in batches.
+        """
+        data = [getattr(contract, method).encode_input(*args) for method, *args in calls]
+
+        def fetch(batch):
+            return self.multicall.valuesOf.call(
+                contract.address, batch, block_identifier=block)
+
+        values = []
+        with ThreadPoolExecutor(self.workers) as executor:
+            for batch in executor.map(fetch, _chunks(data, self.batch_size)):
+                values.extend(batch)
+        return values
+
+    def _discover(self, block):
+        if block >= self._next_block:
+            self.holders.update(discover_holders(
+                self.ve_token, "vetoken", self._next_block, block, self.workers))
+            self._next_block = block + 1
+        return sorted(self.holders, key=str.lower)
+
+    def poll(self, block=None):
+        """
+        Read the state of the boardroom and all holders at `block`.
+
+        Returns
+        -------
+        BoardroomStats
+        """
+        block = block or web3.eth.block_number
+        timestamp = web3.eth.get_block(block).timestamp
+        room = self.ve_boardroom
+        time_cursor, tokens_len = self._values(
+            room, [("time_cursor",), ("tokens_len",)], block)
+        tokens = [_address(v) for v in self._values(
+            room, [("tokens", i) for i in range(tokens_len)], block)]
+        token_times = self._values(
+            room,
+            [(m, t) for t in tokens for m in ("start_time", "last_token_time")],
+            block,
+        )
+
+        holders = self._discover(block)
+        epochs = self._values(self.ve_token, [("user_point_epoch", h) for h in holders], block)
+        holders = [h for h, epoch in zip(holders, epochs) if epoch > 0]
+        epochs = [e for e in epochs if e > 0]
+        points = self._values(
+            self.ve_token,
+            [("user_point_history__ts", h, i) for h, e in zip(holders, epochs) for i in (1, e)]
+            + [("locked__end", h) for h in holders],
+            block,
+        )
+        first_ts, last_ts = points[:2 * len(holders):2], points[1:2 * len(holders):2]
+        # withdrawn locks have no end, their last point is the withdrawal
+        lock_ends = [end or last for end, last in zip(points[2 * len(holders):], last_ts)]
+        cursors = self._values(
+            room, [("time_cursor_of", t, h) for t in tokens for h in holders], block)
+
+        stats = []
+        for i, token in enumerate(tokens):
+            start_time, last_token_time = token_times[2 * i:2 * i + 2]
+            token_cursors = cursors[i * len(holders):(i + 1) * len(holders)]
+            weeks = [
+                unclaimed_weeks(c, f, e, start_time, last_token_time)
+                for c, f, e in zip(token_cursors, first_ts, lock_ends)
+            ]
+            stats.append(TokenStats(token, last_token_time, sorted(weeks)))
+        return BoardroomStats(block, timestamp, time_cursor, stats, len(holders))
+
+    def render(self, stats):
+        """
+        Gauges of `stats` in the Prometheus text format.
+        """
+        room = f'boardroom="{self.ve_boardroom.address}"'
+        lag = checkpoint_lag_weeks(stats.time_cursor, stats.timestamp)
+        lines = []
+
+        def gauge(name, help, samples):
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in samples:
+                lines.append(f"{name}{{{','.join((room,) + labels)}}} {value}")
+
+        def token(t):
+            return f'token="{t.token}"'
+
+        gauge("veboardroom_block", "Block the values are read at", [((), stats.block)])
+        gauge("veboardroom_checkpoint_lag_weeks", "Weeks of ve supply not checkpointed yet",
+              [((), lag)])
+        gauge("veboardroom_token_checkpoint_age_seconds", "Time since the last token checkpoint",
+              [((token(t),), stats.timestamp - t.last_token_time) for t in stats.tokens])
+        stale = [
+            t for t in stats.tokens
+            if stats.timestamp > t.last_token_time + TOKEN_CHECKPOINT_DEADLINE
+        ]
+        gauge("veboardroom_token_stale", "1 if the token checkpoint is older than the deadline",
+              [((token(t),), int(t in stale)) for t in stats.tokens])
+        gauge("veboardroom_stale_tokens", "Tokens with checkpoints older than the deadline",
+              [((), len(stale))])
+        gauge("veboardroom_holders", "VeToken holders with locks", [((), stats.holders)])
+        gauge("veboardroom_unclaimed_weeks", "Quantiles of unclaimed weeks per holder",
+              [((token(t), f'quantile="{q}"'), quantile(t.unclaimed_weeks, q))
+               for t in stats.tokens for q in QUANTILES])
+        gauge("veboardroom_backlog_holders", f"Holders with more than {CLAIM_WEEKS} unclaimed weeks",
+              [((token(t),), sum(w > CLAIM_WEEKS for w in t.unclaimed_weeks))
+               for t in stats.tokens])
+        checkpoint = catch_up_gas(lag, [])[0]
+        gauge("veboardroom_catch_up_gas", "Estimated gas of checkpoints and claims to catch up",
+              [(('kind="checkpoint"',), checkpoint)]
+              + [((token(t), 'kind="claims"'), catch_up_gas(0, t.unclaimed_weeks)[1])
+                 for t in stats.tokens])
+        return "\n".join(lines) + "\n"
+
+
+def serve(exporter, port, interval):
+    """
+    Poll every `interval` seconds and serve the last gauges on `port`.
+    """
+    metrics = [exporter.render(exporter.poll())]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = metrics[0].encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    log(f"Serving metrics on port {port}")
+    while True:
+        time.sleep(interval)
+        try:
+            metrics[0] = exporter.render(exporter.poll())
+        except Exception as e:
+            log(f"Poll failed: {e}")
+
+
+def main(ve_boardroom=None, multicall=None, from_block=0, port=9105, interval=60):
+    if None in (ve_boardroom, multicall):
+        sys.exit(
+            "Usage: brownie run ve_metrics main <ve_boardroom> <multicall> <from_block> [port] [interval]"
+        )
+    exporter = Exporter(
+        VeBoardroom.at(ve_boardroom), hardhat.at("Multicall", multicall), int(from_block)
+    )
+    serve(exporter, int(port), int(interval))
@@ -0,0 +1,54 @@
+"""
+Voting power of any number of holders with `VeToken.balanceOfManyAt` and
+`VeToken.balanceOfMany`, which take fixed pages of `MAX_BATCH` addresses.
+"""
+
+from scripts.utils import ZERO_ADDRESS
+
+MAX_BATCH = 100  # `MAX_BATCH` in VeToken.vy
+
+
+def _pages(holders, page):
+    holders = [str(h) for h in holders]
+    for i in range(0, len(holders), page):
+        batch = holders[i:i + page]
+        yield len(batch), batch + [ZERO_ADDRESS] * (MAX_BATCH - len(batch))
+
+
+def balances_at(ve_token, holders, block, page=MAX_BATCH):
+    """
+    `VeToken.balanceOfAt(holder, block)` for every holder.
+
+    Arguments
+    ---------
+    ve_token : Contract
+        `VeToken` contract.
+    holders : list
+        Holder addresses, any number.
+    block : int
+        Block to measure voting power at.
+    page : int
+        Holders per call, at most `MAX_BATCH`.
+
+    Returns
+    -------
+    list
+        Voting power in the order of `holders`.
+    """
+    assert 0 < page <= MAX_BATCH
+    result = []
+    for size, batch in _pages(holders, page):
+        result.extend(ve_token.balanceOfManyAt(batch, block)[:size])
+    return result
+
+
+def balances(ve_token, holders, t=None, page=MAX_BATCH):
+    """
+    `VeToken.balanceOf(holder, t)` for every holder, at the latest block by default.
+    """
+    assert 0 < page <= MAX_BATCH
+    result = []
+    for size, batch in _pages(holders, page):
+        values = ve_token.balanceOfMany(batch) if t is None else ve_token.balanceOfMany(batch, t)
+        result.extend(values[:size])
+    return result
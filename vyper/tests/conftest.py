@@ -1,5 +1,7 @@
 import pytest
 
+from scripts import hardhat
+
 
 @pytest.fixture(autouse=True)
 def isolation_setup(fn_isolation):
@@ -59,3 +61,103 @@ def ve_boardroom(VeBoardroom, ve_token, accounts):
         )
 
     yield f
+
+
+@pytest.fixture(scope="module")
+def multicall(alice):
+    if not hardhat.has_artifacts():
+        pytest.skip("Solidity artifacts are missing, run `yarn compile` in the repository root")
+    yield hardhat.deploy("Multicall", sender=alice)
+
+
+@pytest.fixture(scope="module")
+def uniswap(accounts):
+    if not hardhat.has_artifacts():
+        pytest.skip("Solidity artifacts are missing, run `yarn compile` in the repository root")
+    factory = hardhat.deploy(
+        "UniswapV2Factory", accounts[0], sender=accounts[0])
+    router = hardhat.deploy(
+        "UniswapV2Router02", factory, accounts[0], sender=accounts[0])
+    yield factory, router
+
+
+@pytest.fixture(scope="module")
+def uniswap_pair(uniswap, accounts, chain):
+    factory, router = uniswap
+
+    def f(decimals_underlying=8, decimals_synthetic=18):
+        """
+        Deploy underlying and synthetic tokens and add 10 units of both to Uniswap.
+        """
+        underlying = hardhat.deploy(
+            "SyntheticToken", "WBTC", "WBTC", decimals_underlying, sender=accounts[0])
+        synthetic = hardhat.deploy(
+            "SyntheticToken", "KBTC", "KBTC", decimals_synthetic, sender=accounts[0])
+        for tkn, decimals in ((underlying, decimals_underlying), (synthetic, decimals_synthetic)):
+            tkn.mint(accounts[0], 10 ** (decimals + 6), {"from": accounts[0]})
+            tkn.approve(router, 2 ** 256 - 1, {"from": accounts[0]})
+        router.addLiquidity(
+            underlying,
+            synthetic,
+            10 ** (decimals_underlying + 1),
+            10 ** (decimals_synthetic + 1),
+            10 ** (decimals_underlying + 1),
+            10 ** (decimals_synthetic + 1),
+            accounts[0],
+            chain.time() + 1000000,
+            {"from": accounts[0]},
+        )
+        pair = hardhat.at(
+            "UniswapV2Pair", factory.getPair(underlying, synthetic))
+        return underlying, synthetic, pair
+
+    yield f
+
+
+@pytest.fixture(scope="module")
+def treasury(uniswap, accounts, chain):
+    factory, _ = uniswap
+    alice = accounts[0]
+    token_manager = hardhat.deploy("TokenManager", factory, sender=alice)
+    bond_manager = hardhat.deploy("BondManager", chain.time(), sender=alice)
+    emission_manager = hardhat.deploy(
+        "EmissionManager", chain.time(), 86400, sender=alice)
+    boardrooms = [hardhat.deploy("BoardroomMock", sender=alice)
+                  for _ in range(3)]
+
+    token_manager.setBondManager(bond_manager, {"from": alice})
+    token_manager.setEmissionManager(emission_manager, {"from": alice})
+    bond_manager.setTokenManager(token_manager, {"from": alice})
+    emission_manager.setTokenManager(token_manager, {"from": alice})
+    emission_manager.setBondManager(bond_manager, {"from": alice})
+    emission_manager.setLiquidBoardroom(boardrooms[0], {"from": alice})
+    emission_manager.setVeBoardroom(boardrooms[1], {"from": alice})
+    emission_manager.setUniswapBoardroom(boardrooms[2], {"from": alice})
+    emission_manager.setStableFund(accounts[1], {"from": alice})
+    emission_manager.setDevFund(accounts[2], {"from": alice})
+    yield token_manager, bond_manager, emission_manager
+
+
+@pytest.fixture(scope="module")
+def managed_token(uniswap, uniswap_pair, treasury, accounts, chain):
+    factory, _ = uniswap
+    token_manager, bond_manager, _ = treasury
+    alice = accounts[0]
+
+    def f(oracle_period=3600):
+        """
+        Add a new synthetic token with its oracle and bond to TokenManager.
+        """
+        underlying, synthetic, pair = uniswap_pair()
+        oracle = hardhat.deploy(
+            "Oracle", factory, underlying, synthetic, oracle_period, chain.time(), sender=alice)
+        bond = hardhat.deploy(
+            "SyntheticToken", "KBond", "KBond", synthetic.decimals(), sender=alice)
+        synthetic.transferOperator(token_manager, {"from": alice})
+        synthetic.transferOwnership(token_manager, {"from": alice})
+        bond.transferOperator(bond_manager, {"from": alice})
+        bond.transferOwnership(bond_manager, {"from": alice})
+        token_manager.addToken(synthetic, bond, underlying, oracle, {"from": alice})
+        return underlying, synthetic, bond, oracle, pair
+
+    yield f
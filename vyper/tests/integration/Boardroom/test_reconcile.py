@@ -0,0 +1,242 @@
+import random
+import time
+
+import pytest
+
+from scripts import hardhat
+from scripts.reconcile import ACCRUE, BALANCE, NOTIFY, PAID, Ledger, audit, reconcile
+
+
+@pytest.fixture(scope="module")
+def boardroom(multicall, accounts, chain):
+    alice = accounts[0]
+    from_block = chain[-1].number
+    staking = hardhat.deploy("SyntheticToken", "Klon", "Klon", 18, sender=alice)
+    rewards = [
+        hardhat.deploy("SyntheticToken", name, name, 18, sender=alice) for name in ("KBTC", "KETH")
+    ]
+    token_manager = hardhat.deploy("TokenManagerMock", sender=alice)
+    for reward in rewards:
+        token_manager.addToken(reward, {"from": alice})
+    # alice plays the EmissionManager
+    room = hardhat.deploy("Boardroom", staking, token_manager, alice, chain.time(), sender=alice)
+    for acct in accounts[1:6]:
+        staking.mint(acct, 10 ** 24, {"from": alice})
+        staking.approve(room, 2 ** 256 - 1, {"from": acct})
+    yield room, staking, rewards, from_block
+
+
+WEEK = 86400 * 7
+
+
+def deploy_boardroom(name, staking, accounts, chain):
+    """
+    Deploy a boardroom with two reward tokens, `accounts[1:6]` can stake `staking`.
+    """
+    alice = accounts[0]
+    rewards = [
+        hardhat.deploy("SyntheticToken", symbol, symbol, 18, sender=alice)
+        for symbol in ("KBTC", "KETH")
+    ]
+    token_manager = hardhat.deploy("TokenManagerMock", sender=alice)
+    for reward in rewards:
+        token_manager.addToken(reward, {"from": alice})
+    # alice plays the EmissionManager
+    room = hardhat.deploy(name, staking, token_manager, alice, chain.time(), sender=alice)
+    for acct in accounts[1:6]:
+        staking.transfer(acct, 10 ** 24, {"from": alice})
+        staking.approve(room, 2 ** 256 - 1, {"from": acct})
+    return room, rewards
+
+
+@pytest.fixture(scope="module")
+def liquid_boardroom(multicall, accounts, chain, token, ve_token):
+    from_block = chain[-1].number
+    room, rewards = deploy_boardroom("LiquidBoardroom", token, accounts, chain)
+    room.setVeToken(ve_token, {"from": accounts[0]})
+    for acct in accounts[1:6]:
+        token.approve(ve_token, 2 ** 256 - 1, {"from": acct})
+    yield room, rewards, from_block
+
+
+@pytest.fixture(scope="module")
+def uniswap_boardroom(multicall, accounts, chain, token, coin_a):
+    alice = accounts[0]
+    from_block = chain[-1].number
+    room, rewards = deploy_boardroom("UniswapBoardroom", token, accounts, chain)
+    pool = hardhat.deploy("StakingRewards", alice, alice, coin_a, coin_a, sender=alice)
+    room.setLpPool(pool, {"from": alice})
+    for acct in accounts[1:6]:
+        coin_a._mint_for_testing(10 ** 24, {"from": acct})
+        coin_a.approve(pool, 2 ** 256 - 1, {"from": acct})
+    yield room, pool, rewards, from_block
+
+
+def notify(accounts, room, reward, amount):
+    reward.mint(room, amount, {"from": accounts[0]})
+    room.notifyTransfer(reward, amount, {"from": accounts[0]})
+
+
+def random_history(accounts, room, rewards, rng, steps, change_shares):
+    """
+    Random stakes, withdrawals, claims, accruals and rewards, with
+    `change_shares(acct)` moving the share source balance of `acct` in between.
+    Starts with a reward and ends with everyone claiming, so something is paid.
+    """
+    notify(accounts, room, rewards[0], 10 ** 18)
+    for _ in range(steps):
+        acct = accounts[rng.randint(1, 5)]
+        action = rng.random()
+        if action < 0.2:
+            room.stake(accounts[rng.randint(1, 5)], rng.randint(1, 10 ** 21), {"from": acct})
+        elif action < 0.3 and room.stakingTokenBalances(acct) > 0:
+            room.withdraw(acct, rng.randint(1, room.stakingTokenBalances(acct)), {"from": acct})
+        elif action < 0.55:
+            change_shares(acct)
+        elif action < 0.65:
+            room.claimRewards(acct, {"from": acct})
+        elif action < 0.75:
+            room.updateAccruals(acct, {"from": accounts[0]})
+        elif room.shareTokenSupply() > 0:
+            notify(accounts, room, rng.choice(rewards), rng.randint(1, 10 ** 19))
+    for acct in accounts[1:6]:
+        room.claimRewards(acct, {"from": acct})
+
+
+def assert_reconciled(result, room, rewards, accounts):
+    assert result.discrepancies == []
+    holders = {str(a).lower() for a in accounts[1:6] if room.shareTokenBalance(a) > 0}
+    assert {h for _, h in result.available} >= holders
+    paid = sum(r.balanceOf(a) for r in rewards for a in accounts[1:6])
+    assert paid > 0
+
+
+def test_history_matches_chain(accounts, chain, boardroom, multicall):
+    room, _, rewards, from_block = boardroom
+    rng = random.Random(1)
+    room.stake(accounts[1], 3 * 10 ** 20 + 7, {"from": accounts[1]})
+    for step in range(30):
+        acct = accounts[rng.randint(1, 5)]
+        action = rng.random()
+        if action < 0.3:
+            # staking for someone else doesn't accrue the receiver
+            to = accounts[rng.randint(1, 5)]
+            room.stake(to, rng.randint(1, 10 ** 21), {"from": acct})
+        elif action < 0.45 and room.stakingTokenBalances(acct) > 0:
+            room.withdraw(acct, rng.randint(1, room.stakingTokenBalances(acct)), {"from": acct})
+        elif action < 0.6:
+            room.claimRewards(acct, {"from": acct})
+        elif action < 0.7:
+            room.updateAccruals(acct, {"from": accounts[0]})
+        elif room.stakingTokenSupply() > 0:
+            notify(accounts, room, rng.choice(rewards), rng.randint(1, 10 ** 19))
+    block = chain[-1].number
+
+    result = audit("boardroom", room, multicall, from_block, block, workers=3, chunk=7)
+
+    assert result.discrepancies == []
+    holders = {str(a).lower() for a in accounts[1:6] if room.stakingTokenBalances(a) > 0}
+    assert {h for _, h in result.available} >= holders
+    paid = sum(r.balanceOf(a) for r in rewards for a in accounts[1:6])
+    assert paid > 0
+
+
+def test_liquid_history_matches_chain(accounts, chain, liquid_boardroom, ve_token, multicall):
+    room, rewards, from_block = liquid_boardroom
+    rng = random.Random(3)
+
+    def change_shares(acct):
+        # locks of the VeToken count as shares without a stake
+        chain.sleep(rng.randint(0, WEEK))
+        end = ve_token.locked__end(acct)
+        if end == 0:
+            ve_token.create_lock(
+                rng.randint(1, 10 ** 21), chain.time() + 2 * WEEK, {"from": acct})
+        elif end <= chain.time():
+            ve_token.withdraw({"from": acct})
+        elif end > chain.time() + 60:
+            ve_token.increase_amount(rng.randint(1, 10 ** 21), {"from": acct})
+
+    ve_token.create_lock(3 * 10 ** 20 + 7, chain.time() + 2 * WEEK, {"from": accounts[1]})
+    random_history(accounts, room, rewards, rng, 40, change_shares)
+    block = chain[-1].number
+
+    result = audit("liquid", room, multicall, from_block, block, workers=3, chunk=7)
+
+    assert_reconciled(result, room, rewards, accounts)
+
+
+def test_uniswap_history_matches_chain(accounts, chain, uniswap_boardroom, multicall):
+    room, pool, rewards, from_block = uniswap_boardroom
+    rng = random.Random(4)
+
+    def change_shares(acct):
+        # LP tokens staked in the pool count as shares without a stake
+        if rng.random() < 0.3 and pool.balanceOf(acct) > 0:
+            pool.withdraw(rng.randint(1, pool.balanceOf(acct)), {"from": acct})
+        else:
+            pool.stake(rng.randint(1, 10 ** 21), {"from": acct})
+
+    pool.stake(3 * 10 ** 20 + 7, {"from": accounts[1]})
+    random_history(accounts, room, rewards, rng, 40, change_shares)
+    block = chain[-1].number
+
+    result = audit("uniswap", room, multicall, from_block, block, workers=3, chunk=7)
+
+    assert_reconciled(result, room, rewards, accounts)
+
+
+def test_overpayment():
+    ledger = Ledger()
+    ledger.add(1, 0, BALANCE, None, "0x1", 10 ** 20)
+    ledger.add(1, 1, BALANCE, None, "0x2", 3 * 10 ** 20)
+    ledger.add(2, 0, NOTIFY, "0xa", None, 10 ** 18)
+    ledger.add(3, 0, ACCRUE, "0xa", "0x1", 25 * 10 ** 16, 25 * 10 ** 16)
+    ledger.add(3, 1, PAID, "0xa", "0x1", 26 * 10 ** 16)
+    result = reconcile(ledger)
+    assert [(d.kind, d.expected, d.actual) for d in result.discrepancies] == [
+        ("payment", 25 * 10 ** 16, 26 * 10 ** 16)
+    ]
+    assert result.available[("0xa", "0x2")] == 75 * 10 ** 16
+    assert result.available[("0xa", "0x1")] == 0
+
+
+def test_rounding():
+    ledger = Ledger()
+    ledger.add(1, 0, BALANCE, None, "0x1", 1)
+    ledger.add(1, 1, BALANCE, None, "0x2", 2)
+    # 10 * 10^18 // 3 per share unit, then rounded down again for every holder
+    ledger.add(2, 0, NOTIFY, "0xa", None, 10)
+    ledger.add(3, 0, ACCRUE, "0xa", "0x2", 6, 6)
+    ledger.add(3, 1, ACCRUE, "0xa", "0x1", 4, 4)
+    result = reconcile(ledger)
+    assert [(d.kind, d.holder, d.expected) for d in result.discrepancies] == [
+        ("accrual", "0x1", 3),
+    ]
+    assert result.available[("0xa", "0x2")] == 6
+
+
+def test_speed():
+    rng = random.Random(2)
+    holders = [f"0x{i:040x}" for i in range(10_000)]
+    rows = []
+    for block in range(1, 300_001):
+        action = rng.random()
+        if action < 0.5:
+            rows.append((block, 1, BALANCE, None, rng.choice(holders), rng.randint(1, 10 ** 24)))
+        elif action < 0.6:
+            rows.append((block, 1, NOTIFY, "0xa", None, rng.randint(1, 10 ** 22)))
+        else:
+            # the increments are not checked here
+            rows.append((block, 0, ACCRUE, "0xa", rng.choice(holders), 0, 0))
+    # logs of different contracts come unsorted
+    rng.shuffle(rows)
+    ledger = Ledger()
+    for row in rows:
+        ledger.add(*row)
+
+    start = time.perf_counter()
+    result = reconcile(ledger)
+    elapsed = time.perf_counter() - start
+    assert len(result.available) == len(holders)
+    assert elapsed < 10
@@ -0,0 +1,127 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scripts import hardhat
+from scripts.dashboard_cache import Card, Field, PageCache, Sources, views
+
+
+@pytest.fixture(scope="module")
+def deployments(multicall, alice, chain):
+    if not hardhat.has_artifacts():
+        pytest.skip("Solidity artifacts are missing, run `yarn compile` in the repository root")
+    contracts = {
+        "Multicall": multicall,
+        "KlonX": hardhat.deploy("SyntheticToken", "KlonX", "KlonX", 18, sender=alice),
+        "KWBTC": hardhat.deploy("SyntheticToken", "KWBTC", "KWBTC", 8, sender=alice),
+        "TokenManagerMock": hardhat.deploy("TokenManagerMock", sender=alice),
+    }
+    contracts["Boardroom"] = hardhat.deploy(
+        "Boardroom", contracts["KWBTC"], contracts["TokenManagerMock"], alice, chain.time(),
+        sender=alice,
+    )
+    artifacts = {"KlonX": "SyntheticToken", "KWBTC": "SyntheticToken"}
+    yield {
+        name: {"address": c.address, "abi": hardhat.load_artifact(artifacts.get(name, name))[0]}
+        for name, c in contracts.items()
+    }, contracts
+
+
+@pytest.fixture
+def cache(deployments):
+    data, contracts = deployments
+    pages = {
+        "tokens": [
+            Card(name, name, views("owner", "operator", "totalSupply", "decimals", "symbol"))
+            for name in ("KlonX", "KWBTC")
+        ],
+        "boardroom": [
+            Card("Boardroom", "Boardroom", views("stakingToken", "stakingTokenSupply") + [
+                Field("stakingTokenDecimals", "decimals", target="@stakingToken", abi="KlonX"),
+                Field("balanceKlonX", "balanceOf", ("#Boardroom",), "KlonX"),
+            ]),
+            # TokenManagerMock has no `owner`
+            Card("TokenManagerMock", "TokenManagerMock", views("owner"), abi="KlonX"),
+        ],
+    }
+    yield PageCache(contracts["Multicall"], Sources(data), pages, ttl=3600)
+
+
+def test_values(alice, cache, deployments):
+    _, contracts = deployments
+    document = cache.get("tokens")
+    for card in document["cards"]:
+        token = contracts[card["title"]]
+        assert card["address"] == token.address
+        assert card["values"] == {
+            "owner": token.owner().lower(),
+            "operator": token.operator().lower(),
+            "totalSupply": str(token.totalSupply()),
+            "decimals": str(token.decimals()),
+            "symbol": token.symbol(),
+        }
+    # one aggregate for both cards
+    assert cache.calls == 1
+
+
+def test_dependent_fields(alice, cache, deployments):
+    _, contracts = deployments
+    contracts["KlonX"].mint(contracts["Boardroom"], 123, {"from": alice})
+    boardroom, manager = cache.get("boardroom")["cards"]
+    assert boardroom["values"] == {
+        "stakingToken": contracts["KWBTC"].address.lower(),
+        "stakingTokenSupply": "0",
+        "stakingTokenDecimals": "8",
+        "balanceKlonX": "123",
+    }
+    assert manager["values"] == {"owner": None}
+    # the decimals of the staking token need a second round
+    assert cache.calls == 2
+
+
+def test_block_invalidation(alice, chain, cache, deployments):
+    _, contracts = deployments
+    supply = cache.get("tokens")["cards"][0]["values"]["totalSupply"]
+    cache.get("tokens")
+    cache.refresh()
+    calls = cache.calls
+
+    # the same block is served from the cache
+    cache.refresh()
+    assert cache.get("tokens")["cards"][0]["values"]["totalSupply"] == supply
+    assert cache.calls == calls
+
+    contracts["KlonX"].mint(alice, 10 ** 18, {"from": alice})
+    block = cache.refresh()
+    assert cache.calls == calls + 3
+    document = cache.get("tokens")
+    assert document["block"] == block == chain[-1].number
+    assert document["cards"][0]["values"]["totalSupply"] == str(int(supply) + 10 ** 18)
+
+
+def test_get_new_block(alice, chain, cache, deployments):
+    _, contracts = deployments
+    supply = cache.get("tokens")["cards"][0]["values"]["totalSupply"]
+
+    # without a refresh by the scheduler
+    contracts["KlonX"].mint(alice, 10 ** 18, {"from": alice})
+    document = cache.get("tokens")
+    assert document["block"] == chain[-1].number
+    assert document["cards"][0]["values"]["totalSupply"] == str(int(supply) + 10 ** 18)
+    assert cache.calls == 2
+
+
+def test_concurrent_get(cache):
+    with ThreadPoolExecutor(8) as pool:
+        documents = list(pool.map(cache.get, ["tokens"] * 8 + ["boardroom"] * 8))
+    assert all(d == documents[0] for d in documents[:8])
+    assert all(d == documents[8] for d in documents[8:])
+    # one aggregate for the tokens, two for the boardroom
+    assert cache.calls == 3
+
+
+def test_ttl(cache):
+    cache.ttl = 0
+    cache.get("tokens")
+    cache.get("tokens")
+    assert cache.calls == 2
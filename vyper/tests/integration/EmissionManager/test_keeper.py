@@ -0,0 +1,98 @@
+import pytest
+
+from scripts.keeper import Keeper, KeeperState
+
+DAY = 86400
+HOUR = 3600
+
+
+@pytest.fixture(scope="module")
+def keeper(treasury, managed_token, alice):
+    _, _, emission_manager = treasury
+    tokens = [managed_token(), managed_token()]
+    yield Keeper(emission_manager, alice), tokens
+
+
+def test_state_matches_getters(keeper, treasury):
+    keeper, tokens = keeper
+    token_manager, _, emission_manager = treasury
+    state = keeper.state()
+
+    assert len(state.tokens) == len(tokens)
+    for token, (underlying, synthetic, _, oracle, pair) in zip(state.tokens, tokens):
+        unit = token_manager.oneSyntheticUnit(synthetic)
+        assert token.synthetic == synthetic
+        assert token.underlying == underlying
+        assert token.pair == pair
+        assert token.oracle == oracle
+        assert token.current_price == token_manager.currentPrice(synthetic, unit)
+        assert token.oracle_last_called == oracle.lastCalled()
+        assert token.oracle_next_call_time == max(
+            oracle.lastCalled() + oracle.debouncePeriod(), oracle.start())
+    assert state.next_rebase_time == max(
+        emission_manager.lastCalled() + emission_manager.debouncePeriod(),
+        emission_manager.start(),
+    )
+
+
+def test_plan(keeper):
+    keeper, tokens = keeper
+    oracle = tokens[0][3]
+    rebase_time = keeper.state().next_rebase_time + DAY
+
+    def state(last_called, next_call_time):
+        token = keeper.state().tokens[0]._replace(
+            oracle_last_called=last_called, oracle_next_call_time=next_call_time)
+        return KeeperState([token], rebase_time)
+
+    # too early for an update before the rebase
+    assert keeper.plan(
+        state(rebase_time - 4 * HOUR, rebase_time - 3 * HOUR), rebase_time - 2 * HOUR
+    ) == ([], False)
+    # the oracle was last called before the window
+    assert keeper.plan(
+        state(rebase_time - 2 * HOUR, rebase_time - HOUR), rebase_time - HOUR
+    ) == ([oracle.address], False)
+    # never called, the next call time is the start of the oracle
+    assert keeper.plan(state(0, rebase_time - HOUR), rebase_time - HOUR) == ([oracle.address], False)
+    # the oracle is not callable yet
+    assert keeper.plan(
+        state(rebase_time - 2 * HOUR + 1, rebase_time - HOUR + 1), rebase_time - HOUR
+    ) == ([], False)
+    # the oracle was already updated in the window
+    assert keeper.plan(
+        state(rebase_time - 10 * 60, rebase_time - 10 * 60 + HOUR), rebase_time
+    ) == ([], True)
+
+
+def test_plan_shared_oracle(keeper):
+    keeper, _ = keeper
+    hub = keeper.state().tokens[0].oracle
+    rebase_time = keeper.state().next_rebase_time + DAY
+    now = rebase_time - HOUR
+
+    def state(*next_call_times):
+        tokens = [
+            token._replace(oracle=hub, oracle_last_called=t - HOUR, oracle_next_call_time=t)
+            for token, t in zip(keeper.state().tokens, next_call_times)
+        ]
+        return KeeperState(tokens, rebase_time)
+
+    # no pair of the hub is due
+    assert keeper.plan(state(now + 1, now + 1), now) == ([], False)
+    # one due pair is enough, and the hub is updated once for all pairs
+    assert keeper.plan(state(now + 1, now - 60), now) == ([hub], False)
+    assert keeper.plan(state(now - 60, now - 60), now) == ([hub], False)
+
+
+def test_tick(keeper, treasury, chain):
+    keeper, _ = keeper
+    _, _, emission_manager = treasury
+
+    chain.sleep(DAY)
+    chain.mine()
+    planned = keeper.plan(keeper.state(), chain.time())
+    assert keeper.tick() == planned
+    assert planned[1]
+    assert emission_manager.lastCalled() > 0
+    assert keeper.tick() == ([], False)
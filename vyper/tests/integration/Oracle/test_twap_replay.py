@@ -0,0 +1,70 @@
+import pytest
+
+from scripts import hardhat
+from scripts.twap import ReserveHistory, replay
+
+HOUR = 3600
+
+
+@pytest.fixture(scope="module")
+def library(accounts):
+    if not hardhat.has_artifacts():
+        pytest.skip("Solidity artifacts are missing, run `yarn compile` in the repository root")
+    yield hardhat.deploy("UniswapLibraryTest", sender=accounts[0])
+
+
+def snapshot(library, factory, pair, tx):
+    token0, token1 = pair.token0(), pair.token1()
+    reserve0, reserve1 = library.getReserves(factory, token0, token1)
+    return tx.timestamp, reserve0, reserve1
+
+
+@pytest.mark.parametrize("period", [HOUR, 2 * HOUR])
+def test_replay_matches_oracle(accounts, chain, uniswap, uniswap_pair, library, period):
+    factory, router = uniswap
+    alice = accounts[0]
+    underlying, synthetic, pair = uniswap_pair()
+    reserve0, reserve1, last_sync = pair.getReserves()
+    snapshots = [(last_sync, reserve0, reserve1)]
+
+    oracle = hardhat.deploy(
+        "Oracle", factory, underlying, synthetic, period, chain.time(), sender=alice)
+    deployed_at = chain[-1].timestamp
+
+    ticks = []
+    for i in range(12):
+        chain.sleep(HOUR // 3 + 17 * i)
+        path = [synthetic, underlying] if i % 3 else [underlying, synthetic]
+        amount = 10 ** 15 if i % 3 else 10 ** 5
+        tx = router.swapExactTokensForTokens(
+            amount, 0, path, alice, chain.time() + HOUR, {"from": alice})
+        snapshots.append(snapshot(library, factory, pair, tx))
+
+        if chain.time() - oracle.lastCalled() > period:
+            tx = oracle.update({"from": alice})
+            ticks.append(tx.timestamp)
+
+            r = replay(ReserveHistory.from_snapshots(snapshots), [period], ticks, deployed_at)[period]
+            assert r.update_times == ticks
+            assert r.price0_averages[-1] == oracle.price0Average()
+            assert r.price1_averages[-1] == oracle.price1Average()
+            token0_index = 0 if pair.token0() == synthetic else 1
+            assert r.consult(token0_index, 10 ** 18, [tx.timestamp]) == [
+                oracle.consult(synthetic, 10 ** 18)]
+            assert r.consult(1 - token0_index, 10 ** 8, [tx.timestamp]) == [
+                oracle.consult(underlying, 10 ** 8)]
+
+    assert len(ticks) > 1
+
+
+def test_reserves_match_library(uniswap, uniswap_pair, library):
+    factory, _ = uniswap
+    underlying, synthetic, pair = uniswap_pair()
+    reserve0, reserve1, last_sync = pair.getReserves()
+    history = ReserveHistory.from_snapshots([(last_sync, reserve0, reserve1)])
+
+    reserve_und, reserve_syn = library.getReserves(factory, underlying, synthetic)
+    if pair.token0() == underlying:
+        assert (history.reserves0[0], history.reserves1[0]) == (reserve_und, reserve_syn)
+    else:
+        assert (history.reserves0[0], history.reserves1[0]) == (reserve_syn, reserve_und)
@@ -0,0 +1,126 @@
+import random
+import time
+
+import brownie
+import pytest
+
+from scripts import hardhat
+from scripts.uniswap_quote import (
+    Snapshot,
+    amounts_out_many,
+    get_amount_out,
+    get_amounts_out,
+    pair_for,
+    quote,
+    quote_many,
+)
+
+
+@pytest.fixture(scope="module")
+def library(accounts):
+    if not hardhat.has_artifacts():
+        pytest.skip("Solidity artifacts are missing, run `yarn compile` in the repository root")
+    yield hardhat.deploy("UniswapLibraryTest", sender=accounts[0])
+
+
+@pytest.fixture(scope="module")
+def path(uniswap, accounts, chain):
+    """
+    WBTC -> KBTC -> KlonX with uneven reserves in both pairs.
+    """
+    _, router = uniswap
+    alice = accounts[0]
+    tokens = [
+        hardhat.deploy("SyntheticToken", symbol, symbol, decimals, sender=alice)
+        for symbol, decimals in (("WBTC", 8), ("KBTC", 18), ("KlonX", 18))
+    ]
+    for token in tokens:
+        token.mint(alice, 10 ** 30, {"from": alice})
+        token.approve(router, 2 ** 256 - 1, {"from": alice})
+    for (a, b), (amount_a, amount_b) in zip(
+        zip(tokens, tokens[1:]), ((12 * 10 ** 8, 11 * 10 ** 18), (7 * 10 ** 18, 3 * 10 ** 21))
+    ):
+        router.addLiquidity(
+            a, b, amount_a, amount_b, amount_a, amount_b, alice, chain.time() + 1000000,
+            {"from": alice},
+        )
+    yield [t.address for t in tokens]
+
+
+def call(fn, *args):
+    try:
+        return fn(*args)
+    except (ValueError, OverflowError, brownie.exceptions.VirtualMachineError):
+        return None
+
+
+def test_pair_for(library, uniswap, uniswap_pair):
+    factory, _ = uniswap
+    underlying, synthetic, pair = uniswap_pair()
+    assert pair_for(factory.address, underlying.address, synthetic.address) == pair.address
+    assert pair_for(factory.address, synthetic.address, underlying.address) == pair.address
+    assert library.pairFor(factory, underlying, synthetic) == pair.address
+
+
+def test_math_matches_library(library):
+    rng = random.Random(1)
+    for _ in range(100):
+        amount = rng.choice([0, rng.randint(1, 10 ** 24), rng.randint(1, 2 ** 255)])
+        reserve_a = rng.choice([0, rng.randint(1, 2 ** 112 - 1)])
+        reserve_b = rng.choice([0, rng.randint(1, 2 ** 112 - 1)])
+        expected = call(library.quote, amount, reserve_a, reserve_b)
+        assert call(quote, amount, reserve_a, reserve_b) == expected
+        assert quote_many([amount], reserve_a, reserve_b) == [expected]
+        expected = call(library.getAmountOut, amount, reserve_a, reserve_b)
+        assert call(get_amount_out, amount, reserve_a, reserve_b) == expected
+        assert amounts_out_many([amount], reserve_a, reserve_b) == [expected]
+
+
+def test_amounts_out_match_library(library, uniswap, path, multicall):
+    factory, router = uniswap
+    snapshot = Snapshot.load(multicall, factory.address, list(zip(path, path[1:])))
+
+    rng = random.Random(2)
+    amounts = [0] + [rng.randint(1, 10 ** 10) for _ in range(30)]
+    columns = snapshot.amounts_out(amounts, path)
+    for i, amount in enumerate(amounts):
+        expected = call(library.getAmountsOut, factory, amount, path)
+        if expected is None:
+            assert [column[i] for column in columns] == [None] * len(path)
+            assert call(get_amounts_out, amount, path, snapshot.reserves) is None
+            continue
+        assert [column[i] for column in columns] == list(expected)
+        assert get_amounts_out(amount, path, snapshot.reserves) == list(expected)
+        assert list(router.getAmountsOut(amount, path)) == list(expected)
+    assert snapshot.quote(amounts[1:], path[1], path[0]) == [
+        library.quote(a, *library.getReserves(factory, path[1], path[0])) for a in amounts[1:]
+    ]
+
+
+def test_snapshot_block(uniswap, path, multicall, alice, chain):
+    factory, router = uniswap
+    block = chain.height
+    before = Snapshot.load(multicall, factory.address, [path[:2]], block)
+    router.swapExactTokensForTokens(
+        10 ** 8, 0, path[:2], alice, chain.time() + 1000, {"from": alice}
+    )
+    after = Snapshot.load(multicall, factory.address, [path[:2]])
+    old = Snapshot.load(multicall, factory.address, [path[:2]], block)
+    assert before.block == old.block == block
+    assert old.reserves(*path[:2]) == before.reserves(*path[:2])
+    assert after.reserves(*path[:2]) != before.reserves(*path[:2])
+    with pytest.raises(KeyError):
+        after.reserves(path[0], path[2])
+
+
+def test_speed(uniswap, path, multicall):
+    factory, _ = uniswap
+    snapshot = Snapshot.load(multicall, factory.address, list(zip(path, path[1:])))
+    rng = random.Random(3)
+    amounts = [rng.randint(1, 10 ** 12) for _ in range(100_000)]
+
+    start = time.perf_counter()
+    columns = snapshot.amounts_out(amounts, path)
+    elapsed = time.perf_counter() - start
+    assert columns[-1][0] == get_amounts_out(amounts[0], path, snapshot.reserves)[-1]
+    assert elapsed < 2
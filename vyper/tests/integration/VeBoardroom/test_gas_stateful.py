@@ -0,0 +1,239 @@
+"""
+Gas-maximizing fuzz mode for VeBoardroom and VeToken.
+
+Runs the rules of the fee distribution state machine together with rules that
+make histories expensive (long gaps, many tokens, batched claims) and reports
+the gas of every targeted call to Hypothesis with `target()`, so the `target`
+phase searches for the most expensive sequences. The worst sequence found for
+every call is saved to `gas_regressions.json` and replayed by
+`test_gas_regressions` on every run.
+
+GAS_FUZZ=1 brownie test tests/integration/VeBoardroom/test_gas_stateful.py
+"""
+
+import json
+import os
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from brownie import ZERO_ADDRESS, chain, history
+from brownie.test import strategy
+from hypothesis import target
+
+from test_distribute_fees_stateful import WEEK, YEAR, StateMachine
+
+GAS_FUZZ = os.environ.get("GAS_FUZZ") == "1"
+REGRESSIONS = Path(__file__).with_name("gas_regressions.json")
+# block gas limit at the time of deployment
+BLOCK_GAS_LIMIT = 12_500_000
+# replays start at a different time, so week boundaries may shift a little
+REPLAY_TOLERANCE = 1.05
+EXTRA_COINS = 8
+
+TARGETED = {
+    "VeBoardroom": {"claim", "claim_many", "checkpoint_total_supply", "checkpoint_token"},
+    "VeToken": {"create_lock", "increase_amount", "increase_unlock_time", "withdraw"},
+}
+
+
+def load_regressions():
+    if not REGRESSIONS.exists():
+        return {}
+    return json.loads(REGRESSIONS.read_text())
+
+
+def save_regressions(worst):
+    regressions = load_regressions()
+    changed = False
+    for label, case in worst.items():
+        if case["gas"] > regressions.get(label, {}).get("gas", 0):
+            regressions[label] = case
+            changed = True
+    if changed:
+        REGRESSIONS.write_text(json.dumps(regressions, indent=2, sort_keys=True) + "\n")
+
+
+class GasStateMachine(StateMachine):
+
+    st_gap = strategy("uint256", min_value=1, max_value=60)
+    st_coin = strategy("uint256", min_value=0, max_value=EXTRA_COINS)
+
+    def __init__(self, distributor, accounts, ve_token, fee_coin, extra_coins):
+        super().__init__(distributor, accounts, ve_token, fee_coin)
+        self.extra_coins = extra_coins
+
+    def setup(self):
+        super().setup()
+        self.coins = [self.fee_coin]
+        self.steps = []
+        self.gas = {}
+        self.worst = {}
+        self._seen = len(history)
+
+    def _encode(self, name, value):
+        if name == "st_acct":
+            return list(self.accounts).index(value)
+        if name == "st_amount":
+            return str(value)
+        return value
+
+    def _decode(self, name, value):
+        if name == "st_acct":
+            return self.accounts[value]
+        if name == "st_amount":
+            return Decimal(value)
+        return value
+
+    def _record(self, step, **kwargs):
+        """
+        Record the step and the gas of the targeted calls it made.
+        """
+        self.steps.append([step, {k: self._encode(k, v) for k, v in kwargs.items()}])
+        for tx in history[self._seen:]:
+            if tx.fn_name not in TARGETED.get(tx.contract_name, ()):
+                continue
+            label = f"{tx.contract_name}.{tx.fn_name}"
+            if tx.gas_used > self.gas.get(label, 0):
+                self.gas[label] = tx.gas_used
+                self.worst[label] = {"gas": tx.gas_used, "steps": list(self.steps)}
+        self._seen = len(history)
+
+    def replay(self, steps):
+        """
+        Run recorded steps on a fresh machine.
+        """
+        for step, kwargs in steps:
+            getattr(self, step)(**{k: self._decode(k, v) for k, v in kwargs.items()})
+
+    def rule_new_lock(self, st_acct, st_amount, st_weeks, st_time):
+        super().rule_new_lock(st_acct, st_amount, st_weeks, st_time)
+        self._record(
+            "rule_new_lock", st_acct=st_acct, st_amount=st_amount, st_weeks=st_weeks, st_time=st_time
+        )
+
+    def rule_extend_lock(self, st_acct, st_weeks, st_time):
+        super().rule_extend_lock(st_acct, st_weeks, st_time)
+        self._record("rule_extend_lock", st_acct=st_acct, st_weeks=st_weeks, st_time=st_time)
+
+    def rule_increase_lock_amount(self, st_acct, st_amount, st_time):
+        super().rule_increase_lock_amount(st_acct, st_amount, st_time)
+        self._record(
+            "rule_increase_lock_amount", st_acct=st_acct, st_amount=st_amount, st_time=st_time
+        )
+
+    def rule_claim_fees(self, st_acct, st_time):
+        super().rule_claim_fees(st_acct, st_time)
+        self._record("rule_claim_fees", st_acct=st_acct, st_time=st_time)
+
+    def rule_transfer_fees(self, st_amount, st_time):
+        super().rule_transfer_fees(st_amount, st_time)
+        self._record("rule_transfer_fees", st_amount=st_amount, st_time=st_time)
+
+    def rule_transfer_fees_without_checkpoint(self, st_amount, st_time):
+        super().rule_transfer_fees_without_checkpoint(st_amount, st_time)
+        self._record("rule_transfer_fees_without_checkpoint", st_amount=st_amount, st_time=st_time)
+
+    def rule_long_gap(self, st_gap):
+        """
+        Nobody touches the contracts for `st_gap` weeks.
+        """
+        chain.sleep(st_gap * WEEK)
+        self._record("rule_long_gap", st_gap=st_gap)
+
+    def rule_add_token(self, st_amount):
+        """
+        Add the next fee token to the distributor and send fees in it.
+        If all tokens are added, the rule is skipped.
+        """
+        if len(self.coins) <= len(self.extra_coins):
+            coin = self.extra_coins[len(self.coins) - 1]
+            self.distributor.add_token(coin, chain.time(), {"from": self.accounts[0]})
+            coin._mint_for_testing(int(st_amount * 10 ** 18), {"from": self.distributor.address})
+            self.coins.append(coin)
+        self._record("rule_add_token", st_amount=st_amount)
+
+    def rule_claim_many(self, st_coin, st_time):
+        """
+        Claim fees in one of the added tokens for all accounts at once.
+        """
+        chain.sleep(st_time)
+        coin = self.coins[st_coin % len(self.coins)]
+        receivers = list(self.accounts) + [ZERO_ADDRESS] * (20 - len(self.accounts))
+        self.distributor.claim_many(coin, receivers, {"from": self.accounts[0]})
+        self._record("rule_claim_many", st_coin=st_coin, st_time=st_time)
+
+    def rule_checkpoint_total_supply(self, st_time):
+        chain.sleep(st_time)
+        self.distributor.checkpoint_total_supply({"from": self.accounts[0]})
+        self._record("rule_checkpoint_total_supply", st_time=st_time)
+
+    def claim_all(self):
+        """
+        Every account claims every token.
+        """
+        for coin in self.coins:
+            for acct in self.accounts:
+                self.distributor.claim(coin, {"from": acct})
+        self._record("claim_all")
+
+    def teardown(self):
+        """
+        Claim everything, report gas to Hypothesis and save the worst sequences.
+        Distribution amounts are checked by the other stateful tests, long gaps
+        here may need several claims per account.
+        """
+        self.claim_all()
+        for label, gas in self.gas.items():
+            target(gas, label=label)
+            assert gas < BLOCK_GAS_LIMIT, f"{label} hits the block gas limit"
+        if GAS_FUZZ:
+            save_regressions(self.worst)
+
+
+@pytest.fixture(scope="module")
+def distributor(accounts, ve_token, ve_boardroom, coin_a, token):
+    for i in range(5):
+        token.approve(ve_token, 2 ** 256 - 1, {"from": accounts[i]})
+        token.transfer(accounts[i], 10 ** 18 * 10000000, {"from": accounts[0]})
+
+    # start at a week boundary, so replays see the same week layout
+    chain.mine(timestamp=(chain.time() // WEEK + 1) * WEEK)
+    ve_token.create_lock(10 ** 18 * 10000000, chain.time() + YEAR * 2, {"from": accounts[0]})
+
+    chain.sleep(WEEK)
+    distributor = ve_boardroom()
+    distributor.add_token(coin_a, chain.time())
+    yield distributor
+
+
+@pytest.fixture(scope="module")
+def extra_coins(ERC20, accounts):
+    yield [
+        ERC20.deploy(f"Coin {i}", f"COIN{i}", 18, {"from": accounts[0]})
+        for i in range(EXTRA_COINS)
+    ]
+
+
+@pytest.mark.skipif(not GAS_FUZZ, reason="set GAS_FUZZ=1 to search for expensive histories")
+def test_gas_stateful(state_machine, accounts, distributor, ve_token, coin_a, extra_coins):
+    state_machine(
+        GasStateMachine,
+        distributor,
+        accounts[:5],
+        ve_token,
+        coin_a,
+        extra_coins,
+        settings={"max_examples": 200, "stateful_step_count": 50},
+    )
+
+
+@pytest.mark.parametrize("label", sorted(load_regressions()))
+def test_gas_regressions(label, accounts, distributor, ve_token, coin_a, extra_coins):
+    case = load_regressions()[label]
+    machine = GasStateMachine(distributor, accounts[:5], ve_token, coin_a, extra_coins)
+    machine.setup()
+    machine.replay(case["steps"])
+
+    assert machine.gas[label] < BLOCK_GAS_LIMIT
+    assert machine.gas[label] <= case["gas"] * REPLAY_TOLERANCE
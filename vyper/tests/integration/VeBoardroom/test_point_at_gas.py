@@ -0,0 +1,57 @@
+"""
+Gas of the `VeBoardroom` point lookups with `VeToken.point_at` and
+`VeToken.user_point_at` compared with the binary searches over
+`point_history` / `user_point_history` calls they replace.
+
+brownie test tests/integration/VeBoardroom/test_point_at_gas.py
+"""
+
+import pytest
+
+WEEK = 86400 * 7
+HOUR = 3600
+
+
+@pytest.fixture(scope="module")
+def history(VeToken, VeBoardroom, VeLookupMock, accounts, chain, token):
+    alice = accounts[0]
+
+    def f(epochs):
+        """
+        Fresh VeToken where `alice` has `epochs` points, one an hour.
+        """
+        ve_token = VeToken.deploy(token, "veKlonX", "veKlonX", "veKlonX", {"from": alice})
+        token.approve(ve_token, 2 ** 256 - 1, {"from": alice})
+        ve_token.create_lock(10 ** 21, chain.time() + 52 * WEEK, {"from": alice})
+        timestamps = [chain[-1].timestamp]
+        for i in range(epochs - 1):
+            chain.sleep(HOUR)
+            timestamps.append(ve_token.increase_amount(10 ** 18, {"from": alice}).timestamp)
+        chain.sleep(HOUR)
+        chain.mine()
+        boardroom = VeBoardroom.deploy(ve_token, alice, alice, {"from": alice})
+        lookup = VeLookupMock.deploy(ve_token, {"from": alice})
+        return ve_token, boardroom, lookup, timestamps
+
+    yield f
+
+
+@pytest.mark.parametrize("epochs", [10, 100, 1000])
+def test_gas(history, epochs, accounts):
+    alice = accounts[0]
+    ve_token, boardroom, lookup, timestamps = history(epochs)
+    assert ve_token.user_point_epoch(alice) == epochs
+
+    # between two points, so the searches go all the way down
+    t = timestamps[epochs // 2] + HOUR // 2
+    assert lookup.ve_for_at(alice, t) == lookup.ve_for_at_search(alice, t) > 0
+    assert boardroom.ve_for_at(alice, t) == lookup.ve_for_at(alice, t)
+    assert lookup.supply_at(t) == lookup.supply_at_search(t) > 0
+
+    user_search = lookup.ve_for_at_search.estimate_gas(alice, t)
+    user_point_at = lookup.ve_for_at.estimate_gas(alice, t)
+    global_search = lookup.supply_at_search.estimate_gas(t)
+    global_point_at = lookup.supply_at.estimate_gas(t)
+
+    assert user_point_at < user_search
+    assert global_point_at < global_search
@@ -0,0 +1,112 @@
+import pytest
+
+from scripts.ve_metrics import Exporter, catch_up_gas, quantile
+
+DAY = 86400
+WEEK = DAY * 7
+
+
+@pytest.fixture(scope="module")
+def room(accounts, chain, ve_boardroom, coin_a):
+    room = ve_boardroom()
+    room.add_token(coin_a, chain.time(), {"from": accounts[0]})
+    yield room
+
+
+@pytest.fixture(scope="module")
+def exporter(accounts, chain, multicall, room, ve_token, token):
+    from_block = chain[-1].number
+    for i in range(1, 4):
+        token.transfer(accounts[i], 10 ** 21, {"from": accounts[0]})
+        token.approve(ve_token, 2 ** 256 - 1, {"from": accounts[i]})
+        ve_token.create_lock(10 ** 20 * i, chain.time() + WEEK * 104, {"from": accounts[i]})
+    yield Exporter(room, multicall, from_block, workers=2, batch_size=2)
+
+
+def parse(text):
+    gauges = {}
+    for line in text.splitlines():
+        if not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            gauges[name] = int(value)
+    return gauges
+
+
+def fund(accounts, room, coin, amount):
+    coin._mint_for_testing(amount, {"from": accounts[0]})
+    coin.transfer(room, amount, {"from": accounts[0]})
+    room.checkpoint_token(coin, {"from": accounts[0]})
+
+
+def test_checkpoint_lag(accounts, chain, exporter, room):
+    room.checkpoint_total_supply({"from": accounts[0]})
+    chain.mine()
+    assert exporter.poll().time_cursor == room.time_cursor()
+    gauges = parse(exporter.render(exporter.poll()))
+    assert gauges[f'veboardroom_checkpoint_lag_weeks{{boardroom="{room.address}"}}'] == 0
+
+    chain.sleep(WEEK * 3)
+    chain.mine()
+    gauges = parse(exporter.render(exporter.poll()))
+    assert gauges[f'veboardroom_checkpoint_lag_weeks{{boardroom="{room.address}"}}'] == 3
+    assert gauges[f'veboardroom_catch_up_gas{{boardroom="{room.address}",kind="checkpoint"}}'] == \
+        catch_up_gas(3, [])[0]
+
+
+def test_stale_tokens(accounts, chain, exporter, room, coin_a):
+    fund(accounts, room, coin_a, 10 ** 18)
+    chain.mine()
+    labels = f'boardroom="{room.address}",token="{coin_a.address}"'
+    gauges = parse(exporter.render(exporter.poll()))
+    assert gauges[f"veboardroom_token_stale{{{labels}}}"] == 0
+    assert gauges[f'veboardroom_stale_tokens{{boardroom="{room.address}"}}'] == 0
+
+    chain.sleep(DAY + 1)
+    chain.mine()
+    gauges = parse(exporter.render(exporter.poll()))
+    assert gauges[f"veboardroom_token_stale{{{labels}}}"] == 1
+    assert gauges[f'veboardroom_stale_tokens{{boardroom="{room.address}"}}'] == 1
+    assert gauges[f"veboardroom_token_checkpoint_age_seconds{{{labels}}}"] > DAY
+
+
+def test_claim_backlog(accounts, chain, exporter, room, coin_a):
+    for _ in range(60):
+        chain.sleep(WEEK)
+        fund(accounts, room, coin_a, 10 ** 18)
+    room.checkpoint_total_supply({"from": accounts[0]})
+    chain.mine()
+
+    stats = exporter.poll()
+    assert stats.holders == 3
+    (weeks,) = [t.unclaimed_weeks for t in stats.tokens]
+    assert min(weeks) > 50
+    labels = f'boardroom="{room.address}",token="{coin_a.address}"'
+    gauges = parse(exporter.render(stats))
+    assert gauges[f"veboardroom_backlog_holders{{{labels}}}"] == 3
+    assert gauges[f'veboardroom_unclaimed_weeks{{{labels},quantile="1.0"}}'] == max(weeks)
+
+    # the locks were made in the same week
+    assert weeks == [weeks[0]] * 3
+    end = room.last_token_time(coin_a) // WEEK * WEEK
+    gas = 0
+    claims = 0
+    while room.time_cursor_of(coin_a, accounts[1]) < end:
+        gas += room.claim(coin_a, {"from": accounts[1]}).gas_used
+        claims += 1
+        (after,) = [t.unclaimed_weeks for t in exporter.poll().tokens]
+        assert after[0] == (end - room.time_cursor_of(coin_a, accounts[1]) + WEEK - 1) // WEEK
+    assert claims == 2
+    assert after == [0, weeks[0], weeks[0]]
+    gauges = parse(exporter.render(exporter.poll()))
+    assert gauges[f"veboardroom_backlog_holders{{{labels}}}"] == 2
+    assert gauges[f'veboardroom_unclaimed_weeks{{{labels},quantile="0.5"}}'] == weeks[0]
+
+    estimate = catch_up_gas(0, [weeks[0]])[1]
+    assert gas / 3 < estimate < gas * 3
+
+
+def test_quantile():
+    assert quantile([], 0.5) == 0
+    assert quantile([1, 2, 3, 4], 0.5) == 2
+    assert quantile([1, 2, 3, 4], 0.9) == 4
+    assert quantile([1, 2, 3, 4], 1.0) == 4
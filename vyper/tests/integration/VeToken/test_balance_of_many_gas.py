@@ -0,0 +1,49 @@
+"""
+Gas of `balanceOfManyAt` compared with one `balanceOfAt` call per holder.
+
+brownie test tests/integration/VeToken/test_balance_of_many_gas.py
+"""
+
+import pytest
+from brownie import ZERO_ADDRESS
+
+from scripts.voting_power import MAX_BATCH, balances_at
+
+WEEK = 86400 * 7
+TX_GAS = 21000
+
+
+@pytest.fixture(scope="module")
+def holders(accounts, chain, ve_token, token):
+    holders = []
+    for i in range(1000):
+        acct = accounts.add()
+        accounts[0].transfer(acct, 10 ** 17)
+        token.transfer(acct, 10 ** 18, {"from": accounts[0]})
+        token.approve(ve_token, 2 ** 256 - 1, {"from": acct})
+        ve_token.create_lock(10 ** 18, chain.time() + WEEK * (i % 50 + 2), {"from": acct})
+        holders.append(acct)
+        if i % 100 == 0:
+            chain.sleep(WEEK // 7)
+    chain.sleep(WEEK)
+    chain.mine()
+    yield holders
+
+
+@pytest.mark.parametrize("count", [100, 1000])
+def test_gas(holders, count, chain, ve_token):
+    block = chain[-1].number - 10
+    subset = holders[:count]
+
+    # the base cost of a transaction is paid once per call
+    looped = sum(ve_token.balanceOfAt.estimate_gas(h, block) for h in subset)
+    pages = [subset[i:i + MAX_BATCH] for i in range(0, count, MAX_BATCH)]
+    batched = sum(
+        ve_token.balanceOfManyAt.estimate_gas(
+            page + [ZERO_ADDRESS] * (MAX_BATCH - len(page)), block)
+        for page in pages
+    )
+    calls = len(pages)
+
+    assert batched - TX_GAS * calls < looped - TX_GAS * count
+    assert balances_at(ve_token, subset, block) == [ve_token.balanceOfAt(h, block) for h in subset]
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from scripts.history import DiskCache, HistoryClient
+
+WEEK = 86400 * 7
+
+
+@pytest.fixture(scope="module")
+def distributor(accounts, chain, ve_token, ve_boardroom, coin_a, token):
+    for i in range(3):
+        token.transfer(accounts[i], 10 ** 21, {"from": accounts[0]})
+        token.approve(ve_token, 2 ** 256 - 1, {"from": accounts[i]})
+        ve_token.create_lock(10 ** 20 * (i + 1), chain.time() + WEEK * 10, {"from": accounts[i]})
+        chain.sleep(WEEK)
+
+    distributor = ve_boardroom()
+    distributor.add_token(coin_a, chain.time() - 2 * WEEK)
+    coin_a._mint_for_testing(10 ** 20, {"from": distributor.address})
+    distributor.checkpoint_token(coin_a)
+    distributor.checkpoint_total_supply()
+    yield distributor
+
+
+def read_all(client, accounts, coin_a, weeks):
+    async def f():
+        return await asyncio.gather(
+            client.point_histories(),
+            client.user_point_histories(accounts[:3]),
+            client.weekly(coin_a, weeks),
+        )
+
+    return asyncio.run(f())
+
+
+def test_matches_contracts(distributor, accounts, ve_token, coin_a, tmp_path):
+    client = HistoryClient(ve_token, distributor, DiskCache(tmp_path / "cache.sqlite"))
+    start = distributor.start_time(coin_a)
+    weeks = list(range(start, distributor.time_cursor(), WEEK))
+
+    points, user_points, (supplies, tokens) = read_all(client, accounts, coin_a, weeks)
+
+    assert points == [list(ve_token.point_history(i)) for i in range(ve_token.epoch() + 1)]
+    for acct, history in zip(accounts[:3], user_points):
+        assert history == [
+            list(ve_token.user_point_history(acct, i))
+            for i in range(1, ve_token.user_point_epoch(acct) + 1)
+        ]
+    assert supplies == [distributor.ve_supply(w) for w in weeks]
+    assert tokens == [distributor.tokens_per_week(coin_a, w) for w in weeks]
+
+
+def test_second_run_hits_cache(distributor, accounts, ve_token, coin_a, tmp_path):
+    path = tmp_path / "cache.sqlite"
+    start = distributor.start_time(coin_a)
+    weeks = list(range(start, distributor.time_cursor(), WEEK))
+
+    first = HistoryClient(ve_token, distributor, DiskCache(path))
+    expected = read_all(first, accounts, coin_a, weeks)
+    first.close()
+
+    second = HistoryClient(ve_token, distributor, DiskCache(path))
+    assert read_all(second, accounts, coin_a, weeks) == expected
+    # only the current week of `tokens_per_week` is still mutable
+    assert second.misses <= 1
+    assert second.hits > 0
+
+
+def test_heads_expire(distributor, accounts, chain, ve_token, coin_a, tmp_path):
+    client = HistoryClient(ve_token, distributor, DiskCache(tmp_path / "cache.sqlite"), ttl=0)
+    points = asyncio.run(client.point_histories())
+
+    chain.sleep(WEEK)
+    ve_token.increase_amount(10 ** 18, {"from": accounts[0]})
+
+    new_points = asyncio.run(client.point_histories())
+    assert len(new_points) > len(points)
+    assert new_points[:len(points)] == points
+    assert new_points[-1] == list(ve_token.point_history(ve_token.epoch()))
+
+
+def test_concurrent_heads_share_calls(distributor, accounts, ve_token, coin_a, tmp_path):
+    client = HistoryClient(ve_token, distributor, DiskCache(tmp_path / "cache.sqlite"))
+    start = distributor.start_time(coin_a)
+    weeks = list(range(start, distributor.time_cursor(), WEEK))
+    calls = []
+    call = client._call
+
+    async def counted(contract, method, *args):
+        calls.append(method)
+        return await call(contract, method, *args)
+
+    client._call = counted
+    read_all(client, accounts, coin_a, weeks)
+    for method in ("epoch", "time_cursor", "last_token_time"):
+        assert calls.count(method) == 1
+    assert calls.count("user_point_epoch") == 3
@@ -0,0 +1,59 @@
+from brownie import history
+
+from scripts.migrate_locks import GAS_PER_LOCK, migrate, read_snapshot
+
+WEEK = 86400 * 7
+
+
+def write_snapshot(path, accounts):
+    lines = [f"{str(accounts[i]).lower()};{i * 10},{i}" for i in range(1, 8)]
+    # zero balances are skipped
+    lines.append(f"{str(accounts[8]).lower()};0")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_read_snapshot(tmp_path, accounts):
+    path = tmp_path / "boardroom.csv"
+    write_snapshot(path, accounts)
+    rows = list(read_snapshot(path))
+    assert [h.lower() for h, _ in rows] == [str(a).lower() for a in accounts[1:8]]
+    assert rows[0][1] == 10 * 10 ** 18 + 10 ** 17
+
+    raw = tmp_path / "raw.csv"
+    raw.write_text(f"address,balance\n{str(accounts[1]).lower()},123\n")
+    assert list(read_snapshot(raw)) == [(str(accounts[1]).lower(), 123)]
+
+
+def test_migrate(tmp_path, accounts, chain, token, ve_token):
+    alice = accounts[0]
+    path = tmp_path / "boardroom.csv"
+    write_snapshot(path, accounts)
+    rows = list(read_snapshot(path))
+    unlock_time = (chain.time() // WEEK + 52) * WEEK
+    token.approve(ve_token, 2 ** 256 - 1, {"from": alice})
+
+    assert migrate(ve_token, read_snapshot(path), unlock_time, alice, size=3) == len(rows)
+    for holder, amount in rows:
+        assert ve_token.locked(holder) == (amount, unlock_time)
+    assert ve_token.supply() == sum(amount for _, amount in rows)
+
+    # restarting skips holders that were migrated already
+    assert migrate(ve_token, read_snapshot(path), unlock_time, alice, size=3) == 0
+
+
+def test_batch_gas(tmp_path, accounts, chain, token, ve_token):
+    alice = accounts[0]
+    path = tmp_path / "boardroom.csv"
+    write_snapshot(path, accounts)
+    unlock_time = (chain.time() // WEEK + 52) * WEEK
+    token.approve(ve_token, 2 ** 256 - 1, {"from": alice})
+
+    count = migrate(ve_token, read_snapshot(path), unlock_time, alice, size=7)
+    per_lock = history[-1].gas_used / count
+
+    token.transfer(accounts[9], 10 ** 18, {"from": alice})
+    token.approve(ve_token, 10 ** 18, {"from": accounts[9]})
+    single = ve_token.create_lock(10 ** 18, unlock_time, {"from": accounts[9]}).gas_used
+
+    assert per_lock < single
+    assert per_lock < GAS_PER_LOCK
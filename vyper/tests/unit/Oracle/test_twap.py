@@ -0,0 +1,83 @@
+import pytest
+
+from scripts.twap import ReserveHistory, consult, encode_price, replay
+
+Q112 = 2 ** 112
+
+
+@pytest.fixture(scope="module")
+def history():
+    # price of token0 doubles at t=1000 and gets back at t=3000
+    yield ReserveHistory.from_snapshots(
+        [(0, 10 ** 18, 10 ** 8), (1000, 10 ** 18, 2 * 10 ** 8), (3000, 10 ** 18, 10 ** 8)]
+    )
+
+
+def test_cumulative_prices(history):
+    c0, c1 = history.cumulative_prices([0, 500, 1000, 2000, 3000, 4000])
+    p = encode_price(10 ** 18, 10 ** 8)
+    p2 = encode_price(10 ** 18, 2 * 10 ** 8)
+    assert c0 == [0, 500 * p, 1000 * p, 1000 * p + 1000 * p2,
+                  1000 * p + 2000 * p2, 2000 * p + 2000 * p2]
+    assert c1[1] == 500 * encode_price(10 ** 8, 10 ** 18)
+
+
+def test_stored_cumulative_prices(history):
+    c0, _, ts = history.stored_cumulative_prices([999, 1000, 2500])
+    p = encode_price(10 ** 18, 10 ** 8)
+    assert c0 == [0, 1000 * p, 1000 * p]
+    assert ts == [0, 1000, 1000]
+
+
+def test_same_block_snapshots_collapse():
+    h = ReserveHistory.from_snapshots([(0, 1, 1), (10, 5, 5), (10, 1, 2)])
+    assert h.timestamps == [0, 10]
+    assert h.reserves1 == [1, 2]
+
+
+def test_time_before_history(history):
+    with pytest.raises(ValueError):
+        history.cumulative_prices([-1])
+
+
+def test_debounce(history):
+    ticks = list(range(100, 5000, 100))
+    result = replay(history, [300, 1000], ticks, deployed_at=50, last_called=50)
+    assert result[300].update_times == list(range(400, 5000, 300))
+    assert result[1000].update_times == [1100, 2100, 3100, 4100]
+
+
+def test_start(history):
+    result = replay(history, [100], [100, 200, 300], deployed_at=0, start=250)
+    assert result[100].update_times == [300]
+
+
+def test_averages(history):
+    result = replay(history, [2000], [0, 2000, 4000], deployed_at=0)[2000]
+    p = encode_price(10 ** 18, 10 ** 8)
+    p2 = encode_price(10 ** 18, 2 * 10 ** 8)
+    average = (1000 * p + 1000 * p2) // 2000
+    # the first update averages over `block.timestamp - 0`
+    assert result.update_times == [2000, 4000]
+    assert result.price0_averages == [average, average]
+    assert result.averages_at([1999])[0] == [0]
+    assert result.averages_at([2500])[0] == [average]
+    assert result.consult(0, 10 ** 18, [2500]) == [average * 10 ** 18 >> 112]
+
+
+def test_multiple_periods_match_single_replays(history):
+    ticks = list(range(10, 5000, 37))
+    periods = [100, 250, 999]
+    together = replay(history, periods, ticks)
+    for period in periods:
+        alone = replay(history, [period], ticks)[period]
+        assert together[period].update_times == alone.update_times
+        assert together[period].price0_averages == alone.price0_averages
+        assert together[period].price1_averages == alone.price1_averages
+
+
+def test_consult():
+    assert consult(Q112 * 3, 10) == 30
+    assert consult(Q112 // 2, 3) == 1
+    with pytest.raises(OverflowError):
+        consult(2 ** 224 - 1, 2 ** 64)
@@ -0,0 +1,99 @@
+import brownie
+import pytest
+
+WEEK = 86400 * 7
+
+
+@pytest.fixture(scope="module")
+def oracle(VeSupplyOracle, accounts, ve_token):
+    yield VeSupplyOracle.deploy(ve_token, {"from": accounts[0]})
+
+
+@pytest.fixture(scope="module")
+def rooms(accounts, chain, oracle, ve_boardroom, coin_a, coin_b, coin_c):
+    """
+    Three distributors with the same fees: the first checkpoints the supply
+    itself, the other two share the oracle.
+    """
+    rooms = [ve_boardroom() for _ in range(3)]
+    for room, coin in zip(rooms, (coin_a, coin_b, coin_c)):
+        room.add_token(coin, chain.time(), {"from": accounts[0]})
+    for room in rooms[1:]:
+        room.set_supply_oracle(oracle, {"from": accounts[0]})
+    yield rooms
+
+
+def lock(accounts, chain, ve_token, token):
+    for i in range(1, 4):
+        token.transfer(accounts[i], 10 ** 21, {"from": accounts[0]})
+        token.approve(ve_token, 2 ** 256 - 1, {"from": accounts[i]})
+        ve_token.create_lock(10 ** 20 * i, chain.time() + WEEK * (i * 2 + 1), {"from": accounts[i]})
+
+
+def test_set_supply_oracle(accounts, rooms, oracle):
+    assert rooms[1].supply_oracle() == oracle
+    assert rooms[1].supply_oracle_since() == rooms[1].time_cursor()
+    with brownie.reverts("dev: oracle already set"):
+        rooms[1].set_supply_oracle(oracle, {"from": accounts[0]})
+    with brownie.reverts("dev: access denied"):
+        rooms[0].set_supply_oracle(oracle, {"from": accounts[1]})
+
+
+def test_wrong_voting_escrow(VeSupplyOracle, accounts, rooms, token):
+    other = VeSupplyOracle.deploy(token, {"from": accounts[0]})
+    with brownie.reverts("dev: wrong voting escrow"):
+        rooms[0].set_supply_oracle(other, {"from": accounts[0]})
+
+
+def test_oracle_starts_too_late(VeSupplyOracle, accounts, chain, rooms, ve_token):
+    chain.sleep(WEEK)
+    chain.mine()
+    late = VeSupplyOracle.deploy(ve_token, {"from": accounts[0]})
+    with brownie.reverts("dev: oracle starts too late"):
+        rooms[0].set_supply_oracle(late, {"from": accounts[0]})
+
+
+def test_claims_are_identical(accounts, chain, rooms, oracle, ve_token, token, coin_a, coin_b, coin_c):
+    coins = (coin_a, coin_b, coin_c)
+    lock(accounts, chain, ve_token, token)
+    chain.mine(timestamp=(chain.time() // WEEK + 1) * WEEK + 3600)
+    for week in range(6):
+        for room, coin in zip(rooms, coins):
+            # the first checkpoint moves `last_token_time` into this week, so
+            # all fees of the second one go to this week in every distributor
+            room.checkpoint_token(coin, {"from": accounts[0]})
+            coin._mint_for_testing(10 ** 18 * (week + 1), {"from": accounts[0]})
+            coin.transfer(room, 10 ** 18 * (week + 1), {"from": accounts[0]})
+            room.checkpoint_token(coin, {"from": accounts[0]})
+        chain.sleep(WEEK)
+        chain.mine()
+        if week == 2:
+            # claims in the middle, the oracle is checkpointed by the first one
+            for acct in accounts[1:4]:
+                claimed = [room.claim(coin, {"from": acct}).return_value for room, coin in zip(rooms, coins)]
+                assert claimed[0] > 0
+                assert claimed == [claimed[0]] * 3
+
+    for room, coin in zip(rooms, coins):
+        room.checkpoint_token(coin, {"from": accounts[0]})
+    for acct in accounts[1:4]:
+        claimed = [room.claim(coin, {"from": acct}).return_value for room, coin in zip(rooms, coins)]
+        assert claimed == [claimed[0]] * 3
+    for week in range(oracle.start_time(), chain.time(), WEEK):
+        assert rooms[1].ve_supply(week) == rooms[0].ve_supply(week)
+        assert oracle.ve_supply(week) == rooms[0].ve_supply(week)
+    assert [coin.balanceOf(accounts[1]) for coin in coins] == [coin_a.balanceOf(accounts[1])] * 3
+
+
+def test_shared_checkpoint_gas(accounts, chain, rooms, oracle, ve_token, token):
+    lock(accounts, chain, ve_token, token)
+    chain.sleep(WEEK * 3)
+    chain.mine()
+
+    local = rooms[0].checkpoint_total_supply({"from": accounts[0]}).gas_used
+    first = rooms[1].checkpoint_total_supply({"from": accounts[0]}).gas_used
+    shared = rooms[2].checkpoint_total_supply({"from": accounts[0]}).gas_used
+
+    assert oracle.time_cursor() == rooms[0].time_cursor() == rooms[2].time_cursor()
+    assert shared * 3 < local
+    assert shared * 3 < first
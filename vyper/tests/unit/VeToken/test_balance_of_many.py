@@ -0,0 +1,79 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+from scripts import voting_power
+from scripts.voting_power import balances, balances_at
+
+WEEK = 86400 * 7
+
+
+@pytest.fixture(scope="module")
+def max_batch(ve_token):
+    # the length of the fixed address array, `MAX_BATCH` in VeToken.vy
+    return int(ve_token.balanceOfManyAt.abi["inputs"][0]["type"][len("address["):-1])
+
+
+def test_scripts_page_size(max_batch):
+    assert voting_power.MAX_BATCH == max_batch
+
+
+def lock_all(accounts, chain, ve_token, token):
+    blocks = []
+    for i in range(1, 6):
+        token.transfer(accounts[i], 10 ** 21, {"from": accounts[0]})
+        token.approve(ve_token, 2 ** 256 - 1, {"from": accounts[i]})
+        ve_token.create_lock(10 ** 20 * i, chain.time() + WEEK * (i + 1), {"from": accounts[i]})
+        chain.sleep(WEEK // 2)
+        chain.mine()
+        blocks.append(chain[-1].number)
+    ve_token.increase_amount(10 ** 20, {"from": accounts[5]})
+    chain.sleep(WEEK)
+    chain.mine()
+    blocks.append(chain[-1].number)
+    return blocks
+
+
+def test_balance_of_many_at(accounts, chain, ve_token, token, max_batch):
+    blocks = lock_all(accounts, chain, ve_token, token)
+    holders = list(accounts[:8])
+    padded = holders + [ZERO_ADDRESS] * (max_batch - len(holders))
+
+    for block in blocks:
+        result = ve_token.balanceOfManyAt(padded, block)
+        assert list(result[:len(holders)]) == [ve_token.balanceOfAt(h, block) for h in holders]
+        assert not any(result[len(holders):])
+
+
+def test_balance_of_many(accounts, chain, ve_token, token, max_batch):
+    lock_all(accounts, chain, ve_token, token)
+    holders = list(accounts[:8])
+    padded = holders + [ZERO_ADDRESS] * (max_batch - len(holders))
+
+    for t in (chain.time(), chain.time() + WEEK * 3, chain.time() + WEEK * 10):
+        result = ve_token.balanceOfMany(padded, t)
+        assert list(result[:len(holders)]) == [ve_token.balanceOf(h, t) for h in holders]
+
+
+def test_stops_at_zero_address(accounts, chain, ve_token, token, max_batch):
+    lock_all(accounts, chain, ve_token, token)
+    padded = [accounts[1], ZERO_ADDRESS, accounts[2]] + [ZERO_ADDRESS] * (max_batch - 3)
+
+    result = ve_token.balanceOfManyAt(padded, chain[-1].number)
+    assert result[0] > 0
+    assert result[2] == 0
+
+
+def test_future_block(accounts, chain, ve_token, max_batch):
+    with brownie.reverts():
+        ve_token.balanceOfManyAt([accounts[0]] * max_batch, chain.height + 1)
+
+
+def test_paginated(accounts, chain, ve_token, token):
+    blocks = lock_all(accounts, chain, ve_token, token)
+    holders = list(accounts[:8]) * 30  # more than one page
+
+    assert balances_at(ve_token, holders, blocks[2], page=7) == [
+        ve_token.balanceOfAt(h, blocks[2]) for h in holders
+    ]
+    assert balances(ve_token, holders) == [ve_token.balanceOf(h) for h in holders]
@@ -0,0 +1,110 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+from scripts import migrate_locks
+
+WEEK = 86400 * 7
+MAX_LOCKS = migrate_locks.MAX_LOCKS
+
+
+def pad(values, filler):
+    return list(values) + [filler] * (MAX_LOCKS - len(values))
+
+
+@pytest.fixture(scope="module")
+def ve_token_b(VeToken, accounts, token):
+    yield VeToken.deploy(
+        token, "Voting-escrowed KlonX", "veKlonX", "veKlonX", {"from": accounts[0]}
+    )
+
+
+def test_scripts_batch_size(ve_token):
+    # the length of the fixed address array, `MAX_LOCKS` in VeToken.vy
+    abi_type = ve_token.create_locks_for.abi["inputs"][0]["type"]
+    assert int(abi_type[len("address["):-1]) == MAX_LOCKS
+
+
+def locks(accounts, chain):
+    start = (chain.time() // WEEK + 1) * WEEK
+    return [(accounts[i], 10 ** 20 * i, start + WEEK * (i * 7 % 5 + 1)) for i in range(1, 8)]
+
+
+def test_same_as_create_lock(accounts, chain, token, ve_token, ve_token_b):
+    alice = accounts[0]
+    rows = locks(accounts, chain)
+    for acct, amount, unlock_time in rows:
+        token.transfer(acct, amount, {"from": alice})
+        token.approve(ve_token, amount, {"from": acct})
+        ve_token.create_lock(amount, unlock_time, {"from": acct})
+
+    holders, amounts, unlock_times = zip(*rows)
+    token.approve(ve_token_b, sum(amounts), {"from": alice})
+    ve_token_b.create_locks_for(
+        pad(holders, ZERO_ADDRESS), pad(amounts, 0), pad(unlock_times, 0), {"from": alice}
+    )
+
+    assert ve_token_b.supply() == ve_token.supply()
+    assert token.balanceOf(ve_token_b) == token.balanceOf(ve_token)
+    for acct, _, _ in rows:
+        assert ve_token_b.locked(acct) == ve_token.locked(acct)
+        assert ve_token_b.user_point_epoch(acct) == 1
+    for week in range(8):
+        t = chain.time() + week * WEEK
+        assert ve_token_b.totalSupply(t) == ve_token.totalSupply(t)
+        for acct, _, _ in rows:
+            assert ve_token_b.balanceOf(acct, t) == ve_token.balanceOf(acct, t)
+
+    # the histories stay in sync once both are checkpointed
+    chain.sleep(WEEK * 3)
+    ve_token.checkpoint({"from": alice})
+    ve_token_b.checkpoint({"from": alice})
+    assert ve_token_b.totalSupply() == ve_token.totalSupply()
+    assert ve_token_b.totalSupplyAt(chain[-1].number) > 0
+
+
+def test_one_global_checkpoint(accounts, chain, token, ve_token):
+    alice = accounts[0]
+    rows = locks(accounts, chain)
+    holders, amounts, unlock_times = zip(*rows)
+    token.approve(ve_token, sum(amounts), {"from": alice})
+    epoch = ve_token.epoch()
+
+    tx = ve_token.create_locks_for(
+        pad(holders, ZERO_ADDRESS), pad(amounts, 0), pad(unlock_times, 0), {"from": alice}
+    )
+
+    assert ve_token.epoch() == epoch + 1
+    assert len(tx.events["Deposit"]) == len(rows)
+    assert tx.events["Supply"]["supply"] == sum(amounts)
+
+
+def test_admin_only(accounts, chain, ve_token):
+    with brownie.reverts("dev: admin only"):
+        ve_token.create_locks_for(
+            pad([accounts[2]], ZERO_ADDRESS),
+            pad([10 ** 18], 0),
+            pad([chain.time() + WEEK * 4], 0),
+            {"from": accounts[1]},
+        )
+
+
+def test_existing_lock(accounts, chain, token, ve_token):
+    alice = accounts[0]
+    token.approve(ve_token, 2 ** 256 - 1, {"from": alice})
+    ve_token.create_lock(10 ** 18, chain.time() + WEEK * 4, {"from": alice})
+
+    with brownie.reverts("Withdraw old tokens first"):
+        ve_token.create_locks_for(
+            pad([accounts[1], alice], ZERO_ADDRESS),
+            pad([10 ** 18, 10 ** 18], 0),
+            pad([chain.time() + WEEK * 4] * 2, 0),
+            {"from": alice},
+        )
+    with brownie.reverts("Withdraw old tokens first"):
+        ve_token.create_locks_for(
+            pad([accounts[1], accounts[1]], ZERO_ADDRESS),
+            pad([10 ** 18, 10 ** 18], 0),
+            pad([chain.time() + WEEK * 4] * 2, 0),
+            {"from": alice},
+        )
@@ -0,0 +1,48 @@
+WEEK = 86400 * 7
+
+
+def last_epoch(points, timestamp):
+    epoch = 0
+    for i, point in enumerate(points):
+        if point[2] <= timestamp:
+            epoch = i
+    return epoch
+
+
+def make_history(accounts, chain, ve_token, token):
+    alice, bob = accounts[:2]
+    token.transfer(bob, 10 ** 21, {"from": alice})
+    for acct in (alice, bob):
+        token.approve(ve_token, 2 ** 256 - 1, {"from": acct})
+    ve_token.create_lock(10 ** 19, chain.time() + 8 * WEEK, {"from": alice})
+    for i in range(6):
+        chain.sleep(WEEK // 3)
+        if i == 1:
+            ve_token.create_lock(10 ** 19, chain.time() + 4 * WEEK, {"from": bob})
+        else:
+            ve_token.increase_amount(10 ** 18, {"from": alice})
+    chain.sleep(WEEK)
+    chain.mine()
+
+
+def test_point_at(accounts, chain, ve_token, token):
+    start = chain.time()
+    make_history(accounts, chain, ve_token, token)
+    points = [ve_token.point_history(i) for i in range(ve_token.epoch() + 1)]
+
+    for t in [0, start - 1] + [p[2] + d for p in points for d in (-1, 0, 1)]:
+        epoch = last_epoch(points, t)
+        assert ve_token.point_at(t) == (epoch,) + tuple(points[epoch])
+
+
+def test_user_point_at(accounts, chain, ve_token, token):
+    make_history(accounts, chain, ve_token, token)
+
+    for acct in accounts[:3]:
+        points = [
+            ve_token.user_point_history(acct, i)
+            for i in range(ve_token.user_point_epoch(acct) + 1)
+        ]
+        for t in [0, chain.time()] + [p[2] + d for p in points[1:] for d in (-1, 0, 1)]:
+            epoch = last_epoch(points, t)
+            assert ve_token.user_point_at(acct, t) == (epoch,) + tuple(points[epoch])